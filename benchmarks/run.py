@@ -0,0 +1,248 @@
+# probcalc - Calculate probabilities for distributions
+# Copyright (C) 2022 D. Dyson (DoctorDalek1963)
+
+# This program is licensed under GNU GPLv3, available here:
+# <https://www.gnu.org/licenses/gpl-3.0.html>
+
+"""Benchmark the hot paths of probcalc, and check them against a stored baseline.
+
+Every benchmark times one operation, like ``B(10 ** 6, 0.3).cdf(300000)``, in batches, and
+records the throughput and the 50th, 90th, and 99th percentiles of the latency per call.
+The parameters are swept from tiny to huge, so that a change which only helps or hurts
+big distributions still shows up.
+
+Run it from the root of the repo::
+
+    python benchmarks/run.py --save-baseline    # Record a baseline on this machine
+    python benchmarks/run.py                    # Compare against it, failing if anything got slower
+    python benchmarks/run.py --quick -k binomial --margin 0.5
+
+The results are written to ``benchmarks/results.json``, and the run exits with status 1
+if the median latency of any benchmark is more than ``--margin`` slower than the baseline.
+Baselines are only meaningful on the machine that recorded them.
+"""
+
+from __future__ import annotations
+
+import argparse
+import datetime
+import json
+import platform
+import statistics
+import sys
+import time
+from functools import partial
+from pathlib import Path
+from typing import Any, Callable, Iterator, NamedTuple
+
+# Benchmark the working tree, not whatever version happens to be installed
+sys.path.insert(0, str(Path(__file__).resolve().parents[1] / 'src'))
+
+import probcalc  # noqa: E402
+from probcalc import P, B, Po, N, Geo  # noqa: E402
+from probcalc.utility import round_sig_fig  # noqa: E402
+
+HERE = Path(__file__).resolve().parent
+
+BATCH_SECONDS = 0.002
+"""Each batch of calls is calibrated to take about this long, so that timer resolution doesn't matter."""
+
+
+class Benchmark(NamedTuple):
+    """A single operation to time."""
+
+    name: str
+    function: Callable[[], object]
+
+
+class Result(NamedTuple):
+    """The timings of one benchmark. Latencies are in nanoseconds per call."""
+
+    calls: int
+    throughput: float
+    p50_ns: float
+    p90_ns: float
+    p99_ns: float
+
+
+def benchmarks() -> Iterator[Benchmark]:
+    """Generate every benchmark, sweeping the parameters of each distribution."""
+    for n in [10, 100, 1000, 10 ** 4, 10 ** 5, 10 ** 6, 10 ** 7]:
+        X = B(n, 0.3)
+        k = int(n * 0.3)
+        event = k - 3 < X <= k + 3
+        P(event)
+
+        yield Benchmark(f'binomial.pmf[n={n}]', partial(X.pmf, k))
+        yield Benchmark(f'binomial.cdf[n={n}]', partial(X.cdf, k))
+        yield Benchmark(f'binomial.calculate[n={n}]', partial(X.calculate, event))
+
+    for rate in [0.1, 1, 10, 100, 1000, 10 ** 4, 10 ** 5, 10 ** 6]:
+        Y = Po(rate)
+        k = int(rate)
+        event = Y > k
+        P(event)
+
+        yield Benchmark(f'poisson.pmf[rate={rate}]', partial(Y.pmf, k))
+        yield Benchmark(f'poisson.cdf[rate={rate}]', partial(Y.cdf, k))
+        yield Benchmark(f'poisson.calculate[rate={rate}]', partial(Y.calculate, event))
+
+    Z = N(0, 1)
+    for z in [0, 2, 5, 10, 30]:
+        event = Z > z
+        P(event)
+
+        yield Benchmark(f'normal.cdf[z={z}]', partial(Z.cdf, -z))
+        yield Benchmark(f'normal.sf[z={z}]', partial(Z.sf, z))
+        yield Benchmark(f'normal.calculate[z={z}]', partial(Z.calculate, event))
+
+    for p, trials in [(0.5, 10), (0.01, 1000), (1e-4, 10 ** 5), (1e-6, 10 ** 7)]:
+        G = Geo(p)
+        event = G > trials
+        P(event)
+
+        yield Benchmark(f'geometric.pmf[p={p}]', partial(G.pmf, trials))
+        yield Benchmark(f'geometric.cdf[p={p}]', partial(G.cdf, trials))
+        yield Benchmark(f'geometric.calculate[p={p}]', partial(G.calculate, event))
+
+    X = B(20, 0.25)
+    yield Benchmark('P[binomial]', lambda: P(3 < X <= 8))
+    yield Benchmark('P[normal]', lambda: P(-1 < Z < 1))
+
+    for sig_figs in [3, 10]:
+        yield Benchmark(f'round_sig_fig[{sig_figs}]', partial(round_sig_fig, 0.0123456789, sig_figs))
+
+
+def time_benchmark(benchmark: Benchmark, batches: int) -> Result:
+    """Time a benchmark in batches, and return its throughput and latency percentiles.
+
+    :param Benchmark benchmark: The benchmark to time
+    :param int batches: How many batches to time
+    :returns Result: The timings
+    """
+    function = benchmark.function
+    function()
+
+    # Double the batch size until one batch takes long enough to time accurately
+    number = 1
+    while True:
+        start = time.perf_counter_ns()
+        for _ in range(number):
+            function()
+        elapsed = time.perf_counter_ns() - start
+
+        if elapsed >= BATCH_SECONDS * 1e9:
+            break
+
+        number *= 2
+
+    latencies = []
+    for _ in range(batches):
+        start = time.perf_counter_ns()
+        for _ in range(number):
+            function()
+        latencies.append((time.perf_counter_ns() - start) / number)
+
+    cuts = statistics.quantiles(latencies, n=100, method='inclusive')
+    total_ns = sum(latencies) * number
+
+    return Result(
+        calls=batches * number,
+        throughput=batches * number / total_ns * 1e9,
+        p50_ns=statistics.median(latencies),
+        p90_ns=cuts[89],
+        p99_ns=cuts[98]
+    )
+
+
+def compare(results: dict[str, dict[str, Any]], baseline: dict[str, dict[str, Any]], margin: float) -> list[str]:
+    """Compare the median latencies of a run against a baseline.
+
+    Benchmarks that aren't in the baseline are ignored, so adding a benchmark doesn't fail the run.
+
+    :param results: The results of this run, keyed by benchmark name
+    :param baseline: The results of the baseline run, keyed by benchmark name
+    :param float margin: How much slower a benchmark can be before it counts as a regression, as a fraction
+    :returns: A description of every regression
+    """
+    regressions = []
+
+    for name, result in results.items():
+        if name not in baseline:
+            continue
+
+        old = baseline[name]['p50_ns']
+        new = result['p50_ns']
+
+        if new > old * (1 + margin):
+            regressions.append(f'{name}: {old:.0f}ns -> {new:.0f}ns ({new / old - 1:+.0%})')
+
+    return regressions
+
+
+def main(argv: list[str] | None = None) -> int:
+    """Run the benchmarks, write the results, and compare them with the baseline.
+
+    :returns int: The exit status, which is 1 if there were any regressions
+    """
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('-k', '--filter', default='', help='only run benchmarks whose names contain this')
+    parser.add_argument('--quick', action='store_true', help='time fewer batches, for a rough check')
+    parser.add_argument('--output', type=Path, default=HERE / 'results.json', help='where to write the results')
+    parser.add_argument('--baseline', type=Path, default=HERE / 'baseline.json', help='the baseline to compare with')
+    parser.add_argument('--margin', type=float, default=0.2, help='allowed slowdown as a fraction (default 0.2)')
+    parser.add_argument('--save-baseline', action='store_true', help='also save the results as the new baseline')
+    args = parser.parse_args(argv)
+
+    batches = 20 if args.quick else 100
+    results: dict[str, dict[str, Any]] = {}
+
+    for benchmark in benchmarks():
+        if args.filter not in benchmark.name:
+            continue
+
+        result = time_benchmark(benchmark, batches)
+        results[benchmark.name] = result._asdict()
+        print(f'{benchmark.name:<36} {result.p50_ns:>12.0f}ns p50 {result.p99_ns:>12.0f}ns p99 '
+              f'{result.throughput:>14,.0f}/s')
+
+    report = {
+        'metadata': {
+            'date': datetime.datetime.now(datetime.timezone.utc).isoformat(timespec='seconds'),
+            'probcalc': probcalc.__version__,
+            'python': platform.python_version(),
+            'implementation': platform.python_implementation(),
+            'machine': platform.machine(),
+            'platform': platform.platform(),
+            'batches': batches
+        },
+        'results': results
+    }
+
+    args.output.write_text(json.dumps(report, indent=2) + '\n')
+    print(f'\nWrote results to {args.output}')
+
+    if args.save_baseline:
+        args.baseline.write_text(json.dumps(report, indent=2) + '\n')
+        print(f'Saved baseline to {args.baseline}')
+        return 0
+
+    if not args.baseline.exists():
+        print(f'No baseline at {args.baseline}, so nothing to compare with. Make one with --save-baseline')
+        return 0
+
+    regressions = compare(results, json.loads(args.baseline.read_text())['results'], args.margin)
+
+    if regressions:
+        print(f'\n{len(regressions)} benchmarks are more than {args.margin:.0%} slower than the baseline:')
+        for regression in regressions:
+            print(f'  {regression}')
+
+        return 1
+
+    print(f'No benchmarks are more than {args.margin:.0%} slower than the baseline')
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
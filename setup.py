@@ -51,6 +51,30 @@ The full docs are available [here](https://doctordalek1963.github.io/probcalc).
 ## Changelog
 
 ### [Unreleased]
+- Calculate binomial CDF with the regularized incomplete beta function and add `sf()`
+- Calculate Poisson CDF with the regularized incomplete gamma functions and add `sf()`
+- Add NumPy-vectorized `pmf_array()`, `cdf_array()`, and `sf_array()` to all distributions
+- Cache tables of binomial and Poisson CDFs in a global LRU cache with a memory budget
+- Make comparisons return immutable `Event` objects instead of mutating the distribution
+- Add `P.batch()` and `Distribution.calculate_many()` to calculate many events at once
+- Add `ppf()` and `isf()` quantile functions, and their `*_array()` versions, to all distributions
+- Add `rvs()` to generate random variates from all distributions, with `probcalc.sampling.spawn()` for parallel streams
+- Add `logpmf()`, `logcdf()`, and `logsf()` to all distributions, add `sf()` to the normal and geometric distributions, and calculate upper tail events with the survival function
+- Intern distributions, so that making one with the same parameters as an existing one returns the existing one, and precompute the logs of their parameters
+- Use `__slots__` for distributions and events to save memory
+- Add `probcalc.instrumentation` to count and time calculations, with callbacks and a Prometheus exporter
+- Add `probcalc.parallel` to calculate lots of events with a process or thread pool
+- Add `P.acalculate()` and `P.abatch()` to calculate probabilities in asyncio code without blocking the event loop
+- Import `probcalc.instrumentation` and the other optional submodules lazily, so that `import probcalc` is faster
+- Add a command line tool, `python -m probcalc`, to calculate the probabilities of a stream of queries like `B(100, 0.5): 10 < X <= 20`
+- Add `probcalc.query.prepare()` to compile queries like `P(a < B(n, p) <= b)` into prepared queries with named parameters, without `eval`
+- Add `tables.save_table()` and `tables.load_table()` to save the tables of big distributions to files and memory-map them in every process
+- Add `probcalc.combinatorics` with fast exact factorials, `choose()`, and exact rational helpers, and make `utility.factorial()`, `utility.choose()`, and `utility.factorial_fraction()` use it
+- Add sums of independent distributions with `+`, `sum()`, and `distributions.sum_iid()`, using closed forms for Poisson, equal-probability binomial, and normal distributions, and FFT convolution of PMF tables in `probcalc.convolution` otherwise
+- Add `probcalc.summation`, which sums PMFs outwards from the mode with compensated summation, stopping when the rest of each tail is provably negligible, and use it for summed CDFs and log tail probabilities
+- Add `probcalc.empirical.EmpiricalDistribution`, which stores observed samples as sorted distinct values with prefix counts so that every probability is a binary search, and can be built from a stream of chunks, optionally as a histogram with a bounded number of bins
+- Add `probcalc.estimation`, with mergeable one-pass estimators of means, variances, and proportions that make normal, Poisson, binomial, and geometric distributions from streams of data
+- Add `probcalc.hypothesis`, which finds the critical regions and actual significance levels of one and two tailed hypothesis tests with a guided binary search of the CDF, one at a time or in batches
 
 ### v0.5.0
 - Add geometric distribution
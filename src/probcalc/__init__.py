@@ -24,8 +24,20 @@ Here's a table of user-friendly aliases and the backend classes they refer to:
      - :class:`probcalc.distributions.NormalDistribution`
    * - Geo
      - :class:`probcalc.distributions.GeometricDistribution`
+
+Only the modules needed for these aliases are imported with the package, so that
+``import probcalc`` stays fast for short-lived scripts. The other submodules, like
+:mod:`probcalc.instrumentation` and :mod:`probcalc.parallel`, are imported the first time
+they're used as attributes of the package. The cached tables in :mod:`probcalc.tables` are only
+imported when the first table is needed, and NumPy only when an array is needed.
+They're left out of ``__all__``, so ``from probcalc import *`` doesn't import them either.
 """
 
+from __future__ import annotations
+
+import importlib
+from types import ModuleType
+
 from . import distribution_classes, distributions, utility
 from .distribution_classes import NonsenseError
 
@@ -38,3 +50,23 @@ Geo = distributions.GeometricDistribution
 __all__ = ['P', 'B', 'Po', 'N', 'Geo', 'NonsenseError', 'distributions', 'utility']
 
 __version__ = '0.5.0'
+
+_LAZY_SUBMODULES = frozenset({
+    'aio', 'cli', 'convolution', 'empirical', 'estimation', 'hypothesis', 'instrumentation', 'parallel', 'query',
+    'sampling', 'tables', 'vectorized'
+})
+"""The submodules that are only imported when they're first used, because most scripts never need them."""
+
+
+def __getattr__(name: str) -> ModuleType:
+    """Import a lazy submodule the first time it's used as an attribute of the package."""
+    if name in _LAZY_SUBMODULES:
+        # Importing the submodule also sets it as an attribute, so this is only called once for each
+        return importlib.import_module(f'.{name}', __name__)
+
+    raise AttributeError(f'module {__name__!r} has no attribute {name!r}')
+
+
+def __dir__() -> list[str]:
+    """List the attributes of the package, including the lazy submodules that haven't been imported yet."""
+    return sorted({*globals(), *_LAZY_SUBMODULES})
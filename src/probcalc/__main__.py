@@ -0,0 +1,13 @@
+# probcalc - Calculate probabilities for distributions
+# Copyright (C) 2022 D. Dyson (DoctorDalek1963)
+
+# This program is licensed under GNU GPLv3, available here:
+# <https://www.gnu.org/licenses/gpl-3.0.html>
+
+"""Run the command line tool in :mod:`probcalc.cli` with ``python -m probcalc``."""
+
+import sys
+
+from .cli import main
+
+sys.exit(main())
@@ -0,0 +1,152 @@
+# probcalc - Calculate probabilities for distributions
+# Copyright (C) 2022 D. Dyson (DoctorDalek1963)
+
+# This program is licensed under GNU GPLv3, available here:
+# <https://www.gnu.org/licenses/gpl-3.0.html>
+
+"""A module to calculate probabilities in :mod:`asyncio` code without blocking the event loop.
+
+This is used by :meth:`probcalc.distribution_classes.ProbabilityCalculator.acalculate` and
+:meth:`probcalc.distribution_classes.ProbabilityCalculator.abatch`, which are the easiest way to use it.
+
+Events that are quick to calculate, like anything with a normal or geometric distribution,
+or a binomial or Poisson distribution whose table is small or already cached, are calculated
+straight away in the event loop, because handing them to an executor would take longer than
+calculating them. Everything else is calculated in an executor, which is the default executor
+of the event loop unless another one is given. A :class:`concurrent.futures.ProcessPoolExecutor`
+works as well, and it doesn't hold the GIL while it calculates.
+
+If the same event is already being calculated in an executor, we wait for that calculation rather
+than starting another one. Cancelling a call, or letting it time out, never cancels the calculation
+for anyone else who's waiting for it, but if nobody is waiting for it any more, it's cancelled if
+it hasn't started yet.
+
+:Example:
+
+>>> import asyncio
+>>> from probcalc import P, B, N
+>>> async def main():
+...     return await asyncio.gather(P.acalculate(B(10 ** 6, 0.4) <= 400500), P.acalculate(N(0, 1) < 1))
+>>> asyncio.run(main())
+[0.8465239561, 0.8413447461]
+"""
+
+from __future__ import annotations
+
+import asyncio
+import concurrent.futures
+import weakref
+from typing import Any, Callable, Iterable
+
+from .distribution_classes import Event, _Bounds
+
+
+class _Shared:
+    """A calculation in an executor, with the number of calls that are waiting for it."""
+
+    __slots__ = ('future', 'waiters')
+
+    def __init__(self, future: asyncio.Future[float]):
+        """Wrap a future with no waiters yet."""
+        self.future = future
+        self.waiters = 0
+
+
+_in_flight: weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, dict[Event, _Shared]] = weakref.WeakKeyDictionary()
+"""The calculations that are running in each event loop, so that identical events can share them."""
+
+
+def _calculate_encoded(
+    cls: Callable[..., Any],
+    parameters: tuple[Any, ...],
+    lower: tuple[Any, bool],
+    upper: tuple[Any, bool],
+    negated: bool
+) -> float:
+    """Rebuild an event in a worker process and calculate its probability."""
+    return Event(cls(*parameters), _Bounds(lower, upper), negated).calculate(strict=True)
+
+
+def _submit(event: Event, executor: concurrent.futures.Executor | None) -> asyncio.Future[float]:
+    """Start calculating the event in the executor, and return an asyncio future for it."""
+    loop = asyncio.get_running_loop()
+
+    if isinstance(executor, concurrent.futures.ProcessPoolExecutor):
+        distribution = event.distribution
+        return loop.run_in_executor(
+            executor,
+            _calculate_encoded,
+            distribution.__class__,
+            distribution.parameters,
+            event.bounds.lower,
+            event.bounds.upper,
+            event.negated
+        )
+
+    return loop.run_in_executor(executor, lambda: event.calculate(strict=True))
+
+
+async def calculate(
+    event: Event,
+    *,
+    timeout: float | None = None,
+    executor: concurrent.futures.Executor | None = None
+) -> float:
+    """Return the probability of the event, without rounding, calculating it in an executor if it's slow.
+
+    :param Event event: The event
+    :param timeout: The number of seconds to wait for the probability, or None to wait forever
+    :param executor: The executor to use, or None for the default executor of the event loop
+    :returns float: The probability
+
+    :raises NonsenseError: If the bounds of the event are invalid
+    :raises asyncio.TimeoutError: If the timeout runs out first
+    """
+    if event.distribution._is_cheap(event):
+        return event.calculate(strict=True)
+
+    in_flight = _in_flight.setdefault(asyncio.get_running_loop(), {})
+    shared = in_flight.get(event)
+
+    if shared is None:
+        shared = in_flight[event] = _Shared(_submit(event, executor))
+
+        def forget(_: object, shared: _Shared = shared) -> None:
+            if in_flight.get(event) is shared:
+                del in_flight[event]
+
+        shared.future.add_done_callback(forget)
+
+    shared.waiters += 1
+
+    try:
+        # The shield stops a timeout or cancellation of this call from cancelling the other waiters
+        return await asyncio.wait_for(asyncio.shield(shared.future), timeout)
+
+    finally:
+        shared.waiters -= 1
+
+        if shared.waiters == 0 and not shared.future.done():
+            shared.future.cancel()
+
+
+async def batch(
+    events: Iterable[Event],
+    *,
+    timeout: float | None = None,
+    executor: concurrent.futures.Executor | None = None
+) -> list[float]:
+    """Return the probabilities of the events, without rounding, calculating them concurrently.
+
+    Identical events are only calculated once.
+
+    :param events: The events
+    :param timeout: The number of seconds to wait for every probability, or None to wait forever
+    :param executor: The executor to use, or None for the default executor of the event loop
+    :returns: The probabilities, in the same order as the events
+
+    :raises NonsenseError: If the bounds of any event are invalid
+    :raises asyncio.TimeoutError: If the timeout runs out first
+    """
+    calculations = asyncio.gather(*(calculate(event, executor=executor) for event in events))
+    return await asyncio.wait_for(calculations, timeout)
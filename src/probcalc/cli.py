@@ -0,0 +1,224 @@
+# probcalc - Calculate probabilities for distributions
+# Copyright (C) 2022 D. Dyson (DoctorDalek1963)
+
+# This program is licensed under GNU GPLv3, available here:
+# <https://www.gnu.org/licenses/gpl-3.0.html>
+
+"""A command line tool to calculate the probabilities of lots of queries, one per line.
+
+This is what runs with ``python -m probcalc``. Each line of the input is a distribution,
+a colon, and an event, written just like they would be in Python::
+
+    B(100, 0.5): 10 < X <= 20
+    Po(5): X > 10
+    N(0, 1): -1.96 <= Z <= 1.96
+    Geo(0.2): X == 3
+
+The name of the random variable doesn't matter, and a line with just a distribution covers every value.
+Blank lines and lines starting with ``#`` are skipped.
+
+The results are written as CSV (the default) or as JSON lines, in the same order as the queries,
+and rounded like ``P()`` rounds them. A query that can't be parsed or calculated gets an error
+instead of a probability, and the exit status is 1, but the other queries are still calculated.
+
+The input is read a window of lines at a time, so memory use is bounded however big the input is.
+The queries in each window are grouped by distribution and calculated with ``P.batch()``, so each
+distribution only evaluates its CDF once at each distinct bound. Parsing each distinct distribution
+is also cached, so a stream of queries about a few distributions only parses each of them once.
+
+:Example:
+
+>>> from probcalc import cli
+>>> cli.parse_query('B(20, 0.5): 4 < X <= 12')
+<Event 4 < B(20, 0.5) <= 12>
+"""
+
+from __future__ import annotations
+
+import argparse
+import csv
+import functools
+import itertools
+import json
+import re
+import sys
+from typing import Iterable, Iterator, TextIO
+
+from .distribution_classes import Distribution, Event, NonsenseError, ProbabilityCalculator
+from .query import DISTRIBUTIONS, prepare
+
+_VARIABLE_RE = re.compile(r'(?<![\w.])[A-Za-z_]\w*')
+"""The name of the random variable in an event, which can't be the exponent of a number like ``1.5e0``."""
+
+
+@functools.lru_cache(maxsize=1024)
+def parse_distribution(text: str) -> Distribution:
+    """Parse a distribution like ``B(100, 0.5)``, with :func:`probcalc.query.prepare`.
+
+    The results are cached, so parsing the same text again is just a dictionary lookup.
+
+    :param str text: The distribution, written like it would be in Python
+    :returns Distribution: The distribution
+
+    :raises ValueError: If the text isn't a distribution
+    :raises NonsenseError: If the parameters don't make sense for the distribution
+    """
+    event = _prepared_event(text)
+
+    if not event.bounds.is_default:
+        raise ValueError(f'Expected a distribution out of {", ".join(DISTRIBUTIONS)}, not {text.strip()!r}')
+
+    return event.distribution
+
+
+def _prepared_event(source: str) -> Event:
+    """Return the event of a query without parameters, with :func:`probcalc.query.prepare`.
+
+    :raises ValueError: If the query can't be parsed, or has parameters, or a distribution has the wrong
+        number of parameters
+    :raises NonsenseError: If the distribution or event doesn't make sense
+    """
+    prepared = prepare(source)
+
+    if prepared.parameters:
+        raise ValueError(f'Unexpected names {", ".join(prepared.parameters)}: {source.strip()!r}')
+
+    try:
+        return prepared.event()
+    except TypeError as e:
+        raise ValueError(f'Wrong number of parameters: {source.strip()!r}') from e
+
+
+def parse_query(line: str) -> Event:
+    """Parse a query like ``B(100, 0.5): 10 < X <= 20`` into an event.
+
+    The random variable in the event is replaced by the distribution, so that the event can be
+    parsed by :func:`probcalc.query.prepare`, just like the queries in :mod:`probcalc.query`.
+
+    :param str line: The query, which is a distribution and, optionally, a colon and an event
+    :returns Event: The event
+
+    :raises ValueError: If the query can't be parsed
+    :raises NonsenseError: If the distribution or event doesn't make sense
+    """
+    spec, colon, event_text = line.partition(':')
+
+    if not colon or not event_text.strip():
+        return Event(parse_distribution(spec.strip()))
+
+    variables = _VARIABLE_RE.findall(event_text)
+
+    if len(variables) != 1:
+        raise ValueError(f'Expected a comparison like 10 < X <= 20, not {event_text.strip()!r}')
+
+    event = _prepared_event(_VARIABLE_RE.sub(lambda _: spec.strip(), event_text))
+
+    if event.bounds.is_default:
+        raise ValueError(f'Expected a comparison like 10 < X <= 20, not {event_text.strip()!r}')
+
+    return event
+
+
+def evaluate(lines: Iterable[str], calculator: ProbabilityCalculator) -> Iterator[tuple[str, float | None, str]]:
+    """Calculate the probability of every query in one window of lines.
+
+    :param lines: The queries
+    :param ProbabilityCalculator calculator: The calculator, which decides the rounding
+    :returns: A generator of the query, its probability or None, and an error message or an empty string
+    """
+    parsed: list[tuple[str, Event | None, str]] = []
+
+    for line in lines:
+        query = line.strip()
+
+        try:
+            parsed.append((query, parse_query(query), ''))
+        except (ValueError, NonsenseError) as e:
+            parsed.append((query, None, str(e)))
+
+    events = [event for _, event, _ in parsed if event is not None]
+
+    try:
+        probabilities = iter(calculator.batch(events))
+
+    except NonsenseError:
+        # Something in the window is invalid, so calculate each event on its own to find out which
+        for query, event, error in parsed:
+            if event is None:
+                yield query, None, error
+                continue
+
+            try:
+                yield query, calculator(event), ''
+            except NonsenseError as e:
+                yield query, None, str(e)
+
+        return
+
+    for query, event, error in parsed:
+        yield query, None if event is None else next(probabilities), error
+
+
+def _queries(file: TextIO) -> Iterator[str]:
+    """Generate the queries in a file, skipping blank lines and comments."""
+    for line in file:
+        if line.strip() and not line.lstrip().startswith('#'):
+            yield line
+
+
+def main(argv: list[str] | None = None) -> int:
+    """Calculate the probability of every query in the input, and write the results.
+
+    :returns int: The exit status, which is 1 if any query had an error
+    """
+    parser = argparse.ArgumentParser(
+        prog='python -m probcalc',
+        description='Calculate the probabilities of queries like "B(100, 0.5): 10 < X <= 20", one per line.'
+    )
+    parser.add_argument(
+        'input', nargs='?', type=argparse.FileType(), default='-', help='the file of queries (default: stdin)'
+    )
+    parser.add_argument('-f', '--format', choices=['csv', 'jsonl'], default='csv', help='the output format')
+    parser.add_argument('-w', '--window', type=int, default=1000, help='how many queries to calculate at once')
+    parser.add_argument('-s', '--sig-figs', type=int, default=10, help='the number of significant figures')
+    args = parser.parse_args(argv)
+
+    if args.window <= 0:
+        parser.error(f'window must be positive, not {args.window}')
+
+    calculator = ProbabilityCalculator()
+
+    try:
+        calculator.set_sig_figs(args.sig_figs)
+    except ValueError as e:
+        parser.error(str(e))
+
+    output = sys.stdout
+    writer = csv.writer(output, lineterminator='\n')
+    failed = False
+
+    if args.format == 'csv':
+        writer.writerow(['query', 'probability', 'error'])
+
+    queries = _queries(args.input)
+
+    try:
+        while window := list(itertools.islice(queries, args.window)):
+            for query, probability, error in evaluate(window, calculator):
+                failed = failed or bool(error)
+
+                if args.format == 'csv':
+                    writer.writerow([query, '' if probability is None else repr(probability), error])
+                elif error:
+                    output.write(json.dumps({'query': query, 'error': error}) + '\n')
+                else:
+                    output.write(json.dumps({'query': query, 'probability': probability}) + '\n')
+
+            # Flush each window, so that whatever reads the output can start on it straight away
+            output.flush()
+
+    finally:
+        if args.input is not sys.stdin:
+            args.input.close()
+
+    return 1 if failed else 0
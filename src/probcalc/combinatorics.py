@@ -0,0 +1,212 @@
+# probcalc - Calculate probabilities for distributions
+# Copyright (C) 2022 D. Dyson (DoctorDalek1963)
+
+# This program is licensed under GNU GPLv3, available here:
+# <https://www.gnu.org/licenses/gpl-3.0.html>
+
+r"""A module of fast, exact combinatorics, for checking probabilities with exact arithmetic.
+
+The big integer work is done by :func:`math.factorial`, which uses a divide-and-conquer
+(binary splitting) algorithm on the odd part of the factorial, and :func:`math.comb` and
+:func:`math.perm`, which multiply only the terms that don't cancel and use the symmetry
+:math:`\binom{n}{r} = \binom{n}{n - r}`. They're written in C, so they're much faster
+than anything we could write in Python.
+
+The factorials and log factorials of small numbers are memoized in tables, which grow
+as they're needed up to :data:`MEMO_LIMIT` entries, so they can't grow without bound.
+
+The exact helpers return :class:`fractions.Fraction` objects, so that probabilities can be
+checked without any rounding at all.
+
+:Example:
+
+>>> from probcalc import combinatorics
+>>> combinatorics.choose(10, 3)
+120
+>>> combinatorics.factorial_ratio(10, 7)
+Fraction(720, 1)
+>>> combinatorics.binomial_probability(4, 2, '1/2')
+Fraction(3, 8)
+"""
+
+from __future__ import annotations
+
+import math
+import threading
+from typing import TYPE_CHECKING, Union
+
+if TYPE_CHECKING:
+    from fractions import Fraction
+
+_Rational = Union[int, float, str, 'Fraction']
+"""Anything that :class:`fractions.Fraction` can convert exactly, like ``0.25``, ``'1/3'``, or ``Fraction(1, 3)``."""
+
+MEMO_LIMIT = 1024
+"""The memoized tables only hold factorials and log factorials of numbers below this."""
+
+_SMALLEST_ZERO_FACTORIAL_FRACTION = 178
+"""The smallest ``n`` for which ``1 / n!`` rounds to 0 as a float."""
+
+_factorials = [1]
+_log_factorials = [0.0]
+_lock = threading.Lock()
+
+
+def _check_natural(n: int, name: str = 'n') -> None:
+    """Check that ``n`` is a non-negative integer.
+
+    :raises TypeError: If ``n`` isn't an integer
+    :raises ValueError: If ``n`` is negative
+    """
+    if not isinstance(n, int):
+        raise TypeError(f'{name} must be an integer, not {n!r}')
+
+    if n < 0:
+        raise ValueError(f'{name} must be non-negative, not {n}')
+
+
+def _grow(n: int) -> None:
+    """Grow the memoized tables to include ``n``, which must be below :data:`MEMO_LIMIT`."""
+    with _lock:
+        while len(_factorials) <= n:
+            value = _factorials[-1] * len(_factorials)
+            _factorials.append(value)
+            _log_factorials.append(math.log(value))
+
+
+def factorial(n: int) -> int:
+    """Return the factorial of ``n``.
+
+    :raises TypeError: If ``n`` isn't an integer
+    :raises ValueError: If ``n`` is negative
+    """
+    _check_natural(n)
+
+    if n < MEMO_LIMIT:
+        if n >= len(_factorials):
+            _grow(n)
+
+        return _factorials[n]
+
+    return math.factorial(n)
+
+
+def log_factorial(n: int) -> float:
+    """Return the natural log of the factorial of ``n``, as accurately as a float can hold it.
+
+    :raises TypeError: If ``n`` isn't an integer
+    :raises ValueError: If ``n`` is negative
+    """
+    _check_natural(n)
+
+    if n < MEMO_LIMIT:
+        if n >= len(_log_factorials):
+            _grow(n)
+
+        return _log_factorials[n]
+
+    return math.lgamma(n + 1)
+
+
+def factorial_fraction(n: int) -> float:
+    """Return ``1 / factorial(n)``, correctly rounded, without overflowing.
+
+    :raises TypeError: If ``n`` isn't an integer
+    :raises ValueError: If ``n`` is negative
+    """
+    _check_natural(n)
+
+    if n >= _SMALLEST_ZERO_FACTORIAL_FRACTION:
+        return 0.0
+
+    # Dividing ints gives the correctly rounded float, even when the denominator is too big for a float
+    return 1 / factorial(n)
+
+
+def choose(n: int, r: int) -> int:
+    r"""Return the number of ways to choose ``r`` items from ``n`` elements.
+
+    This is often written as :math:`\binom{n}{r}` or :math:`^nC_r`.
+
+    :param int n: The number of items to choose from
+    :param int r: The number of items to be chosen
+    :returns int: The number of ways to choose ``r`` from ``n``
+
+    :raises ValueError: If ``r > n``, or either is negative
+    """
+    if r > n:
+        raise ValueError(f'Cannot choose {r} items from only {n} elements')
+
+    return math.comb(n, r)
+
+
+def log_choose(n: int, r: int) -> float:
+    """Return the natural log of :func:`choose`, without computing the whole number for big ``n``.
+
+    :raises ValueError: If ``r > n``, or either is negative
+    """
+    if r > n:
+        raise ValueError(f'Cannot choose {r} items from only {n} elements')
+
+    if n < MEMO_LIMIT:
+        return math.log(choose(n, r))
+
+    return log_factorial(n) - log_factorial(r) - log_factorial(n - r)
+
+
+def multinomial(*counts: int) -> int:
+    """Return the number of ways to split ``sum(counts)`` items into groups of the given sizes.
+
+    :raises ValueError: If any count is negative
+    """
+    result = 1
+    total = 0
+
+    for count in counts:
+        _check_natural(count, 'count')
+        total += count
+        result *= math.comb(total, count)
+
+    return result
+
+
+def factorial_ratio(n: int, m: int) -> Fraction:
+    """Return ``factorial(n) / factorial(m)`` exactly, only multiplying the terms that don't cancel.
+
+    :raises TypeError: If ``n`` or ``m`` isn't an integer
+    :raises ValueError: If ``n`` or ``m`` is negative
+    """
+    from fractions import Fraction
+
+    _check_natural(n, 'n')
+    _check_natural(m, 'm')
+
+    if n >= m:
+        return Fraction(math.perm(n, n - m))
+
+    return Fraction(1, math.perm(m, m - n))
+
+
+def binomial_probability(n: int, k: int, p: _Rational) -> Fraction:
+    r"""Return the exact probability of ``k`` successes in ``n`` trials, :math:`\binom{n}{k} p^k (1 - p)^{n - k}`.
+
+    A float ``p`` is converted to the exact value of the float, so pass a string
+    like ``'0.1'`` or a :class:`fractions.Fraction` to get the exact decimal value.
+
+    :param int n: The number of trials
+    :param int k: The number of successes
+    :param p: The probability of success for each trial
+    :returns Fraction: The exact probability
+
+    :raises ValueError: If ``p`` isn't between 0 and 1, or ``k`` isn't between 0 and ``n``
+    """
+    from fractions import Fraction
+
+    probability = Fraction(p)
+
+    if not 0 <= probability <= 1:
+        raise ValueError(f'Probability must be between 0 and 1, not {p}')
+
+    _check_natural(k, 'k')
+
+    return choose(n, k) * probability ** k * (1 - probability) ** (n - k)
@@ -0,0 +1,152 @@
+# probcalc - Calculate probabilities for distributions
+# Copyright (C) 2022 D. Dyson (DoctorDalek1963)
+
+# This program is licensed under GNU GPLv3, available here:
+# <https://www.gnu.org/licenses/gpl-3.0.html>
+
+r"""A module to find the PMF of a sum of independent discrete random variables by convolving their PMFs.
+
+This is what builds the table of a :class:`probcalc.distributions.SumDistribution`. Each PMF is a
+window of consecutive integers, like the windows of :class:`probcalc.tables.PMFTable`, so the window
+of a sum starts at the sum of the starts, and its values are the convolution of the values.
+
+Short windows are convolved directly with :func:`numpy.convolve`, and long ones with a real FFT, which
+takes :math:`O(n \log n)` time rather than :math:`O(n^2)`. The FFT spreads rounding error of about
+machine epsilon times the biggest value over every value, so anything smaller than that is set to 0.
+A sum of ``n`` copies of the same distribution is found by repeated squaring, so it only takes about
+:math:`\log_2 n` convolutions. Negligible values are trimmed from both ends of the window after every
+convolution, so the windows only grow like the standard deviation of the sum.
+
+If NumPy isn't installed, the windows are convolved directly in pure Python, which is much slower.
+
+:Example:
+
+>>> from probcalc import convolution
+>>> start, pmf = convolution.convolve([(0, [0.5, 0.5], 3)])
+>>> start, list(pmf)
+(0, [0.125, 0.375, 0.375, 0.125])
+"""
+
+from __future__ import annotations
+
+from array import array
+from typing import TYPE_CHECKING, Any, Callable, Iterable, Sequence, Tuple
+
+from .tables import NEGLIGIBLE
+
+if TYPE_CHECKING:
+    from .vectorized import FloatArray
+
+_Window = Tuple[int, Any]
+"""The first value of a window and its PMF values, as a list without NumPy, or an array with it."""
+
+DIRECT_LIMIT = 1 << 20
+"""Windows are convolved directly, rather than with an FFT, when the product of their lengths is at most this."""
+
+_FFT_NOISE = 1e-14
+"""After an FFT, values smaller than this fraction of the biggest value are rounding error, so they're set to 0."""
+
+
+def _trim(start: int, values: Any) -> _Window:
+    """Remove the negligible values from both ends of a window, keeping at least one value."""
+    first = 0
+    last = len(values) - 1
+
+    while first < last and values[first] < NEGLIGIBLE:
+        first += 1
+
+    while last > first and values[last] < NEGLIGIBLE:
+        last -= 1
+
+    return start + first, values[first:last + 1]
+
+
+def _direct(first: Sequence[float], second: Sequence[float]) -> list[float]:
+    """Convolve two sequences in pure Python, for when NumPy isn't installed."""
+    result = [0.0] * (len(first) + len(second) - 1)
+
+    for i, a in enumerate(first):
+        if a != 0:
+            for j, b in enumerate(second):
+                result[i + j] += a * b
+
+    return result
+
+
+def _numpy(first: FloatArray, second: FloatArray) -> FloatArray:
+    """Convolve two arrays with NumPy, directly if they're short, or with an FFT otherwise."""
+    import numpy as np
+
+    if len(first) * len(second) <= DIRECT_LIMIT:
+        return np.convolve(first, second)
+
+    size = len(first) + len(second) - 1
+    length = 1 << (size - 1).bit_length()
+
+    result: FloatArray = np.fft.irfft(np.fft.rfft(first, length) * np.fft.rfft(second, length), length)[:size]
+
+    # This also clears the negative values, which are always rounding error
+    result[result < result.max() * _FFT_NOISE] = 0.0
+    return result
+
+
+def _power(window: _Window, n: int, multiply: Callable[[_Window, _Window], _Window]) -> _Window:
+    """Return the window of the sum of ``n`` copies of a window, by repeated squaring."""
+    result: _Window | None = None
+
+    while True:
+        if n & 1:
+            result = window if result is None else multiply(result, window)
+
+        n >>= 1
+
+        if n == 0:
+            # n is at least 1, so some power of the window has been multiplied in
+            assert result is not None
+            return result
+
+        window = multiply(window, window)
+
+
+def convolve(terms: Iterable[tuple[int, Sequence[float], int]]) -> tuple[int, array[float]]:
+    """Return the PMF of a sum of independent discrete random variables, given the PMF of each one.
+
+    :param terms: For each distinct random variable in the sum, the first value of its PMF window,
+        the PMF values in the window, and how many independent copies of it are in the sum
+    :returns: The first value of the window of the sum, and the PMF values in the window
+    """
+    try:
+        import numpy as np
+    except ImportError:
+        convolve_values: Callable[[Any, Any], Any] = _direct
+
+        def as_values(values: Sequence[float]) -> Any:
+            return list(values)
+
+        def as_array(values: Any) -> array[float]:
+            return array('d', values)
+
+    else:
+        convolve_values = _numpy
+
+        def as_values(values: Sequence[float]) -> Any:
+            return np.asarray(values, dtype=np.float64)
+
+        def as_array(values: Any) -> array[float]:
+            result = array('d')
+            result.frombytes(np.ascontiguousarray(values).tobytes())
+            return result
+
+    def multiply(first: _Window, second: _Window) -> _Window:
+        return _trim(first[0] + second[0], convolve_values(first[1], second[1]))
+
+    total: _Window | None = None
+
+    for start, values, count in terms:
+        window = _power((start, as_values(values)), count, multiply)
+        total = window if total is None else multiply(total, window)
+
+    if total is None:
+        raise ValueError('Cannot convolve an empty sum')
+
+    return total[0], as_array(total[1])
@@ -9,9 +9,28 @@
 from __future__ import annotations
 
 import abc
-
+import math
+import sys
+import threading
+import weakref
+from collections import deque
+from types import CodeType
+from typing import TYPE_CHECKING, Any, Callable, Iterable, Literal
+
+from . import summation
 from .utility import round_sig_fig
 
+if TYPE_CHECKING:
+    import concurrent.futures
+
+    import numpy.typing as npt
+
+    import numpy as np
+
+    from .sampling import IntArray, Seed
+    from .tables import PMFTable
+    from .vectorized import BoolArray, FloatArray
+
 
 class NonsenseError(Exception):
     """A simple error representing mathematical nonsense.
@@ -20,8 +39,19 @@ class NonsenseError(Exception):
     """
 
 
+def _log(x: float) -> float:
+    """Return the natural log of ``x``, or negative infinity if ``x`` is 0."""
+    return math.log(x) if x > 0 else -math.inf
+
+
+_NO_BOUND: tuple[int | None, bool] = (None, False)
+"""The default value of each bound of a :class:`_Bounds` object."""
+
+
 class _Bounds:
-    """This is a simple little class to hold bounds for a :class:`Distribution` object."""
+    """This is a simple little immutable class to hold the bounds of an :class:`Event`."""
+
+    __slots__ = ('lower', 'upper')
 
     lower: tuple[int | None, bool]
     """The lower of the two bounds.
@@ -45,16 +75,20 @@ class _Bounds:
     in probability calculations or not.
     """
 
-    def __init__(self):
-        """Create a :class:`_Bounds` object with default bounds.
+    def __init__(self, lower: tuple[int | None, bool] = _NO_BOUND, upper: tuple[int | None, bool] = _NO_BOUND):
+        """Create a :class:`_Bounds` object, with default bounds unless given.
 
         These default bounds are ``(None, False)``, meaning everything up to but
         not including the natural bounds of the distribution. We don't include it,
         because evaluating probability at something like infinity might not make
         sense all the time.
         """
-        self.lower = (None, False)
-        self.upper = (None, False)
+        object.__setattr__(self, 'lower', lower)
+        object.__setattr__(self, 'upper', upper)
+
+    def __setattr__(self, name: str, value: object) -> None:
+        """Stop the bounds from being changed, since they can be shared between events."""
+        raise AttributeError(f'{self.__class__.__name__} objects are immutable')
 
     def __repr__(self) -> str:
         """Return a simple repr of the object, containing the value of the lower and upper bounds."""
@@ -63,23 +97,338 @@ class _Bounds:
     def __eq__(self, other):
         """Check equality.
 
-        This dunder method has been implemented purely to allow distributions to throw
-        errors when users attempt to combine inequality and equality logic operators.
-        To check against that, though, we need to be able to check :class:`_Bounds` equality.
+        This lets distributions throw errors when users attempt to combine inequality and
+        equality logic operators. To check against that, we need to be able to check
+        :class:`_Bounds` equality.
         """
         if not isinstance(other, _Bounds):
             return NotImplemented
 
         return self.lower == other.lower and self.upper == other.upper
 
+    def __hash__(self) -> int:
+        """Hash the bounds, so that equal bounds have equal hashes."""
+        return hash((self.lower, self.upper))
+
+    @property
+    def is_default(self) -> bool:
+        """Whether both bounds are the defaults, which is checked without making a new :class:`_Bounds` object."""
+        return self.lower == _NO_BOUND and self.upper == _NO_BOUND
+
+
+_DEFAULT_BOUNDS = _Bounds()
+"""The default bounds, which are shared by every event that has them."""
+
+
+class Event:
+    """An immutable event, made by comparing a :class:`Distribution` with a value.
+
+    An event holds a reference to its distribution, the bounds of the values it covers,
+    and whether it's negated (for the ``!=`` operator). Calculating its probability never
+    changes the distribution, so distributions can be shared between threads.
+
+    :Example:
+
+    >>> from probcalc import P, B
+    >>> X = B(20, 0.5)
+    >>> event = 4 < X <= 12
+    >>> event
+    <Event 4 < B(20, 0.5) <= 12>
+    >>> P(event)
+    0.8625030518
+
+    .. note::
+       Python evaluates ``4 < X <= 12`` as ``(4 < X) and (X <= 12)``, so :meth:`Distribution.__le__`
+       doesn't get the event from ``4 < X`` as an argument. Instead, the comparisons look at the code that
+       called them, and when they're the first and second halves of one chained comparison in the source,
+       the second builds on the first (see :func:`_chain_partners`). Separate comparisons, like
+       ``[X <= 5, X > 5]``, or ``X > 5`` followed by ``if event:`` and ``X < 10``, always make separate events.
+       Events are never changed, and converting them to bools does nothing, so they can be shared freely.
+    """
+
+    distribution: Distribution
+    """The distribution that this event is about."""
+
+    bounds: _Bounds
+    """The bounds of the values covered by this event."""
+
+    negated: bool
+    """Whether this event is actually everything except its bounds, which is used by the ``!=`` operator."""
+
+    __slots__ = ('distribution', 'bounds', 'negated')
+
+    def __init__(self, distribution: Distribution, bounds: _Bounds = _DEFAULT_BOUNDS, negated: bool = False):
+        """Create an event from a distribution, some bounds, and a negation flag.
+
+        With the default bounds, the event covers every possible value, so its probability is 1.
+        """
+        object.__setattr__(self, 'distribution', distribution)
+        object.__setattr__(self, 'bounds', bounds)
+        object.__setattr__(self, 'negated', negated)
+
+    def __setattr__(self, name: str, value: object) -> None:
+        """Stop the event from being changed."""
+        raise AttributeError(f'{self.__class__.__name__} objects are immutable')
+
+    def __repr__(self) -> str:
+        """Return a repr of the event, which looks like the comparison that made it."""
+        lower, upper = self.bounds.lower, self.bounds.upper
+
+        if lower[0] is not None and lower == upper and lower[1]:
+            text = f'{self.distribution!r} {"!=" if self.negated else "=="} {lower[0]}'
+        else:
+            text = repr(self.distribution)
+
+            if lower[0] is not None:
+                text = f'{lower[0]} {"<=" if lower[1] else "<"} {text}'
+
+            if upper[0] is not None:
+                text = f'{text} {"<=" if upper[1] else "<"} {upper[0]}'
+
+            if self.negated:
+                text = f'not {text}'
+
+        return f'<{self.__class__.__name__} {text}>'
+
+    def __eq__(self, other):
+        """Check if two events are about the same distribution object with the same bounds and negation."""
+        if not isinstance(other, Event):
+            return NotImplemented
+
+        return self.distribution is other.distribution and self.bounds == other.bounds and \
+            self.negated == other.negated
+
+    def __hash__(self) -> int:
+        """Hash the event, so that equal events have equal hashes."""
+        return hash((id(self.distribution), self.bounds, self.negated))
+
+    def with_lower(self, lower: tuple[int | None, bool]) -> Event:
+        """Return a copy of this event with a new lower bound."""
+        return Event(self.distribution, _Bounds(lower, self.bounds.upper), self.negated)
+
+    def with_upper(self, upper: tuple[int | None, bool]) -> Event:
+        """Return a copy of this event with a new upper bound."""
+        return Event(self.distribution, _Bounds(self.bounds.lower, upper), self.negated)
+
+    def calculate(self, *, strict: bool = True) -> float:
+        """Return the probability of this event, without rounding.
+
+        This just calls :meth:`Distribution.calculate`.
+
+        :param bool strict: Whether to raise errors or just ignore them
+        :returns float: The calculated probability
+        """
+        return self.distribution.calculate(self, strict=strict)
+
+
+_MAX_CHAIN_LINKS = 64
+"""How many first halves of chained comparisons each thread remembers.
+
+A first half is forgotten as soon as the second half builds on it, so this only limits the ones left
+behind when something goes wrong in between, like an exception, or a chain like ``X == 3 > 10``.
+"""
+
+
+class _ChainLinks(threading.local):
+    """The first halves of the chained comparisons being evaluated in each thread (see :func:`_chain_partners`)."""
+
+    links: dict[tuple[int, int], tuple[CodeType, Event]]
+    """The first halves, by the ID of the frame evaluating them and the offset of the comparison after them."""
+
+    def __init__(self) -> None:
+        """Start with no chained comparisons in this thread."""
+        self.links = {}
+
+
+_chain_links = _ChainLinks()
+
+
+_MAX_CHAIN_CODES = 256
+"""How many code objects have their chained comparisons cached by :func:`_chain_partners`."""
+
+_chain_codes: dict[int, tuple[CodeType, dict[int, int]]] = {}
+"""The chained comparisons in the code objects that have made comparisons recently, by the IDs of the code objects.
+
+Hashing a code object hashes all of its constants, so this is looked up by ID, and the code object is kept to check it.
+"""
+
+
+def _chain_partners(code: CodeType) -> dict[int, int]:
+    """Return the chained comparisons in a code object, which are found by :func:`_find_chain_partners` and cached.
+
+    :param CodeType code: The code object to look in
+    :returns: A dictionary from the offset of each comparison that's followed by another one in the same
+        chain, to the offset of that next comparison
+    """
+    cached = _chain_codes.get(id(code))
+
+    if cached is not None and cached[0] is code:
+        return cached[1]
+
+    partners = _find_chain_partners(code)
+
+    if len(_chain_codes) >= _MAX_CHAIN_CODES:
+        # Clearing is atomic, so this is safe with other threads
+        _chain_codes.clear()
+
+    _chain_codes[id(code)] = (code, partners)
+    return partners
+
+
+def _find_chain_partners(code: CodeType) -> dict[int, int]:
+    """Find the chained comparisons in a code object, like ``4 < X <= 12``.
+
+    In Python 3.11 and later, every comparison in a chain has the source position of the whole chain,
+    which nothing else shares. Before that, we look for the bytecode of a chained comparison, where every
+    comparison except the last jumps to the same place if it's false. We also look for chains that have been
+    split into separate statements, like pytest does when it rewrites ``assert`` statements, where each
+    comparison is stored in a variable whose name isn't an identifier, and then they're combined with ``and``.
+
+    :param CodeType code: The code object to look in
+    :returns: A dictionary from the offset of each comparison that's followed by another one in the same
+        chain, to the offset of that next comparison
+    """
+    # The dis module is slow to import, so it's only imported when it's needed
+    import dis
+
+    instructions = [instruction for instruction in dis.get_instructions(code) if instruction.opname != 'EXTENDED_ARG']
+    partners: dict[int, int] = {}
+
+    # Code objects have positions in Python 3.11 and later
+    if hasattr(code, 'co_positions'):
+        later: dict[Any, int] = {}
+
+        for instruction in reversed(instructions):
+            position = instruction.positions
+
+            if instruction.opname == 'COMPARE_OP' and position.lineno is not None:
+                if position in later:
+                    partners[instruction.offset] = later[position]
+
+                later[position] = instruction.offset
+
+        return partners
+
+    comparisons = [i for i, instruction in enumerate(instructions) if instruction.opname == 'COMPARE_OP']
+    targets = {
+        i: instructions[i + 1].argval for i in comparisons
+        if instructions[i - 1].opname == 'ROT_THREE' and instructions[i + 1].opname == 'JUMP_IF_FALSE_OR_POP'
+    }
+
+    for i, target in targets.items():
+        last = max(j for j in comparisons if instructions[j].offset < target)
+        partner = min(j for j in comparisons if j > i and (targets.get(j) == target or j == last))
+        partners[instructions[i].offset] = instructions[partner].offset
+
+    stored: dict[str, int] = {}
+
+    for i, instruction in enumerate(instructions):
+        if instruction.opname == 'COMPARE_OP' and instructions[i + 1].opname.startswith('STORE_'):
+            name = str(instructions[i + 1].argval)
+
+            if not name.isidentifier():
+                stored[name] = instruction.offset
+
+        elif instruction.opname == 'JUMP_IF_FALSE_OR_POP' and 0 < i < len(instructions) - 1:
+            first, second = str(instructions[i - 1].argval), str(instructions[i + 1].argval)
+
+            if first in stored and second in stored and instructions[i - 1].opname.startswith('LOAD_'):
+                partners[stored[first]] = stored[second]
+
+    return partners
+
+
+_KEEP_ALIVE = 4096
+"""How many of the most recently created distributions are kept alive, even if nothing else refers to them.
+
+Distributions are interned (see :class:`_Interned`), but only while they're alive. Keeping the
+latest few alive means that a service which keeps making the same few thousand distributions
+from scratch gets the existing instances back, rather than building new ones each time.
+"""
+
+_recently_created: deque[Distribution] = deque(maxlen=_KEEP_ALIVE)
+
 
-class Distribution(abc.ABC):
+class _Interned(abc.ABCMeta):
+    """A metaclass that makes distributions with identical parameters share one instance.
+
+    Calling a distribution class first looks up its parameters in a weak dictionary of
+    existing instances, so ``B(10, 0.5) is B(10, 0.5)``, and any constants that the
+    constructor precomputes are only computed once for each set of parameters.
+
+    Parameters are matched by type as well as value, so ``B(10, 1)`` and ``B(10, 1.0)`` are different
+    instances, because their reprs are different. Unhashable parameters just skip the interning.
+    """
+
+    def __init__(cls, *args: Any, **kwargs: Any):
+        """Give every distribution class its own dictionary of weak references to its instances."""
+        super().__init__(*args, **kwargs)
+
+        instances: dict[tuple[Any, ...], weakref.KeyedRef[tuple[Any, ...], Distribution]] = {}
+
+        def discard(reference: weakref.KeyedRef[tuple[Any, ...], Distribution]) -> None:
+            """Remove a dead instance from the dictionary, unless it's already been replaced."""
+            if instances.get(reference.key) is reference:
+                instances.pop(reference.key, None)
+
+        cls._instances = instances
+        cls._discard = discard
+        cls._instances_lock = threading.Lock()
+
+    def __call__(cls, *args: Any, **kwargs: Any) -> Any:
+        """Return the existing instance with these parameters, or create one."""
+        if kwargs:
+            # Bind the keywords to positions, so that keywords and positions give the same instance.
+            # The inspect module is slow to import, so it's only imported when it's needed
+            import inspect
+            signature = inspect.signature(cls.__init__)  # type: ignore[misc]
+            args = signature.bind(None, *args, **kwargs).args[1:]
+
+        # The types are in the key, so that B(10, 1) and B(10, 1.0) keep their own reprs
+        key = (*args, *map(type, args))
+
+        try:
+            reference = cls._instances.get(key)
+        except TypeError:
+            # Unhashable parameters can't be interned, so they always get a new instance
+            instance = super().__call__(*args)
+            instance._parameters = args
+            return instance
+
+        instance = reference() if reference is not None else None
+
+        if instance is not None:
+            return instance
+
+        with cls._instances_lock:
+            reference = cls._instances.get(key)
+            instance = reference() if reference is not None else None
+
+            if instance is None:
+                instance = super().__call__(*args)
+                instance._parameters = args
+                cls._instances[key] = weakref.KeyedRef(instance, cls._discard, key)
+                _recently_created.append(instance)
+
+        return instance
+
+
+class Distribution(metaclass=_Interned):
     """This is an abstract superclass representing an arbitrary probability distribution.
 
-    It implements logical comparison dunder methods and :meth:`calculate`, which allow
-    it to be used easily in :func:`calculate_probability`.
+    It implements logical comparison dunder methods, which return :class:`Event` objects,
+    and :meth:`calculate`, which allow it to be used easily with :class:`ProbabilityCalculator`.
+
+    Distributions are never mutated by comparisons or calculations, and they're interned, so
+    making a distribution with the same parameters as an existing one just returns the existing one.
     """
 
+    # Scenario grids can hold millions of distributions, so they don't get a __dict__
+    __slots__ = ('_accepts_floats', '_parameters', '__weakref__')
+
+    _parameters: tuple[Any, ...]
+    """The arguments that this distribution was constructed with. See :attr:`parameters`."""
+
     _accepts_floats: bool
     """This attribute is a flag for whether this distribution accepts floats, or only accepts ints.
 
@@ -90,151 +439,384 @@ class Distribution(abc.ABC):
        ``NotImplemented`` if the user tries to compare a discrete distribution with a float.
     """
 
-    _negate_probability: bool
-    """This attribute is a flag set by :meth:`__ne__` and used by :meth:`calculate` for the ``!=`` operator."""
+    _array_fill_value: float = 0
+    """A value that's always valid for this distribution.
+
+    The ``*_array`` methods use this in place of invalid elements in non-strict mode, and then return 0 for them.
+    """
 
     def __init__(self, *, accepts_floats: bool):
-        """Create a :class:`Distribution` object with natural bounds and one flag.
+        """Create a :class:`Distribution` object with one flag.
 
         :param bool accepts_floats: Whether this distribution should accept floats
         """
-        self.bounds = _Bounds()
         self._accepts_floats = accepts_floats
-        self._negate_probability = False
-
-    def reset(self) -> None:
-        """Reset the bounds of the distribution to be the default, and reset :attr:`negate_probability` flag."""
-        self.bounds = _Bounds()
-        self._negate_probability = False
 
     @abc.abstractmethod
     def __repr__(self) -> str:
         """Return a simple repr of the distribution, normally the syntax used to construct it."""
 
-    def __eq__(self, other):
-        """Set the upper and lower bounds to ``other``, if possible.
+    @property
+    def parameters(self) -> tuple[Any, ...]:
+        """The arguments that this distribution was constructed with.
 
-        This method checks the bounds against the defaults to see if the user has
-        previously compared this distribution with an inequality operator. If they
-        have, then we raise an error.
+        Comparing distributions with ``==`` makes an :class:`Event`, so compare their types and
+        parameters to see if two distributions are the same. Because distributions are interned,
+        two distributions with the same type and parameters are usually the same object anyway.
+        """
+        return self._parameters
+
+    def __reduce__(self) -> tuple[type[Distribution], tuple[Any, ...]]:
+        """Pickle and copy the distribution by its parameters, so that unpickling and copying keep it interned."""
+        return self.__class__, self._parameters
+
+    def _accepts(self, other: object) -> bool:
+        """Check if ``other`` is a value that this distribution can be compared with."""
+        return isinstance(other, int) or (self._accepts_floats and isinstance(other, float))
+
+    def _compare(self, bound: str | None, limit: tuple[Any, bool], negated: bool = False) -> Event:
+        """Return the event made by a comparison, which builds on the first half if it's part of a chained comparison.
+
+        This must be called straight from the comparison method, because it looks at the code that called that.
+
+        :param bound: The bound set by the comparison, out of ``'lower'`` and ``'upper'``, or None for an equality
+        :param limit: The value of the bound, and whether it's included
+        :param bool negated: Whether the comparison is ``!=``
+        :returns Event: The event
+
+        :raises NonsenseError: If this contradicts the first half of a chained comparison
+        """
+        frame = sys._getframe(2)
+        code, offset = frame.f_code, frame.f_lasti
+        links = _chain_links.links
+        event = Event(self)
+
+        link = links.pop((id(frame), offset), None)
+        if link is not None and link[0] is code and link[1].distribution is self:
+            event = link[1]
+
+        lower, upper = event.bounds.lower, event.bounds.upper
+
+        if bound is None or event.negated or (lower[0] is not None and lower == upper and lower[1]):
+            # If the bounds are already set, then we've mixed inequality and equality
+            if not event.bounds.is_default:
+                raise NonsenseError('Cannot have inequality and equality mixed together')
+
+        if bound is None:
+            event = Event(self, _Bounds(limit, limit), negated)
+
+        elif bound == 'upper':
+            if lower[0] is not None and lower[0] > limit[0]:
+                raise NonsenseError('Cannot have upper bound less than lower bound')
+
+            event = event.with_upper(limit)
+
+        else:
+            if upper[0] is not None and upper[0] < limit[0]:
+                raise NonsenseError('Cannot have lower bound greater than upper bound')
+
+            event = event.with_lower(limit)
+
+        partner = _chain_partners(code).get(offset)
+        if partner is not None:
+            if len(links) >= _MAX_CHAIN_LINKS:
+                # Forget the oldest, which must have been left behind
+                del links[next(iter(links))]
+
+            links[id(frame), partner] = (code, event)
+
+        return event
+
+    def __eq__(self, other):
+        """Return an event where the lower and upper bounds are ``other``, if possible.
 
         :raises NonsenseError: If the user has tried to mix inequality and equality comparison
         """
-        if not (isinstance(other, int) or (self._accepts_floats and isinstance(other, float))):
+        if not self._accepts(other):
             return NotImplemented
 
-        # If the bounds are already mutated, then we've mixed inequality and equality
-        if self.bounds != _Bounds():
-            raise NonsenseError('Cannot have inequality and equality mixed together')
-
-        self.bounds.upper = (other, True)
-        self.bounds.lower = (other, True)
-        return self
+        return self._compare(None, (other, True))
 
     def __ne__(self, other):
-        """Set the upper and lower bounds to ``other``, if possible, and set :attr:`negate_probability`.
+        """Return a negated event where the lower and upper bounds are ``other``, if possible.
 
         See :meth:`__eq__`.
 
         :raises NonsenseError: If the user has tried to mix inequality and equality comparison
         """
-        if not (isinstance(other, int) or (self._accepts_floats and isinstance(other, float))):
+        if not self._accepts(other):
             return NotImplemented
 
-        # If the bounds are already mutated, then we've mixed inequality and equality
-        if self.bounds != _Bounds():
-            raise NonsenseError('Cannot have inequality and equality mixed together')
+        return self._compare(None, (other, True), negated=True)
 
-        self.bounds.upper = (other, True)
-        self.bounds.lower = (other, True)
+    def __hash__(self) -> int:
+        """Hash the distribution by its type and parameters.
 
-        self._negate_probability = True
-        return self
+        Defining ``__eq__`` removes the default ``__hash__``, but distributions should still be hashable.
+        """
+        return hash((self.__class__, self._parameters))
 
     def __lt__(self, other):
-        """Set the upper bound and don't include this value."""
-        if not (isinstance(other, int) or (self._accepts_floats and isinstance(other, float))):
+        """Return an event with this upper bound, not including this value."""
+        if not self._accepts(other):
             return NotImplemented
 
-        if self.bounds.lower[0] is not None:
-            if self.bounds.lower[0] > other:
-                raise NonsenseError('Cannot have upper bound less than lower bound')
-
-        self.bounds.upper = (other, False)
-        return self
+        return self._compare('upper', (other, False))
 
     def __le__(self, other):
-        """Set the upper bound and include this value."""
-        if not (isinstance(other, int) or (self._accepts_floats and isinstance(other, float))):
+        """Return an event with this upper bound, including this value."""
+        if not self._accepts(other):
             return NotImplemented
 
-        if self.bounds.lower[0] is not None:
-            if self.bounds.lower[0] > other:
-                raise NonsenseError('Cannot have upper bound less than lower bound')
-
-        self.bounds.upper = (other, True)
-        return self
+        return self._compare('upper', (other, True))
 
     def __gt__(self, other):
-        """Set the lower bound and don't include this value."""
-        if not (isinstance(other, int) or (self._accepts_floats and isinstance(other, float))):
+        """Return an event with this lower bound, not including this value."""
+        if not self._accepts(other):
             return NotImplemented
 
-        if self.bounds.upper[0] is not None:
-            if self.bounds.upper[0] < other:
-                raise NonsenseError('Cannot have lower bound greater than upper bound')
-
-        self.bounds.lower = (other, False)
-        return self
+        return self._compare('lower', (other, False))
 
     def __ge__(self, other):
-        """Set the lower bound and include this value."""
-        if not (isinstance(other, int) or (self._accepts_floats and isinstance(other, float))):
+        """Return an event with this lower bound, including this value."""
+        if not self._accepts(other):
             return NotImplemented
 
-        if self.bounds.upper[0] is not None:
-            if self.bounds.upper[0] < other:
-                raise NonsenseError('Cannot have lower bound greater than upper bound')
+        return self._compare('lower', (other, True))
 
-        self.bounds.lower = (other, True)
-        return self
+    def __add__(self, other):
+        """Return the distribution of the sum of independent random variables from this distribution and ``other``.
 
-    def calculate(self, *, strict: bool = True) -> float:
-        """Return the probability of a random variable from this distribution taking on a value within its bounds.
+        Sums with a closed form, like two Poisson distributions, or two binomial distributions with the
+        same probability, give a distribution of the same kind. Other sums of discrete distributions give
+        a :class:`probcalc.distributions.SumDistribution`, whose PMF is found by convolution. Adding 0
+        gives this distribution back, so that the built-in :func:`sum` works.
 
-        .. warning:: If ``strict`` is False, then we get undefined behaviour. Beware.
+        .. note::
+           Every term of a sum is independent, so ``X + X`` is the sum of two independent
+           random variables from ``X``, not ``2X``. See :func:`probcalc.distributions.sum_iid`.
+        """
+        if isinstance(other, int) and other == 0:
+            return self
 
-        .. warning::
-           This method should only really be used in scripts and things, because it can easily
-           result in undefined behaviour when the :class:`Distribution` object is mutated
-           between calls, which is often done with logical comparison operators.
+        if not isinstance(other, Distribution):
+            return NotImplemented
+
+        # The distributions module imports this one, so it can't be imported at the top
+        from .distributions import _sum_terms
+
+        total = _sum_terms([(self, 1), (other, 1)])
+        return NotImplemented if total is None else total
+
+    def __radd__(self, other):
+        """Return the distribution of the sum, like :meth:`__add__`, so that ``sum()`` can start with 0."""
+        return self.__add__(other)
+
+    def calculate(self, event: Event, *, strict: bool = True) -> float:
+        """Return the probability of a random variable from this distribution taking on a value in the event.
+
+        .. warning:: If ``strict`` is False, then we get undefined behaviour. Beware.
 
-           If you want a good way to calculate probability interactively, see :func:`calculate_probability`.
+        .. note::
+           This method doesn't round the result. If you want a good way to calculate
+           probability interactively, see :class:`ProbabilityCalculator`.
 
+        :param Event event: The event to find the probability of, which must be about this distribution
         :param bool strict: Whether to raise errors or just ignore them
         :returns float: The calculated probability
+
+        :raises NonsenseError: If the bounds of the event are invalid
+        """
+        self._check_event(event)
+
+        return self._combine(
+            event,
+            lambda value: self.cdf(value, strict=strict),
+            lambda value: self.sf(value, strict=strict),
+            lambda value: self.pmf(value, strict=strict)
+        )
+
+    def calculate_many(self, events: Iterable[Event], *, strict: bool = True) -> list[float]:
+        """Return the probabilities of several events about this distribution at once.
+
+        This gives the same results as calling :meth:`calculate` for each event, but the CDF, survival
+        function, and PMF are only evaluated once at each distinct bound, in sorted order. If NumPy is
+        installed, they're evaluated with one call each to :meth:`cdf_array`, :meth:`sf_array`, and
+        :meth:`pmf_array`, so sharing a single cached table for discrete distributions, and using
+        vectorized formulas otherwise.
+
+        .. note::
+           The vectorized formulas can disagree with the scalar ones in the last few decimal places,
+           particularly in the far tails of a distribution.
+
+        :param events: The events to find the probabilities of, which must all be about this distribution
+        :param bool strict: Whether to raise errors or just ignore them
+        :returns: The calculated probabilities, in the same order as the events
+
+        :raises NonsenseError: If any event is about another distribution or has invalid bounds
+        """
+        events = list(events)
+
+        cdf_points: set[int] = set()
+        sf_points: set[int] = set()
+        pmf_points: set[int] = set()
+
+        for event in events:
+            if event.distribution is not self:
+                raise NonsenseError(f'Cannot calculate the probability of {event!r} with {self!r}')
+
+            self._check_event(event)
+
+            lower = event.bounds.lower
+            upper = event.bounds.upper
+            points = sf_points if self._uses_sf(event) else cdf_points
+
+            if upper[0] is not None:
+                points.add(upper[0])
+
+                if not upper[1]:
+                    pmf_points.add(upper[0])
+
+            if lower[0] is not None:
+                points.add(lower[0])
+
+                if lower[1]:
+                    pmf_points.add(lower[0])
+
+        cdf = self._evaluate_many(self.cdf, self.cdf_array, sorted(cdf_points), strict=strict)
+        sf = self._evaluate_many(self.sf, self.sf_array, sorted(sf_points), strict=strict)
+        pmf = self._evaluate_many(self.pmf, self.pmf_array, sorted(pmf_points), strict=strict)
+
+        return [self._combine(event, cdf.__getitem__, sf.__getitem__, pmf.__getitem__) for event in events]
+
+    @staticmethod
+    def _evaluate_many(
+        function: Callable[..., float],
+        array_function: Callable[..., FloatArray],
+        values: list[int],
+        *,
+        strict: bool
+    ) -> dict[int, float]:
+        """Evaluate a function at several values, vectorized if NumPy is installed.
+
+        :param function: The scalar function, like :meth:`cdf`
+        :param array_function: The array version of the function, like :meth:`cdf_array`
+        :param values: The values to evaluate the function at
+        :param bool strict: Whether to throw errors for invalid input, or return 0
+        :returns: A dictionary mapping each value to the result
         """
-        lower = self.bounds.lower
-        upper = self.bounds.upper
+        if not values:
+            return {}
+
+        try:
+            results: list[float] = array_function(values, strict=strict).tolist()
+        except ImportError:
+            results = [function(value, strict=strict) for value in values]
+
+        return dict(zip(values, results))
 
-        probability = 1.0
+    def _check_event(self, event: Event) -> None:
+        """Check the bounds of an event for nonsense specific to this distribution, before calculating it.
 
-        if upper[0] is not None:
-            probability = self.cdf(upper[0], strict=strict)
+        By default, this does nothing, but subclasses can override it for edge cases.
 
-            if not upper[1]:
-                probability -= self.pmf(upper[0], strict=strict)
+        :raises NonsenseError: If the event doesn't make sense for this distribution
+        """
 
-        if lower[0] is not None:
-            probability -= self.cdf(lower[0], strict=strict)
+    def _in_upper_tail(self, value: float) -> bool:
+        """Check if the value is in the upper tail of this distribution, where the survival function is more precise.
+
+        By default, this is always False, so probabilities are calculated with the CDF.
+        Distributions override this to compare with their mean.
+        """
+        return False
+
+    def _is_cheap(self, event: Event) -> bool:
+        """Check if calculating the probability of the event is so quick that it's not worth using an executor.
+
+        This is used by :meth:`ProbabilityCalculator.acalculate`. By default, this is always False,
+        so every event is calculated in an executor. Distributions with closed forms override this.
+        """
+        return False
+
+    def _sum_with(self, other: Distribution) -> Distribution | None:
+        """Return the distribution of the sum of this distribution and another, if it has a closed form.
+
+        By default, there's no closed form, so this returns None. Distributions override this for other
+        distributions of the same kind, and sums without a closed form are found by convolution.
+        """
+        return None
+
+    def _sum_of_copies(self, n: int) -> Distribution | None:
+        """Return the distribution of the sum of ``n`` independent copies of this distribution, if it has a closed form.
+
+        By default, there's no closed form, so this returns None, like :meth:`_sum_with`.
+        """
+        return None
+
+    def _uses_sf(self, event: Event) -> bool:
+        """Check if the probability of an event should be calculated with the survival function rather than the CDF.
+
+        This is the case when the event only covers values in the upper tail, so subtracting
+        values of the CDF close to 1 would lose precision, and might even round the result down to 0.
+        """
+        lower = event.bounds.lower[0]
+        return lower is not None and self._in_upper_tail(lower)
+
+    def _combine(
+        self,
+        event: Event,
+        cdf: Callable[[int], float],
+        sf: Callable[[int], float],
+        pmf: Callable[[int], float]
+    ) -> float:
+        """Combine the CDF or survival function and the PMF at the bounds of an event into its probability.
+
+        This uses the survival function for events in the upper tail, see :meth:`_uses_sf`.
+
+        :param Event event: The event to find the probability of
+        :param cdf: A function that returns the CDF at a bound
+        :param sf: A function that returns the survival function at a bound
+        :param pmf: A function that returns the PMF at a bound
+        :returns float: The probability of the event
+
+        :raises NonsenseError: If the bounds of the event are invalid
+        """
+        lower = event.bounds.lower
+        upper = event.bounds.upper
+
+        if self._uses_sf(event):
+            # The lower bound can't be None here, but mypy doesn't know that
+            probability = sf(lower[0])  # type: ignore[arg-type]
 
             if lower[1]:
-                probability += self.pmf(lower[0], strict=strict)
+                probability += pmf(lower[0])  # type: ignore[arg-type]
+
+            if upper[0] is not None:
+                probability -= sf(upper[0])
+
+                if not upper[1]:
+                    probability -= pmf(upper[0])
+
+        else:
+            probability = 1.0
+
+            if upper[0] is not None:
+                probability = cdf(upper[0])
+
+                if not upper[1]:
+                    probability -= pmf(upper[0])
+
+            if lower[0] is not None:
+                probability -= cdf(lower[0])
+
+                if lower[1]:
+                    probability += pmf(lower[0])
 
         if probability < 0:
             raise NonsenseError("This inequality doesn't make sense")
 
-        if self._negate_probability:
+        if event.negated:
             probability = 1 - probability
 
         return probability
@@ -267,6 +849,380 @@ class Distribution(abc.ABC):
         :raises NonsenseError: If the value doesn't make sense in the context of the distribution
         """
 
+    @abc.abstractmethod
+    def sf(self, value: int, *, strict: bool = True) -> float:
+        r"""Evaluate the survival function of this distribution.
+
+        This is the probability that a random variable distributed by this distribution takes on
+        a value greater than the given value. It's :math:`1 - \text{cdf}`, but calculated directly,
+        so small upper tail probabilities don't lose their precision.
+
+        :param int value: The value to find the probability for
+        :param bool strict: Whether to throw errors for invalid input, or return 0
+        :returns float: The calculated probability
+
+        :raises NonsenseError: If the value doesn't make sense in the context of the distribution
+        """
+
+    def logpmf(self, value: int, *, strict: bool = True) -> float:
+        """Evaluate the natural log of the PMF of this distribution.
+
+        This default implementation takes the log of :meth:`pmf`, but the distributions in
+        :mod:`probcalc.distributions` calculate it directly, which is cheaper and doesn't underflow.
+
+        :param int value: The value to find the log probability of
+        :param bool strict: Whether to throw errors for invalid input, or return negative infinity
+        :returns float: The log of the probability
+
+        :raises NonsenseError: If the value doesn't make sense in the context of the distribution
+        """
+        return _log(self.pmf(value, strict=strict))
+
+    def logcdf(self, value: int, *, strict: bool = True) -> float:
+        """Evaluate the natural log of the CDF of this distribution.
+
+        See :meth:`logpmf`.
+
+        :param int value: The value to find the log probability for
+        :param bool strict: Whether to throw errors for invalid input, or return negative infinity
+        :returns float: The log of the probability
+
+        :raises NonsenseError: If the value doesn't make sense in the context of the distribution
+        """
+        return _log(self.cdf(value, strict=strict))
+
+    def logsf(self, value: int, *, strict: bool = True) -> float:
+        """Evaluate the natural log of the survival function of this distribution.
+
+        See :meth:`logpmf`.
+
+        :param int value: The value to find the log probability for
+        :param bool strict: Whether to throw errors for invalid input, or return negative infinity
+        :returns float: The log of the probability
+
+        :raises NonsenseError: If the value doesn't make sense in the context of the distribution
+        """
+        return _log(self.sf(value, strict=strict))
+
+    def _pmf_table(self) -> PMFTable | None:
+        """Return the cached :class:`probcalc.tables.PMFTable` for this distribution, building it if needed.
+
+        Discrete distributions can override this to make repeated queries into table lookups.
+        By default, there is no table.
+        """
+        return None
+
+    def _pmf_recurrence(self) -> tuple[int, Callable[[int], float]] | None:
+        """Return the mode of this distribution and a function that takes ``k`` and returns ``pmf(k + 1) / pmf(k)``.
+
+        Discrete distributions with a log-concave PMF override this, so that :meth:`_sum_pmf` can start summing
+        at the mode and stop when the rest of a tail is negligible. By default, this returns None.
+        """
+        return None
+
+    def _sum_pmf(self, lower: int, upper: int | None, *, tolerance: float = summation.DEFAULT_TOLERANCE) -> float:
+        """Return the sum of the PMF from ``lower`` to ``upper`` inclusive, with :func:`probcalc.summation.sum_pmf`.
+
+        This uses :meth:`_pmf_recurrence` if there is one, or just adds up every value of :meth:`pmf` otherwise.
+
+        :param int lower: The first value to include, which must be in the support
+        :param upper: The last value to include, or None to include the whole upper tail
+        :param float tolerance: The largest fraction of the sum that the values left out of each tail can add up to
+        :returns float: The sum
+
+        :raises ValueError: If ``upper`` is None and there's no recurrence
+        """
+        recurrence = self._pmf_recurrence()
+        mode, ratio = recurrence if recurrence is not None else (None, None)
+
+        return summation.sum_pmf(
+            self.pmf, lower, upper, mode=mode, ratio=ratio, tolerance=tolerance, distribution=self
+        )
+
+    def _table_key(self) -> tuple[Any, ...] | None:
+        """Return the key of the table for this distribution in :mod:`probcalc.tables`, or None if it has no table.
+
+        The key is the name of the class followed by the parameters that the table depends on.
+        """
+        return None
+
+    def _lookup_array(
+        self,
+        column: str,
+        values: FloatArray,
+        fallback: Callable[[FloatArray], FloatArray]
+    ) -> FloatArray:
+        """Look up a column of :meth:`_pmf_table` for every element of an array of valid values.
+
+        :param str column: Which values to look up, out of ``'pmf'``, ``'cdf'``, and ``'sf'``
+        :param values: The values to look up
+        :param fallback: A function to calculate the values for any elements outside the table
+        :returns: An array of the values
+        """
+        table = self._pmf_table()
+        if table is None:
+            return fallback(values)
+
+        results, inside = table.lookup_array(column, values)
+
+        outside = ~inside
+        if outside.any():
+            results[outside] = fallback(values[outside])
+
+        return results
+
+    def _invalid_array(self, values: FloatArray) -> BoolArray:
+        """Return a boolean array which is True wherever the value is invalid for this distribution.
+
+        By default, every value is valid. Subclasses override this to match their ``_check_nonsense()`` method.
+        """
+        import numpy as np
+
+        return np.zeros(values.shape, dtype=np.bool_)
+
+    def _validate_array(self, values: npt.ArrayLike, *, strict: bool) -> tuple[FloatArray, BoolArray]:
+        """Check an array of values for nonsense.
+
+        In strict mode, the first invalid value is passed to :meth:`pmf`, so that the error
+        is the same as for a single value. In non-strict mode, the invalid values are replaced
+        by :attr:`_array_fill_value` so that they can't cause problems in calculations.
+
+        :param values: The values to check
+        :param bool strict: Whether to throw errors or just replace invalid values
+        :returns: The values as an array of floats, and the mask of invalid values
+
+        :raises NonsenseError: If any of the values are invalid and ``strict`` is True
+        """
+        import numpy as np
+
+        from .vectorized import as_float_array
+
+        array = as_float_array(values)
+        invalid = self._invalid_array(array)
+
+        if invalid.any():
+            if strict:
+                self.pmf(array[invalid].flat[0].item(), strict=True)  # type: ignore[arg-type]
+
+            array = np.where(invalid, self._array_fill_value, array)
+
+        return array, invalid
+
+    def pmf_array(self, values: npt.ArrayLike, *, strict: bool = True) -> FloatArray:
+        """Evaluate :meth:`pmf` for every element of an array of values.
+
+        This default implementation just calls :meth:`pmf` for each element, but the distributions in
+        :mod:`probcalc.distributions` override it to evaluate the whole array in one vectorized pass.
+        This method needs NumPy to be installed.
+
+        :param values: The values to find the probabilities of
+        :param bool strict: Whether to throw errors for invalid input, or return 0 for those elements
+        :returns: An array of probabilities with the same shape as ``values``
+
+        :raises NonsenseError: If any value doesn't make sense in the context of the distribution
+        """
+        from .vectorized import apply_elementwise
+
+        return apply_elementwise(self.pmf, values, strict=strict)
+
+    def cdf_array(self, values: npt.ArrayLike, *, strict: bool = True) -> FloatArray:
+        """Evaluate :meth:`cdf` for every element of an array of values.
+
+        See :meth:`pmf_array`.
+
+        :param values: The values to find the probabilities for
+        :param bool strict: Whether to throw errors for invalid input, or return 0 for those elements
+        :returns: An array of probabilities with the same shape as ``values``
+
+        :raises NonsenseError: If any value doesn't make sense in the context of the distribution
+        """
+        from .vectorized import apply_elementwise
+
+        return apply_elementwise(self.cdf, values, strict=strict)
+
+    def sf_array(self, values: npt.ArrayLike, *, strict: bool = True) -> FloatArray:
+        """Evaluate the survival function, ``1 - cdf``, for every element of an array of values.
+
+        See :meth:`pmf_array`.
+
+        :param values: The values to find the probabilities for
+        :param bool strict: Whether to throw errors for invalid input, or return 0 for those elements
+        :returns: An array of probabilities with the same shape as ``values``
+
+        :raises NonsenseError: If any value doesn't make sense in the context of the distribution
+        """
+        import numpy as np
+
+        _, invalid = self._validate_array(values, strict=strict)
+        return np.where(invalid, 0.0, 1 - self.cdf_array(values, strict=False))
+
+    @abc.abstractmethod
+    def ppf(self, probability: float, *, strict: bool = True) -> float:
+        r"""Evaluate the PPF (percent point function) of this distribution, which is the inverse of the CDF.
+
+        This is the smallest value :math:`x` such that :math:`P(X \leq x)` is at least the given probability.
+        For discrete distributions, this is an integer, unless it's infinite.
+
+        :param float probability: The probability, between 0 and 1
+        :param bool strict: Whether to throw errors for invalid input, or return NaN
+        :returns float: The smallest value whose CDF is at least the probability
+
+        :raises NonsenseError: If the probability is not between 0 and 1
+        """
+
+    @abc.abstractmethod
+    def isf(self, probability: float, *, strict: bool = True) -> float:
+        """Evaluate the inverse survival function of this distribution.
+
+        This is the smallest value :math:`x` such that :math:`P(X > x)` is at most the given probability.
+        It's calculated directly, so that small upper tail probabilities don't lose their precision.
+
+        :param float probability: The probability, between 0 and 1
+        :param bool strict: Whether to throw errors for invalid input, or return NaN
+        :returns float: The smallest value whose survival function is at most the probability
+
+        :raises NonsenseError: If the probability is not between 0 and 1
+        """
+
+    @staticmethod
+    def _check_probability(probability: float, *, strict: bool) -> Literal[None, -1]:
+        """Check if the given probability is nonsense, as an argument of :meth:`ppf` or :meth:`isf`.
+
+        :param float probability: The probability to check
+        :param bool strict: Whether to throw errors or just return -1
+        :returns: None on success, -1 on fail
+        :rtype: Literal[None, -1]
+
+        :raises NonsenseError: If the probability is not between 0 and 1
+        """
+        if not 0 <= probability <= 1:
+            if strict:
+                raise NonsenseError(f'Probability must be between 0 and 1, not {probability}')
+
+            return -1
+
+        return None
+
+    def _validate_probabilities(self, probabilities: npt.ArrayLike, *, strict: bool) -> tuple[FloatArray, BoolArray]:
+        """Check an array of probabilities for nonsense, like :meth:`_validate_array` does for values.
+
+        In non-strict mode, the invalid probabilities are replaced by 0.5.
+
+        :param probabilities: The probabilities to check
+        :param bool strict: Whether to throw errors or just replace invalid probabilities
+        :returns: The probabilities as an array of floats, and the mask of invalid probabilities
+
+        :raises NonsenseError: If any of the probabilities are not between 0 and 1 and ``strict`` is True
+        """
+        import numpy as np
+
+        from .vectorized import as_float_array
+
+        array = as_float_array(probabilities)
+        invalid: BoolArray = ~((array >= 0) & (array <= 1))
+
+        if invalid.any():
+            if strict:
+                self._check_probability(array[invalid].flat[0].item(), strict=True)
+
+            array = np.where(invalid, 0.5, array)
+
+        return array, invalid
+
+    def _quantile_array(self, column: str, probabilities: npt.ArrayLike, *, strict: bool) -> FloatArray:
+        """Evaluate :meth:`ppf` or :meth:`isf` for every element of an array of probabilities.
+
+        If this distribution has a :meth:`_pmf_table`, then every probability is found with a binary
+        search of the table, and only the ones outside of it are passed to the scalar method.
+
+        :param str column: Which function to invert, out of ``'cdf'`` for :meth:`ppf` and ``'sf'`` for :meth:`isf`
+        :param probabilities: The probabilities to find the values for
+        :param bool strict: Whether to throw errors for invalid input, or return NaN for those elements
+        :returns: An array of values with the same shape as ``probabilities``
+
+        :raises NonsenseError: If any probability is not between 0 and 1
+        """
+        import numpy as np
+
+        from .vectorized import apply_elementwise
+
+        function = self.ppf if column == 'cdf' else self.isf
+
+        table = self._pmf_table()
+        if table is None:
+            return apply_elementwise(function, probabilities, strict=strict)
+
+        q, invalid = self._validate_probabilities(probabilities, strict=strict)
+        results, inside = table.quantile_array(column, q)
+
+        # The table can't tell that a probability of exactly 1 (or 0 for the survival function) means the maximum
+        outside = ~(inside | invalid) | (q == (1 if column == 'cdf' else 0))
+        if outside.any():
+            results[outside] = apply_elementwise(function, q[outside], strict=True)
+
+        results[invalid] = np.nan
+        return results
+
+    def ppf_array(self, probabilities: npt.ArrayLike, *, strict: bool = True) -> FloatArray:
+        """Evaluate :meth:`ppf` for every element of an array of probabilities.
+
+        For discrete distributions with a cached table, this is one vectorized binary search
+        of the table. Otherwise, this default implementation just calls :meth:`ppf` for each
+        element. This method needs NumPy to be installed.
+
+        :param probabilities: The probabilities to find the values for
+        :param bool strict: Whether to throw errors for invalid input, or return NaN for those elements
+        :returns: An array of values with the same shape as ``probabilities``
+
+        :raises NonsenseError: If any probability is not between 0 and 1
+        """
+        return self._quantile_array('cdf', probabilities, strict=strict)
+
+    def isf_array(self, probabilities: npt.ArrayLike, *, strict: bool = True) -> FloatArray:
+        """Evaluate :meth:`isf` for every element of an array of probabilities.
+
+        See :meth:`ppf_array`.
+
+        :param probabilities: The probabilities to find the values for
+        :param bool strict: Whether to throw errors for invalid input, or return NaN for those elements
+        :returns: An array of values with the same shape as ``probabilities``
+
+        :raises NonsenseError: If any probability is not between 0 and 1
+        """
+        return self._quantile_array('sf', probabilities, strict=strict)
+
+    def rvs(self, size: int | tuple[int, ...], *, seed: Seed = None) -> FloatArray | IntArray:
+        """Generate random variates from this distribution.
+
+        Each distribution uses an algorithm that suits it. This method needs NumPy to be installed.
+        To give parallel workers their own streams, pass each one a generator from
+        :func:`probcalc.sampling.spawn`.
+
+        :param size: The number of variates, or the shape of the output array
+        :param seed: An int or :class:`numpy.random.SeedSequence` to get reproducible variates,
+            a :class:`numpy.random.Generator` to continue its stream, or None for fresh entropy
+        :returns: An array of variates, which are ints for discrete distributions
+        """
+        from . import sampling
+
+        return self._sample(sampling.generator(seed), size)
+
+    def _sample(self, rng: np.random.Generator, size: int | tuple[int, ...]) -> FloatArray | IntArray:
+        """Generate random variates from this distribution with the given generator.
+
+        By default, this uses inverse transform sampling with :meth:`ppf_array`, but the
+        distributions in :mod:`probcalc.distributions` override it with faster algorithms.
+        """
+        import numpy as np
+
+        samples = self.ppf_array(rng.random(size))
+
+        if self._accepts_floats:
+            return samples
+
+        result: IntArray = samples.astype(np.int64)
+        return result
+
 
 class ProbabilityCalculator:
     """This class only exists to give the probability calculator a nice repr."""
@@ -289,16 +1245,11 @@ class ProbabilityCalculator:
         """Return a very simple repr of the calculator."""
         return 'P'
 
-    def __call__(self, distribution: Distribution, /) -> float:
-        """Return the probability of a random variable from this distribution taking on a value within its bounds.
+    def __call__(self, event: Event | Distribution, /) -> float:
+        """Return the probability of an event, rounded to the set number of significant figures.
 
         This function is just a convenient wrapper around :meth:`Distribution.calculate`.
 
-        .. note::
-           This function calls :meth:`Distribution.reset`, but :meth:`Distribution.calculate`
-           doesn't on its own. Using the class method multiple times with different inputs can
-           result in undefined behaviour. Use this wrapper for all interactive use.
-
         This function gets exported as ``P`` by ``__init__.py``, which lets the user do things like:
 
         :Example:
@@ -310,18 +1261,111 @@ class ProbabilityCalculator:
         >>> P(4 < X <= 12)
         0.8625030518
 
-        :param Distribution distribution: The probability distribution that we're using to calculate the value
+        :param event: The event to find the probability of. A distribution on its own covers every value
         :returns float: The calculated probability
 
-        :raises NonsenseError: If the bounds of the distribution are invalid
+        :raises NonsenseError: If the bounds of the event are invalid, or it's not an event at all
         """
-        try:
-            probability = distribution.calculate(strict=True)
+        event = self._as_event(event)
+        probability = event.calculate(strict=True)
+
+        return round_sig_fig(probability, self._sig_figs)
+
+    def batch(self, events: Iterable[Event | Distribution], /) -> list[float]:
+        """Return the probabilities of several events, rounded to the set number of significant figures.
+
+        The events are grouped by distribution and each group is calculated with
+        :meth:`Distribution.calculate_many`, so work is shared between events with the same bounds,
+        like the buckets of a histogram.
 
-        except NonsenseError as e:
-            raise e
+        :Example:
+
+        >>> from probcalc import P, B
+        >>> X = B(20, 0.5)
+        >>> P.batch([a < X <= a + 5 for a in range(0, 20, 5)])
+        [0.02069377899, 0.5674037933, 0.4059925079, 0.005908966064]
+
+        :param events: The events to find the probabilities of. A distribution on its own covers every value
+        :returns: The calculated probabilities, in the same order as the events
+
+        :raises NonsenseError: If the bounds of any event are invalid, or one of them is not an event at all
+        """
+        checked_events = [self._as_event(event) for event in events]
+
+        groups: dict[Distribution, list[int]] = {}
+        for index, event in enumerate(checked_events):
+            groups.setdefault(event.distribution, []).append(index)
+
+        probabilities = [0.0] * len(checked_events)
+        for distribution, indices in groups.items():
+            results = distribution.calculate_many([checked_events[i] for i in indices], strict=True)
+
+            for index, probability in zip(indices, results):
+                probabilities[index] = probability
+
+        return [round_sig_fig(probability, self._sig_figs) for probability in probabilities]
+
+    async def acalculate(
+        self,
+        event: Event | Distribution,
+        /,
+        *,
+        timeout: float | None = None,
+        executor: concurrent.futures.Executor | None = None
+    ) -> float:
+        """Return the probability of an event like :meth:`__call__`, without blocking the event loop.
 
-        finally:
-            distribution.reset()
+        Slow calculations are done in an executor, and identical events that are already being
+        calculated are waited for rather than calculated again. See :mod:`probcalc.aio`.
 
+        :param event: The event to find the probability of. A distribution on its own covers every value
+        :param timeout: The number of seconds to wait for the probability, or None to wait forever
+        :param executor: The executor to use for slow calculations, or None for the default executor of the event loop
+        :returns float: The calculated probability
+
+        :raises NonsenseError: If the bounds of the event are invalid, or it's not an event at all
+        :raises asyncio.TimeoutError: If the timeout runs out first
+        """
+        from . import aio
+
+        probability = await aio.calculate(self._as_event(event), timeout=timeout, executor=executor)
         return round_sig_fig(probability, self._sig_figs)
+
+    async def abatch(
+        self,
+        events: Iterable[Event | Distribution],
+        /,
+        *,
+        timeout: float | None = None,
+        executor: concurrent.futures.Executor | None = None
+    ) -> list[float]:
+        """Return the probabilities of several events like :meth:`batch`, without blocking the event loop.
+
+        The events are calculated concurrently, like with :meth:`acalculate`.
+
+        :param events: The events to find the probabilities of. A distribution on its own covers every value
+        :param timeout: The number of seconds to wait for every probability, or None to wait forever
+        :param executor: The executor to use for slow calculations, or None for the default executor of the event loop
+        :returns: The calculated probabilities, in the same order as the events
+
+        :raises NonsenseError: If the bounds of any event are invalid, or one of them is not an event at all
+        :raises asyncio.TimeoutError: If the timeout runs out first
+        """
+        from . import aio
+
+        probabilities = await aio.batch([self._as_event(event) for event in events], timeout=timeout, executor=executor)
+        return [round_sig_fig(probability, self._sig_figs) for probability in probabilities]
+
+    @staticmethod
+    def _as_event(event: object) -> Event:
+        """Check the argument of a call to the calculator and convert it to an :class:`Event`.
+
+        :raises NonsenseError: If the argument is not an event or distribution
+        """
+        if isinstance(event, Distribution):
+            event = Event(event)
+
+        elif not isinstance(event, Event):
+            raise NonsenseError(f'Cannot calculate the probability of {event!r}, which is not an event')
+
+        return event
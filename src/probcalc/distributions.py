@@ -9,28 +9,221 @@
 from __future__ import annotations
 
 import math
-from typing import Literal
+from types import ModuleType
+from typing import TYPE_CHECKING, Any, Callable, Iterable, Literal, Sequence
 
-from .distribution_classes import Distribution, NonsenseError
+from . import summation
+from .distribution_classes import Distribution, Event, NonsenseError, _Bounds
+from .utility import (
+    log_standard_normal_cdf, regularized_incomplete_beta, regularized_lower_gamma, regularized_upper_gamma,
+    standard_normal_ppf
+)
+
+if TYPE_CHECKING:
+    import numpy as np
+    import numpy.typing as npt
+
+    from .sampling import IntArray
+    from .tables import PMFTable
+    from .vectorized import BoolArray, FloatArray
 
 # Compute constants at import time for slight speed increase
 ROOT_TWO = math.sqrt(2)
 ROOT_TWO_PI = math.sqrt(2 * math.pi)
+LOG_ROOT_TWO_PI = math.log(ROOT_TWO_PI)
+
+_LOG_CUTOFF = 1e-300
+"""Below this, log methods stop taking the log of a probability, because it might have underflowed."""
+
+_CHEAP_TABLE_ENTRIES = 1000
+"""Discrete distributions whose tables are at most this big are quick enough to calculate without an executor."""
+
+_tables: ModuleType | None = None
+"""The :mod:`probcalc.tables` module, once :func:`_table_module` has imported it."""
+
+
+def _table_module() -> ModuleType:
+    """Return :mod:`probcalc.tables`, importing it the first time a table is needed.
+
+    Nothing needs the tables until a probability is calculated, so this keeps them out of ``import probcalc``.
+    Keeping the module here is much faster than importing it in every method that looks up a table.
+    """
+    global _tables
+    if _tables is None:
+        from . import tables
+        _tables = tables
+
+    return _tables
+
+
+def _expected_table_entries(variance: float) -> int:
+    """Return roughly how many entries a :class:`probcalc.tables.PMFTable` needs for a distribution with this variance.
+
+    This is 9 standard deviations each side of the mean. It's only an estimate, used to
+    decide whether the table would fit in the memory budget before building it.
+    """
+    return int(18 * math.sqrt(variance)) + 1
+
+
+def _xlog(x: float, log_y: float) -> float:
+    """Return ``x * log_y``, but with 0 whenever ``x`` is 0, like :func:`probcalc.utility.xlogy` with the log done."""
+    return x * log_y if x != 0 else 0.0
+
+
+def _log_tail_sum(
+    distribution: Distribution,
+    log_first: float,
+    ratio: Callable[[int], float],
+    first: int,
+    last: int | None,
+    step: int
+) -> float:
+    """Return the log of a sum of consecutive PMF values in a tail, without underflowing.
+
+    This is only used far out in a tail, where the PMF values fall quickly, so only a few of them matter.
+    The sum is relative to the first value, with :func:`probcalc.summation.sum_tail`.
+
+    :param distribution: The distribution whose PMF this is
+    :param float log_first: The log PMF of the first value in the sum
+    :param ratio: A function that takes ``k`` and returns ``pmf(k + step) / pmf(k)``
+    :param int first: The first value in the sum
+    :param last: The last value in the sum, or None if the tail is unbounded
+    :param int step: 1 to sum upwards, or -1 to sum downwards
+    :returns float: The log of the sum
+    """
+    if log_first == -math.inf:
+        return -math.inf
+
+    return log_first + math.log(summation.sum_tail(1.0, ratio, first, last, step, distribution=distribution))
+
+
+def _log1mexp(x: float) -> float:
+    """Return ``log(1 - exp(x))`` for negative ``x``, accurately for both small and large ``x``."""
+    if x > -math.log(2):
+        return math.log(-math.expm1(x)) if x < 0 else -math.inf
+
+    return math.log1p(-math.exp(x))
+
+
+def _smallest_satisfying(condition: Callable[[int], bool], guess: int, minimum: int, maximum: int | None) -> int:
+    """Return the smallest integer from ``minimum`` to ``maximum`` where the condition is true.
+
+    The condition must be false up to some point and true from then on, and it's assumed to
+    be true at ``maximum``. This gallops away from the guess in doubling steps until the
+    answer is bracketed, and then bisects, so a good guess only costs a few evaluations.
+
+    :param condition: The condition, which gets called with integers
+    :param int guess: A guess at the answer, between ``minimum`` and ``maximum``
+    :param int minimum: The smallest possible answer
+    :param maximum: The largest possible answer, or None if there isn't one
+    :returns int: The smallest integer where the condition is true
+    """
+    step = 1
+
+    # We keep the condition false at low (or low is below the minimum) and true at high
+    if condition(guess):
+        high = guess
+        low = guess - 1
+        while low >= minimum and condition(low):
+            high = low
+            step *= 2
+            low = max(high - step, minimum - 1)
+
+    else:
+        low = guess
+        high = guess + 1 if maximum is None else min(guess + 1, maximum)
+        while (maximum is None or high < maximum) and not condition(high):
+            low = high
+            step *= 2
+            high = low + step if maximum is None else min(low + step, maximum)
+
+    while high - low > 1:
+        middle = (low + high) // 2
+
+        if condition(middle):
+            high = middle
+        else:
+            low = middle
+
+    return high
+
+
+def _discrete_quantile(
+    distribution: BinomialDistribution | PoissonDistribution,
+    column: str,
+    probability: float,
+    *,
+    maximum: int | None,
+    mean: float,
+    variance: float,
+    skewness: float
+) -> float:
+    """Return the :meth:`ppf` or :meth:`isf` of a discrete distribution whose support starts at 0.
+
+    If the answer is in the cached table of the distribution, it's found with a binary search.
+    Otherwise, we start from the Cornish-Fisher approximation, which adjusts the normal
+    approximation for skewness, and search with the CDF or survival function.
+
+    :param distribution: The distribution
+    :param str column: Which function to invert, out of ``'cdf'`` for :meth:`ppf` and ``'sf'`` for :meth:`isf`
+    :param float probability: The probability, which must be between 0 and 1
+    :param maximum: The largest value in the support, or None if it's unbounded
+    :param float mean: The mean of the distribution
+    :param float variance: The variance of the distribution
+    :param float skewness: The skewness of the distribution
+    :returns: The value, which is an integer unless it's infinite
+    """
+    upper = column == 'sf'
+
+    if probability == (1 if upper else 0):
+        return 0
+
+    if probability == (0 if upper else 1):
+        return math.inf if maximum is None else maximum
+
+    table = distribution._pmf_table()
+    if table is not None:
+        found = table.isf(probability) if upper else table.ppf(probability)
+
+        if found is not None:
+            return found
+
+    z = standard_normal_ppf(probability)
+    if upper:
+        z = -z
+
+    guess = round(mean + math.sqrt(variance) * (z + skewness * (z * z - 1) / 6))
+    guess = max(guess, 0) if maximum is None else min(max(guess, 0), maximum)
+
+    if upper:
+        return _smallest_satisfying(lambda k: distribution.sf(k) <= probability, guess, 0, maximum)
+
+    return _smallest_satisfying(lambda k: distribution.cdf(k) >= probability, guess, 0, maximum)
 
 
 class BinomialDistribution(Distribution):
     """This is a binomial distribution, used to model multiple independent, binary trials."""
 
+    __slots__ = ('_number_of_trials', '_probability', '_log_factorial_trials', '_log_probability', '_log_complement')
+
     def __init__(self, number_of_trials: int, probability: float):
         """Construct a binomial distribution from a given number of trials and probability of success for each trial."""
         if not 0 <= probability <= 1:
             raise NonsenseError(f'Binomial probability must be between 0 and 1, not {probability}')
 
+        if number_of_trials < 0:
+            raise NonsenseError(f'Cannot have negative number of trials ({number_of_trials})')
+
         super().__init__(accepts_floats=False)
 
         self._number_of_trials = number_of_trials
         self._probability = probability
 
+        # These only depend on the parameters, so they're computed once here rather than in every call to the PMF
+        self._log_factorial_trials = math.lgamma(number_of_trials + 1)
+        self._log_probability = math.log(probability) if probability > 0 else -math.inf
+        self._log_complement = math.log1p(-probability) if probability < 1 else -math.inf
+
     def __repr__(self) -> str:
         """Return a nice repr of the distribution."""
         return f'B({self._number_of_trials}, {self._probability})'
@@ -83,20 +276,40 @@ class BinomialDistribution(Distribution):
         if self._check_nonsense(successes, strict=strict) is not None:
             return 0
 
+        return math.exp(self._logpmf(successes))
+
+    def logpmf(self, successes: int, *, strict: bool = True) -> float:
+        """Return the natural log of the probability that we get a given number of successes.
+
+        This is calculated directly, so it doesn't underflow like ``log(pmf())`` can.
+
+        :param int successes: The number of successes to find the log probability of
+        :param bool strict: Whether to throw errors for invalid input, or return negative infinity
+        :returns float: The log of the probability of getting exactly this many successes
+
+        :raises NonsenseError: If the number of successes is outside the valid range
+        :raises NonsenseError: If the number of successes is not an integer
+        """
+        if self._check_nonsense(successes, strict=strict) is not None:
+            return -math.inf
+
+        return self._logpmf(successes)
+
+    def _logpmf(self, successes: int) -> float:
+        """Return the log PMF for a valid number of successes."""
         # PMF taken from https://github.com/scipy/scipy/blob/main/scipy/stats/_discrete_distns.py#L67-L74
-        magic_number = math.lgamma(self._number_of_trials + 1) - (
-            math.lgamma(successes + 1) + math.lgamma(self._number_of_trials - successes + 1)
-        )
+        failures = self._number_of_trials - successes
+        magic_number = self._log_factorial_trials - (math.lgamma(successes + 1) + math.lgamma(failures + 1))
 
-        return math.exp(
-            magic_number + successes * math.log(self._probability) +  # noqa: W504
-            (self._number_of_trials - successes) * math.log1p(-self._probability)
-        )
+        return magic_number + _xlog(successes, self._log_probability) + _xlog(failures, self._log_complement)
 
     def cdf(self, successes: int, *, strict: bool = True) -> float:
-        """Return the probability that we get less than or equal to the given number of successes.
+        r"""Return the probability that we get less than or equal to the given number of successes.
 
-        This method just sums :meth:`pmf` from 0 to the given number of successes.
+        This method looks the value up in a cached table of cumulative sums of the PMF, which
+        gets built the first time it's needed. See :mod:`probcalc.tables`. Outside of that table,
+        it uses the identity :math:`P(X \leq k) = I_{1 - p}(n - k, k + 1)`, where :math:`I` is the
+        regularized incomplete beta function, so the cost doesn't grow with the number of trials.
 
         :param int successes: The number of successes to find the probability for
         :param bool strict: Whether to throw errors for invalid input, or return 0
@@ -111,24 +324,326 @@ class BinomialDistribution(Distribution):
         if successes == self._number_of_trials:
             return 1
 
-        # mypy expects this sum to have ints for some reason, so we ignore it
-        return sum(self.pmf(x) for x in range(successes + 1))  # type: ignore[misc]
+        table = self._pmf_table()
+        if table is not None and successes in table:
+            return table.cdf(successes)
+
+        return self._closed_form_cdf(successes)
+
+    def sf(self, successes: int, *, strict: bool = True) -> float:
+        r"""Return the probability that we get more than the given number of successes.
+
+        This is the survival function, :math:`P(X > k) = 1 - P(X \leq k)`, but it's calculated
+        directly, either from the cached table or as :math:`I_p(k + 1, n - k)`, so that small
+        upper tails don't lose their precision to the subtraction.
+
+        :param int successes: The number of successes to find the probability for
+        :param bool strict: Whether to throw errors for invalid input, or return 0
+        :returns float: The probability of getting more than this many successes
+
+        :raises NonsenseError: If the number of successes is outside the valid range
+        :raises NonsenseError: If the number of successes is not an integer
+        """
+        if self._check_nonsense(successes, strict=strict) is not None:
+            return 0
+
+        if successes == self._number_of_trials:
+            return 0
+
+        table = self._pmf_table()
+        if table is not None and successes in table:
+            return table.sf(successes)
+
+        return self._closed_form_sf(successes)
+
+    def logcdf(self, successes: int, *, strict: bool = True) -> float:
+        """Return the natural log of the probability that we get less than or equal to the given number of successes.
+
+        If the CDF is too small to take the log of, then the tail is summed in log space instead.
+
+        :param int successes: The number of successes to find the log probability for
+        :param bool strict: Whether to throw errors for invalid input, or return negative infinity
+        :returns float: The log of the probability of getting less than or equal to this many successes
+
+        :raises NonsenseError: If the number of successes is outside the valid range
+        :raises NonsenseError: If the number of successes is not an integer
+        """
+        if self._check_nonsense(successes, strict=strict) is not None:
+            return -math.inf
+
+        cdf = self.cdf(successes)
+        n = self._number_of_trials
+        p = self._probability
+
+        if cdf >= _LOG_CUTOFF or p in (0, 1):
+            return math.log(cdf) if cdf > 0 else -math.inf
+
+        odds = p / (1 - p)
+        return _log_tail_sum(self, self._logpmf(successes), lambda k: k / ((n - k + 1) * odds), successes, 0, -1)
+
+    def logsf(self, successes: int, *, strict: bool = True) -> float:
+        """Return the natural log of the probability that we get more than the given number of successes.
+
+        If the survival function is too small to take the log of, then the tail is summed in log space instead.
+
+        :param int successes: The number of successes to find the log probability for
+        :param bool strict: Whether to throw errors for invalid input, or return negative infinity
+        :returns float: The log of the probability of getting more than this many successes
+
+        :raises NonsenseError: If the number of successes is outside the valid range
+        :raises NonsenseError: If the number of successes is not an integer
+        """
+        if self._check_nonsense(successes, strict=strict) is not None:
+            return -math.inf
+
+        sf = self.sf(successes)
+        n = self._number_of_trials
+        p = self._probability
+
+        if sf >= _LOG_CUTOFF or p in (0, 1) or successes == n:
+            return math.log(sf) if sf > 0 else -math.inf
+
+        odds = p / (1 - p)
+        return _log_tail_sum(self, self._logpmf(successes + 1), lambda k: (n - k) / (k + 1) * odds, successes + 1, n, 1)
+
+    def _in_upper_tail(self, successes: float) -> bool:
+        """Check if the number of successes is above the mean."""
+        return successes > self._number_of_trials * self._probability
+
+    def ppf(self, probability: float, *, strict: bool = True) -> float:
+        """Return the smallest number of successes whose CDF is at least the given probability.
+
+        This is the inverse of :meth:`cdf`. It's a binary search of the cached table if possible,
+        and otherwise a short search with :meth:`cdf` that starts from the Cornish-Fisher approximation.
+
+        :param float probability: The probability, between 0 and 1
+        :param bool strict: Whether to throw errors for invalid input, or return NaN
+        :returns int: The smallest number of successes whose CDF is at least the probability
+
+        :raises NonsenseError: If the probability is not between 0 and 1
+        """
+        if self._check_probability(probability, strict=strict) is not None:
+            return math.nan
+
+        return self._quantile('cdf', probability)
+
+    def isf(self, probability: float, *, strict: bool = True) -> float:
+        """Return the smallest number of successes whose survival function is at most the given probability.
+
+        This is the inverse of :meth:`sf`. See :meth:`ppf`.
+
+        :param float probability: The probability, between 0 and 1
+        :param bool strict: Whether to throw errors for invalid input, or return NaN
+        :returns int: The smallest number of successes whose survival function is at most the probability
+
+        :raises NonsenseError: If the probability is not between 0 and 1
+        """
+        if self._check_probability(probability, strict=strict) is not None:
+            return math.nan
+
+        return self._quantile('sf', probability)
+
+    def _quantile(self, column: str, probability: float) -> float:
+        """Return :meth:`ppf` or :meth:`isf` for a valid probability."""
+        n = self._number_of_trials
+        p = self._probability
+        variance = n * p * (1 - p)
+
+        return _discrete_quantile(
+            self,
+            column,
+            probability,
+            maximum=n,
+            mean=n * p,
+            variance=variance,
+            skewness=(1 - 2 * p) / math.sqrt(variance) if variance > 0 else 0
+        )
+
+    def _closed_form_cdf(self, successes: int) -> float:
+        """Return the CDF with the incomplete beta function, for a valid number of successes below n."""
+        p = self._probability
+        return regularized_incomplete_beta(self._number_of_trials - successes, successes + 1, 1 - p, p)
+
+    def _closed_form_sf(self, successes: int) -> float:
+        """Return the survival function with the incomplete beta function, for a valid number of successes below n."""
+        return regularized_incomplete_beta(successes + 1, self._number_of_trials - successes, self._probability)
+
+    def _cdf_by_summation(self, successes: int) -> float:
+        """Return the CDF by summing the PMF from 0 to the given number of successes, with :meth:`_sum_pmf`.
+
+        This is exact up to floating point error, so it's kept as a reference.
+        """
+        return self._sum_pmf(0, successes)
+
+    def _pmf_table(self) -> PMFTable | None:
+        r"""Return the cached :class:`probcalc.tables.PMFTable` for this distribution, building it if needed.
+
+        The table is filled with the recurrence :math:`P(X = k + 1) = P(X = k) \frac{n - k}{k + 1} \frac{p}{q}`.
+        There's no table when the probability is 0 or 1, since only one value is possible.
+        """
+        n = self._number_of_trials
+        p = self._probability
+
+        if p in (0, 1):
+            return None
+
+        def build() -> PMFTable:
+            # The recurrence can't be None here, but mypy doesn't know that
+            mode, ratio = self._pmf_recurrence()  # type: ignore[misc]
+            from .tables import build_table
+
+            return build_table(
+                mode,
+                self.pmf(mode),
+                ratio,
+                minimum=0,
+                maximum=n,
+                lower_tail=lambda k: self._closed_form_cdf(k - 1),
+                upper_tail=self._closed_form_sf
+            )
+
+        table: PMFTable | None = _table_module().get_table(
+            self._table_key(), _expected_table_entries(n * p * (1 - p)), build
+        )
+        return table
+
+    def _pmf_recurrence(self) -> tuple[int, Callable[[int], float]] | None:
+        r"""Return the mode and the ratio :math:`\frac{P(X = k + 1)}{P(X = k)} = \frac{n - k}{k + 1} \frac{p}{q}`.
+
+        There's no recurrence when the probability is 0 or 1, since only one value is possible.
+        """
+        n = self._number_of_trials
+        p = self._probability
+
+        if p in (0, 1):
+            return None
+
+        odds = p / (1 - p)
+        return min(int((n + 1) * p), n), lambda k: (n - k) / (k + 1) * odds
+
+    def _table_key(self) -> tuple[str, int, float]:
+        """Return the key of the table for this distribution in :mod:`probcalc.tables`."""
+        return self.__class__.__name__, self._number_of_trials, self._probability
+
+    def _is_cheap(self, event: Event) -> bool:
+        """Check if the table for this distribution is small or already built, so the event is quick to calculate."""
+        n = self._number_of_trials
+        p = self._probability
+
+        entries = _expected_table_entries(n * p * (1 - p))
+        return entries <= _CHEAP_TABLE_ENTRIES or bool(_table_module().is_cached(self._table_key()))
+
+    def _sum_with(self, other: Distribution) -> Distribution | None:
+        """Return the binomial distribution with the total number of trials, if ``other`` has the same probability."""
+        if isinstance(other, BinomialDistribution) and other._probability == self._probability:
+            return BinomialDistribution(self._number_of_trials + other._number_of_trials, self._probability)
+
+        return None
+
+    def _sum_of_copies(self, n: int) -> BinomialDistribution:
+        """Return the binomial distribution with ``n`` times as many trials."""
+        return BinomialDistribution(n * self._number_of_trials, self._probability)
+
+    def _invalid_array(self, successes: FloatArray) -> BoolArray:
+        """Return a boolean array which is True wherever :meth:`_check_nonsense` would fail."""
+        import numpy as np
+
+        invalid: BoolArray = (successes < 0) | (successes > self._number_of_trials) | (successes != np.floor(successes))
+        return invalid
+
+    def pmf_array(self, successes: npt.ArrayLike, *, strict: bool = True) -> FloatArray:
+        """Return :meth:`pmf` for every element of an array of numbers of successes, in one vectorized pass.
+
+        :param successes: The numbers of successes to find the probabilities of
+        :param bool strict: Whether to throw errors for invalid input, or return 0 for those elements
+        :returns: An array of probabilities with the same shape as ``successes``
+
+        :raises NonsenseError: If any number of successes is outside the valid range
+        :raises NonsenseError: If any number of successes is not an integer
+        """
+        from . import vectorized
+
+        import numpy as np
+
+        k, invalid = self._validate_array(successes, strict=strict)
+        n = self._number_of_trials
+
+        log_pmf = vectorized.lgamma(n + 1) - vectorized.lgamma(k + 1) - vectorized.lgamma(n - k + 1) + \
+            vectorized.xlogy(k, self._probability) + vectorized.xlogy(n - k, 1 - self._probability)
+
+        return np.where(invalid, 0.0, np.exp(log_pmf))
+
+    def cdf_array(self, successes: npt.ArrayLike, *, strict: bool = True) -> FloatArray:
+        """Return :meth:`cdf` for every element of an array of numbers of successes, in one vectorized pass.
+
+        :param successes: The numbers of successes to find the probabilities for
+        :param bool strict: Whether to throw errors for invalid input, or return 0 for those elements
+        :returns: An array of probabilities with the same shape as ``successes``
+
+        :raises NonsenseError: If any number of successes is outside the valid range
+        :raises NonsenseError: If any number of successes is not an integer
+        """
+        from . import vectorized
+
+        import numpy as np
+
+        k, invalid = self._validate_array(successes, strict=strict)
+        n = self._number_of_trials
+        p = self._probability
 
-    def calculate(self, *, strict: bool = True) -> float:
+        def closed_form(values: FloatArray) -> FloatArray:
+            below_n = np.minimum(values, n - 1)
+            return vectorized.regularized_incomplete_beta(n - below_n, below_n + 1, 1 - p, p)
+
+        cdf = self._lookup_array('cdf', k, closed_form)
+        return np.where(invalid, 0.0, np.where(k == n, 1.0, cdf))
+
+    def sf_array(self, successes: npt.ArrayLike, *, strict: bool = True) -> FloatArray:
+        """Return :meth:`sf` for every element of an array of numbers of successes, in one vectorized pass.
+
+        :param successes: The numbers of successes to find the probabilities for
+        :param bool strict: Whether to throw errors for invalid input, or return 0 for those elements
+        :returns: An array of probabilities with the same shape as ``successes``
+
+        :raises NonsenseError: If any number of successes is outside the valid range
+        :raises NonsenseError: If any number of successes is not an integer
+        """
+        from . import vectorized
+
+        import numpy as np
+
+        k, invalid = self._validate_array(successes, strict=strict)
+        n = self._number_of_trials
+
+        def closed_form(values: FloatArray) -> FloatArray:
+            below_n = np.minimum(values, n - 1)
+            return vectorized.regularized_incomplete_beta(below_n + 1, n - below_n, self._probability)
+
+        sf = self._lookup_array('sf', k, closed_form)
+        return np.where(invalid | (k == n), 0.0, sf)
+
+    def _sample(self, rng: np.random.Generator, size: int | tuple[int, ...]) -> IntArray:
+        """Generate binomial random variates with :meth:`numpy.random.Generator.binomial`.
+
+        This uses the BTPE rejection algorithm when :math:`np` is large, and inversion otherwise.
+        """
+        return rng.binomial(self._number_of_trials, self._probability, size)
+
+    def _check_event(self, event: Event) -> None:
         """Check for nonsense in an edge case.
 
-        This method overrides :meth:`Distribution.calculate`. See that method for documentation.
+        This method overrides :meth:`Distribution._check_event`. See that method for documentation.
         """
-        if self.bounds.lower == (self._number_of_trials, False):
+        if event.bounds.lower == (self._number_of_trials, False):
             raise NonsenseError(f'Cannot have more successes (> {self._number_of_trials}) '
                                 f'than trials ({self._number_of_trials})')
 
-        return super().calculate(strict=strict)
-
 
 class PoissonDistribution(Distribution):
     """This is a Poisson distribution, used to model independent events that happen at a constant average rate."""
 
+    __slots__ = ('_rate', '_log_rate')
+
     def __init__(self, rate: float):
         """Construct a Poisson distribution with the given average rate of event occurrence."""
         if rate < 0:
@@ -137,6 +652,7 @@ class PoissonDistribution(Distribution):
         super().__init__(accepts_floats=False)
 
         self._rate = rate
+        self._log_rate = math.log(rate) if rate > 0 else -math.inf
 
     def __repr__(self) -> str:
         """Return a nice repr of the distribution."""
@@ -188,15 +704,39 @@ class PoissonDistribution(Distribution):
         if number == 0:
             return math.exp(-self._rate)
 
+        return math.exp(self._logpmf(number))
+
+    def logpmf(self, number: int, *, strict: bool = True) -> float:
+        """Return the natural log of the probability that we get a given number of occurrences.
+
+        This is calculated directly, so it doesn't underflow like ``log(pmf())`` can.
+
+        :param int number: The number of occurrences to find the log probability of
+        :param bool strict: Whether to throw errors for invalid input, or return negative infinity
+        :returns float: The log of the probability of getting exactly this many occurrences
+
+        :raises NonsenseError: If the number of occurrences is negative
+        :raises NonsenseError: If the number of occurrences is not an integer
+        """
+        if self._check_nonsense(number, strict=strict) is not None:
+            return -math.inf
+
+        return self._logpmf(number)
+
+    def _logpmf(self, number: int) -> float:
+        """Return the log PMF for a valid number of occurrences."""
         # This line is pure magic that I stole from the SciPy source code
         # https://github.com/scipy/scipy/blob/main/scipy/stats/_discrete_distns.py#L854-L860
-        log_pmf = number * math.log(self._rate) - math.lgamma(number + 1) - self._rate
-        return math.exp(log_pmf)
+        return _xlog(number, self._log_rate) - math.lgamma(number + 1) - self._rate
 
     def cdf(self, number: int, *, strict: bool = True) -> float:
-        """Return the probability that we get less than or equal to the given number of occurrences.
+        r"""Return the probability that we get less than or equal to the given number of occurrences.
 
-        This method just sums :meth:`pmf` from 0 to the given number of occurrences.
+        This method looks the value up in a cached table of cumulative sums of the PMF, which
+        gets built the first time it's needed. See :mod:`probcalc.tables`. Outside of that table,
+        it uses the identity :math:`P(X \leq k) = Q(k + 1, \lambda)`, where :math:`Q` is the
+        regularized upper incomplete gamma function, so the cost stays flat for large rates
+        and numbers of occurrences.
 
         :param int number: The number of occurrences to find the probability for
         :param bool strict: Whether to throw errors for invalid input, or return 0
@@ -208,12 +748,270 @@ class PoissonDistribution(Distribution):
         if self._check_nonsense(number, strict=strict) is not None:
             return 0
 
-        return sum(self.pmf(x) for x in range(number + 1))  # type: ignore[misc]
+        table = self._pmf_table()
+        if table is not None and number in table:
+            return table.cdf(number)
+
+        return regularized_upper_gamma(number + 1, self._rate)
+
+    def sf(self, number: int, *, strict: bool = True) -> float:
+        r"""Return the probability that we get more than the given number of occurrences.
+
+        This is the survival function, :math:`P(X > k) = 1 - P(X \leq k)`, but it's calculated
+        directly, either from the cached table or as :math:`P(k + 1, \lambda)`, the regularized
+        lower incomplete gamma function, so that small upper tails don't lose their precision
+        to the subtraction.
+
+        :param int number: The number of occurrences to find the probability for
+        :param bool strict: Whether to throw errors for invalid input, or return 0
+        :returns float: The probability of getting more than this many occurrences
+
+        :raises NonsenseError: If the number of occurrences is negative
+        :raises NonsenseError: If the number of occurrences is not an integer
+        """
+        if self._check_nonsense(number, strict=strict) is not None:
+            return 0
+
+        table = self._pmf_table()
+        if table is not None and number in table:
+            return table.sf(number)
+
+        return regularized_lower_gamma(number + 1, self._rate)
+
+    def logcdf(self, number: int, *, strict: bool = True) -> float:
+        """Return the natural log of the probability that we get less than or equal to the given number of occurrences.
+
+        If the CDF is too small to take the log of, then the tail is summed in log space instead.
+
+        :param int number: The number of occurrences to find the log probability for
+        :param bool strict: Whether to throw errors for invalid input, or return negative infinity
+        :returns float: The log of the probability of getting less than or equal to this many occurrences
+
+        :raises NonsenseError: If the number of occurrences is negative
+        :raises NonsenseError: If the number of occurrences is not an integer
+        """
+        if self._check_nonsense(number, strict=strict) is not None:
+            return -math.inf
+
+        cdf = self.cdf(number)
+        rate = self._rate
+
+        if cdf >= _LOG_CUTOFF or rate == 0:
+            return math.log(cdf) if cdf > 0 else -math.inf
+
+        return _log_tail_sum(self, self._logpmf(number), lambda k: k / rate, number, 0, -1)
+
+    def logsf(self, number: int, *, strict: bool = True) -> float:
+        """Return the natural log of the probability that we get more than the given number of occurrences.
+
+        If the survival function is too small to take the log of, then the tail is summed in log space instead.
+
+        :param int number: The number of occurrences to find the log probability for
+        :param bool strict: Whether to throw errors for invalid input, or return negative infinity
+        :returns float: The log of the probability of getting more than this many occurrences
+
+        :raises NonsenseError: If the number of occurrences is negative
+        :raises NonsenseError: If the number of occurrences is not an integer
+        """
+        if self._check_nonsense(number, strict=strict) is not None:
+            return -math.inf
+
+        sf = self.sf(number)
+        rate = self._rate
+
+        if sf >= _LOG_CUTOFF or rate == 0:
+            return math.log(sf) if sf > 0 else -math.inf
+
+        return _log_tail_sum(self, self._logpmf(number + 1), lambda k: rate / (k + 1), number + 1, None, 1)
+
+    def _in_upper_tail(self, number: float) -> bool:
+        """Check if the number of occurrences is above the mean."""
+        return number > self._rate
+
+    def ppf(self, probability: float, *, strict: bool = True) -> float:
+        """Return the smallest number of occurrences whose CDF is at least the given probability.
+
+        This is the inverse of :meth:`cdf`. It's a binary search of the cached table if possible,
+        and otherwise a short search with :meth:`cdf` that starts from the Cornish-Fisher approximation.
+
+        :param float probability: The probability, between 0 and 1
+        :param bool strict: Whether to throw errors for invalid input, or return NaN
+        :returns int: The smallest number of occurrences whose CDF is at least the probability, or infinity for 1
+
+        :raises NonsenseError: If the probability is not between 0 and 1
+        """
+        if self._check_probability(probability, strict=strict) is not None:
+            return math.nan
+
+        return self._quantile('cdf', probability)
+
+    def isf(self, probability: float, *, strict: bool = True) -> float:
+        """Return the smallest number of occurrences whose survival function is at most the given probability.
+
+        This is the inverse of :meth:`sf`. See :meth:`ppf`.
+
+        :param float probability: The probability, between 0 and 1
+        :param bool strict: Whether to throw errors for invalid input, or return NaN
+        :returns int: The smallest number of occurrences whose survival function is at most the probability,
+            or infinity for 0
+
+        :raises NonsenseError: If the probability is not between 0 and 1
+        """
+        if self._check_probability(probability, strict=strict) is not None:
+            return math.nan
+
+        return self._quantile('sf', probability)
+
+    def _quantile(self, column: str, probability: float) -> float:
+        """Return :meth:`ppf` or :meth:`isf` for a valid probability."""
+        rate = self._rate
+
+        return _discrete_quantile(
+            self,
+            column,
+            probability,
+            maximum=None,
+            mean=rate,
+            variance=rate,
+            skewness=1 / math.sqrt(rate) if rate > 0 else 0
+        )
+
+    def _sample(self, rng: np.random.Generator, size: int | tuple[int, ...]) -> IntArray:
+        """Generate Poisson random variates with :meth:`numpy.random.Generator.poisson`.
+
+        This uses the PTRS transformed rejection algorithm when the rate is at least 10, and multiplication otherwise.
+        """
+        return rng.poisson(self._rate, size)
+
+    def _pmf_table(self) -> PMFTable | None:
+        r"""Return the cached :class:`probcalc.tables.PMFTable` for this distribution, building it if needed.
+
+        The table is filled with the recurrence :math:`P(X = k + 1) = P(X = k) \frac{\lambda}{k + 1}`.
+        There's no table when the rate is 0, since only 0 is possible.
+        """
+        rate = self._rate
+
+        if rate == 0:
+            return None
+
+        def build() -> PMFTable:
+            # The recurrence can't be None here, but mypy doesn't know that
+            mode, ratio = self._pmf_recurrence()  # type: ignore[misc]
+            from .tables import build_table
+
+            return build_table(
+                mode,
+                self.pmf(mode),
+                ratio,
+                minimum=0,
+                maximum=None,
+                lower_tail=lambda k: regularized_upper_gamma(k, rate),
+                upper_tail=lambda k: regularized_lower_gamma(k + 1, rate)
+            )
+
+        table: PMFTable | None = _table_module().get_table(self._table_key(), _expected_table_entries(rate), build)
+        return table
+
+    def _pmf_recurrence(self) -> tuple[int, Callable[[int], float]] | None:
+        r"""Return the mode and the ratio :math:`\frac{P(X = k + 1)}{P(X = k)} = \frac{\lambda}{k + 1}`.
+
+        There's no recurrence when the rate is 0, since only 0 is possible.
+        """
+        rate = self._rate
+
+        if rate == 0:
+            return None
+
+        return int(rate), lambda k: rate / (k + 1)
+
+    def _table_key(self) -> tuple[str, float]:
+        """Return the key of the table for this distribution in :mod:`probcalc.tables`."""
+        return self.__class__.__name__, self._rate
+
+    def _is_cheap(self, event: Event) -> bool:
+        """Check if the table for this distribution is small or already built, so the event is quick to calculate."""
+        entries = _expected_table_entries(self._rate)
+        return entries <= _CHEAP_TABLE_ENTRIES or bool(_table_module().is_cached(self._table_key()))
+
+    def _sum_with(self, other: Distribution) -> Distribution | None:
+        """Return the Poisson distribution with the total rate, if ``other`` is also a Poisson distribution."""
+        if isinstance(other, PoissonDistribution):
+            return PoissonDistribution(self._rate + other._rate)
+
+        return None
+
+    def _sum_of_copies(self, n: int) -> PoissonDistribution:
+        """Return the Poisson distribution with ``n`` times the rate."""
+        return PoissonDistribution(n * self._rate)
+
+    def _invalid_array(self, numbers: FloatArray) -> BoolArray:
+        """Return a boolean array which is True wherever :meth:`_check_nonsense` would fail."""
+        import numpy as np
+
+        invalid: BoolArray = (numbers < 0) | (numbers != np.floor(numbers))
+        return invalid
+
+    def pmf_array(self, numbers: npt.ArrayLike, *, strict: bool = True) -> FloatArray:
+        """Return :meth:`pmf` for every element of an array of numbers of occurrences, in one vectorized pass.
+
+        :param numbers: The numbers of occurrences to find the probabilities of
+        :param bool strict: Whether to throw errors for invalid input, or return 0 for those elements
+        :returns: An array of probabilities with the same shape as ``numbers``
+
+        :raises NonsenseError: If any number of occurrences is negative
+        :raises NonsenseError: If any number of occurrences is not an integer
+        """
+        from . import vectorized
+
+        import numpy as np
+
+        k, invalid = self._validate_array(numbers, strict=strict)
+
+        log_pmf = vectorized.xlogy(k, self._rate) - vectorized.lgamma(k + 1) - self._rate
+        return np.where(invalid, 0.0, np.exp(log_pmf))
+
+    def cdf_array(self, numbers: npt.ArrayLike, *, strict: bool = True) -> FloatArray:
+        """Return :meth:`cdf` for every element of an array of numbers of occurrences, in one vectorized pass.
+
+        :param numbers: The numbers of occurrences to find the probabilities for
+        :param bool strict: Whether to throw errors for invalid input, or return 0 for those elements
+        :returns: An array of probabilities with the same shape as ``numbers``
+
+        :raises NonsenseError: If any number of occurrences is negative
+        :raises NonsenseError: If any number of occurrences is not an integer
+        """
+        from . import vectorized
+
+        import numpy as np
+
+        k, invalid = self._validate_array(numbers, strict=strict)
+        cdf = self._lookup_array('cdf', k, lambda values: vectorized.regularized_upper_gamma(values + 1, self._rate))
+        return np.where(invalid, 0.0, cdf)
+
+    def sf_array(self, numbers: npt.ArrayLike, *, strict: bool = True) -> FloatArray:
+        """Return :meth:`sf` for every element of an array of numbers of occurrences, in one vectorized pass.
+
+        :param numbers: The numbers of occurrences to find the probabilities for
+        :param bool strict: Whether to throw errors for invalid input, or return 0 for those elements
+        :returns: An array of probabilities with the same shape as ``numbers``
+
+        :raises NonsenseError: If any number of occurrences is negative
+        :raises NonsenseError: If any number of occurrences is not an integer
+        """
+        from . import vectorized
+
+        import numpy as np
+
+        k, invalid = self._validate_array(numbers, strict=strict)
+        sf = self._lookup_array('sf', k, lambda values: vectorized.regularized_lower_gamma(values + 1, self._rate))
+        return np.where(invalid, 0.0, sf)
 
 
 class NormalDistribution(Distribution):
     """A normal distribution with mean and standard deviation."""
 
+    __slots__ = ('_mean', '_std_dev', '_log_std_dev')
+
     def __init__(self, mean: float, std_dev: float):
         """Create a normal distribution with given mean and standard deviation.
 
@@ -229,24 +1027,37 @@ class NormalDistribution(Distribution):
 
         self._mean = mean
         self._std_dev = std_dev
+        self._log_std_dev = math.log(std_dev)
 
     def __repr__(self) -> str:
         """Return a nice repr of the distribution."""
         return f'N({self._mean}, {self._std_dev}²)'
 
-    def __lt__(self, other):
-        """Call :meth:`probcalc.distribution_classes.Distribution.__le__`.
-
-        This is because normal distributions don't distinguish strong/weak inequality.
+    def _combine(
+        self,
+        event: Event,
+        cdf: Callable[[int], float],
+        sf: Callable[[int], float],
+        pmf: Callable[[int], float]
+    ) -> float:
+        """Combine the CDF or survival function at the bounds of an event into its probability.
+
+        This method overrides :meth:`Distribution._combine`. Normal distributions don't distinguish
+        strong and weak inequalities, because the probability of any single value is 0, so every
+        inequality bound is treated as the one that doesn't need the PMF, however the event was made.
+        Equalities are left alone, so they still give the probability density.
         """
-        return super().__le__(other)
+        lower = event.bounds.lower
+        upper = event.bounds.upper
 
-    def __ge__(self, other):
-        """Call :meth:`probcalc.distribution_classes.Distribution.__gt__`.
+        if not (lower[0] is not None and lower == upper and lower[1]):
+            bounds = _Bounds(
+                lower if lower[0] is None else (lower[0], False),
+                upper if upper[0] is None else (upper[0], True)
+            )
+            event = Event(self, bounds, event.negated)
 
-        This is because normal distributions don't distinguish strong/weak inequality.
-        """
-        return super().__gt__(other)
+        return super()._combine(event, cdf, sf, pmf)
 
     def pmf(self, value: float, *, strict: bool = True) -> float:
         """Return the probability of getting the given value from this normal distribution.
@@ -259,28 +1070,206 @@ class NormalDistribution(Distribution):
         return math.exp(exponent) / (self._std_dev * ROOT_TWO_PI)
 
     def cdf(self, value: float, *, strict: bool = True) -> float:
-        r"""Return the probability that we get less than or equal to the given number of occurrences.
+        r"""Return the probability that we get less than or equal to the given value.
 
-        This method uses the formula :math:`\frac{1}{2}\left[1+\text{erf}\left(\frac{x}{\sqrt{2}}\right)\right]`
+        This method uses the formula :math:`\frac{1}{2}\text{erfc}\left(-\frac{z}{\sqrt{2}}\right)`, where
+        :math:`z` is the standardised value. This is the same as using :math:`\text{erf}`, but it doesn't
+        lose precision in the lower tail.
 
-        :param int value: The value to find the probability for
+        :param float value: The value to find the probability for
         :param bool strict: Whether to throw errors for invalid input, or return 0
         :returns float: The probability of getting less than or equal to this value
         """
-        return 0.5 * (1 + math.erf((value - self._mean) / (self._std_dev * ROOT_TWO)))
+        return 0.5 * math.erfc((self._mean - value) / (self._std_dev * ROOT_TWO))
 
+    def sf(self, value: float, *, strict: bool = True) -> float:
+        r"""Return the probability that we get more than the given value.
 
-class GeometricDistribution(Distribution):
-    """This is a geometric distribution, used to model situations where you want to know about the first success."""
+        This method uses the formula :math:`\frac{1}{2}\text{erfc}\left(\frac{z}{\sqrt{2}}\right)`, which
+        doesn't lose precision in the upper tail.
 
-    def __init__(self, probability: float) -> None:
-        """Construct a geometric distribution with the given probability of success."""
-        if not 0 <= probability <= 1:
-            raise NonsenseError(f'Geometric probability must be between 0 and 1, not {probability}')
+        :param float value: The value to find the probability for
+        :param bool strict: Whether to throw errors for invalid input, or return 0
+        :returns float: The probability of getting more than this value
+        """
+        return 0.5 * math.erfc((value - self._mean) / (self._std_dev * ROOT_TWO))
+
+    def logpmf(self, value: float, *, strict: bool = True) -> float:
+        """Return the natural log of the probability density at the given value.
+
+        :param float value: The value to find the log probability density of
+        :param bool strict: Whether to throw errors for invalid input, or return negative infinity
+        :returns float: The log of the probability density
+        """
+        z = (value - self._mean) / self._std_dev
+        return -0.5 * z * z - self._log_std_dev - LOG_ROOT_TWO_PI
+
+    def logcdf(self, value: float, *, strict: bool = True) -> float:
+        """Return the natural log of the probability that we get less than or equal to the given value.
+
+        See :func:`probcalc.utility.log_standard_normal_cdf`.
+
+        :param float value: The value to find the log probability for
+        :param bool strict: Whether to throw errors for invalid input, or return negative infinity
+        :returns float: The log of the probability of getting less than or equal to this value
+        """
+        return log_standard_normal_cdf((value - self._mean) / self._std_dev)
+
+    def logsf(self, value: float, *, strict: bool = True) -> float:
+        """Return the natural log of the probability that we get more than the given value.
+
+        This uses the symmetry of the normal distribution. See :func:`probcalc.utility.log_standard_normal_cdf`.
+
+        :param float value: The value to find the log probability for
+        :param bool strict: Whether to throw errors for invalid input, or return negative infinity
+        :returns float: The log of the probability of getting more than this value
+        """
+        return log_standard_normal_cdf((self._mean - value) / self._std_dev)
+
+    def _in_upper_tail(self, value: float) -> bool:
+        """Check if the value is above the mean."""
+        return value > self._mean
+
+    def _is_cheap(self, event: Event) -> bool:
+        """Return True, because the normal CDF is a closed form."""
+        return True
+
+    def _sum_with(self, other: Distribution) -> Distribution | None:
+        """Return the normal distribution with the total mean and variance, if ``other`` is also normal."""
+        if isinstance(other, NormalDistribution):
+            return NormalDistribution(self._mean + other._mean, math.hypot(self._std_dev, other._std_dev))
+
+        return None
+
+    def _sum_of_copies(self, n: int) -> NormalDistribution:
+        """Return the normal distribution with ``n`` times the mean and variance."""
+        return NormalDistribution(n * self._mean, math.sqrt(n) * self._std_dev)
+
+    def pmf_array(self, values: npt.ArrayLike, *, strict: bool = True) -> FloatArray:
+        """Return :meth:`pmf` for every element of an array of values, in one vectorized pass.
+
+        :param values: The values to find the probabilities of
+        :param bool strict: Whether to throw errors for invalid input, or return 0 for those elements
+        :returns: An array of probabilities with the same shape as ``values``
+        """
+        import numpy as np
+
+        x, _ = self._validate_array(values, strict=strict)
+        z = (x - self._mean) / self._std_dev
+
+        result: FloatArray = np.exp(-0.5 * z * z) / (self._std_dev * ROOT_TWO_PI)
+        return result
+
+    def cdf_array(self, values: npt.ArrayLike, *, strict: bool = True) -> FloatArray:
+        """Return :meth:`cdf` for every element of an array of values, in one vectorized pass.
+
+        :param values: The values to find the probabilities for
+        :param bool strict: Whether to throw errors for invalid input, or return 0 for those elements
+        :returns: An array of probabilities with the same shape as ``values``
+        """
+        from . import vectorized
+
+        x, _ = self._validate_array(values, strict=strict)
+        return vectorized.standard_normal_cdf((x - self._mean) / self._std_dev)
+
+    def sf_array(self, values: npt.ArrayLike, *, strict: bool = True) -> FloatArray:
+        """Return the probability of getting more than each value in an array, in one vectorized pass.
+
+        :param values: The values to find the probabilities for
+        :param bool strict: Whether to throw errors for invalid input, or return 0 for those elements
+        :returns: An array of probabilities with the same shape as ``values``
+        """
+        from . import vectorized
+
+        x, _ = self._validate_array(values, strict=strict)
+        return vectorized.standard_normal_cdf((self._mean - x) / self._std_dev)
+
+    def ppf(self, probability: float, *, strict: bool = True) -> float:
+        r"""Return the value whose CDF is the given probability.
+
+        This is :math:`\mu + \sigma \Phi^{-1}(p)`. See :func:`probcalc.utility.standard_normal_ppf`.
+
+        :param float probability: The probability, between 0 and 1
+        :param bool strict: Whether to throw errors for invalid input, or return NaN
+        :returns float: The value whose CDF is the probability
+
+        :raises NonsenseError: If the probability is not between 0 and 1
+        """
+        if self._check_probability(probability, strict=strict) is not None:
+            return math.nan
+
+        return self._mean + self._std_dev * standard_normal_ppf(probability)
+
+    def isf(self, probability: float, *, strict: bool = True) -> float:
+        r"""Return the value whose survival function is the given probability.
+
+        This is :math:`\mu - \sigma \Phi^{-1}(p)`, which uses the symmetry of the normal distribution.
+
+        :param float probability: The probability, between 0 and 1
+        :param bool strict: Whether to throw errors for invalid input, or return NaN
+        :returns float: The value whose survival function is the probability
+
+        :raises NonsenseError: If the probability is not between 0 and 1
+        """
+        if self._check_probability(probability, strict=strict) is not None:
+            return math.nan
+
+        return self._mean - self._std_dev * standard_normal_ppf(probability)
+
+    def ppf_array(self, probabilities: npt.ArrayLike, *, strict: bool = True) -> FloatArray:
+        """Return :meth:`ppf` for every element of an array of probabilities, in one vectorized pass.
+
+        :param probabilities: The probabilities to find the values for
+        :param bool strict: Whether to throw errors for invalid input, or return NaN for those elements
+        :returns: An array of values with the same shape as ``probabilities``
+
+        :raises NonsenseError: If any probability is not between 0 and 1
+        """
+        from . import vectorized
+
+        import numpy as np
+
+        q, invalid = self._validate_probabilities(probabilities, strict=strict)
+        return np.where(invalid, np.nan, self._mean + self._std_dev * vectorized.standard_normal_ppf(q))
+
+    def isf_array(self, probabilities: npt.ArrayLike, *, strict: bool = True) -> FloatArray:
+        """Return :meth:`isf` for every element of an array of probabilities, in one vectorized pass.
+
+        :param probabilities: The probabilities to find the values for
+        :param bool strict: Whether to throw errors for invalid input, or return NaN for those elements
+        :returns: An array of values with the same shape as ``probabilities``
+
+        :raises NonsenseError: If any probability is not between 0 and 1
+        """
+        from . import vectorized
+
+        import numpy as np
+
+        q, invalid = self._validate_probabilities(probabilities, strict=strict)
+        return np.where(invalid, np.nan, self._mean - self._std_dev * vectorized.standard_normal_ppf(q))
+
+    def _sample(self, rng: np.random.Generator, size: int | tuple[int, ...]) -> FloatArray:
+        """Generate normal random variates with :meth:`numpy.random.Generator.normal`, using the ziggurat method."""
+        return rng.normal(self._mean, self._std_dev, size)
+
+
+class GeometricDistribution(Distribution):
+    """This is a geometric distribution, used to model situations where you want to know about the first success."""
+
+    __slots__ = ('_probability', '_log_probability', '_log_complement')
+
+    _array_fill_value = 1
+
+    def __init__(self, probability: float) -> None:
+        """Construct a geometric distribution with the given probability of success."""
+        if not 0 <= probability <= 1:
+            raise NonsenseError(f'Geometric probability must be between 0 and 1, not {probability}')
 
         super().__init__(accepts_floats=False)
 
         self._probability = probability
+        self._log_probability = math.log(probability) if probability > 0 else -math.inf
+        self._log_complement = math.log1p(-probability) if probability < 1 else -math.inf
 
     def __repr__(self) -> str:
         """Return a nice repr of the distribution."""
@@ -349,3 +1338,656 @@ class GeometricDistribution(Distribution):
             return 0
 
         return 1 - (1 - self._probability) ** trials
+
+    def sf(self, trials: int, *, strict: bool = True) -> float:
+        r"""Return the probability that the first success occurs after the given number of trials.
+
+        This is the probability that every one of those trials fails, :math:`(1 - p)^x`.
+
+        :param int trials: The number of trials to find the probability for
+        :param bool strict: Whether to throw errors for invalid input, or return 0
+        :returns float: The probability of getting the first success after this many trials
+
+        :raises NonsenseError: If the number of trials is outside the valid range
+        :raises NonsenseError: If the number of trials is not an integer
+        """
+        if self._check_nonsense(trials, strict=strict) is not None:
+            return 0
+
+        return (1 - self._probability) ** trials
+
+    def logpmf(self, trial: int, *, strict: bool = True) -> float:
+        """Return the natural log of the probability that the first success happens on the given trial.
+
+        :param int trial: The number of the trial to find the log probability of
+        :param bool strict: Whether to throw errors for invalid input, or return negative infinity
+        :returns float: The log of the probability of getting the first success on this trial
+
+        :raises NonsenseError: If the number of trials is outside the valid range
+        :raises NonsenseError: If the number of trials is not an integer
+        """
+        if self._check_nonsense(trial, strict=strict) is not None:
+            return -math.inf
+
+        return self._log_probability + _xlog(trial - 1, self._log_complement)
+
+    def logcdf(self, trials: int, *, strict: bool = True) -> float:
+        """Return the natural log of the probability that the first success occurs at or sooner than the given trial.
+
+        This is calculated from :meth:`logsf`, without ever leaving log space.
+
+        :param int trials: The number of trials to find the log probability for
+        :param bool strict: Whether to throw errors for invalid input, or return negative infinity
+        :returns float: The log of the probability of getting the first success at or before this trial
+
+        :raises NonsenseError: If the number of trials is outside the valid range
+        :raises NonsenseError: If the number of trials is not an integer
+        """
+        if self._check_nonsense(trials, strict=strict) is not None:
+            return -math.inf
+
+        return _log1mexp(_xlog(trials, self._log_complement))
+
+    def logsf(self, trials: int, *, strict: bool = True) -> float:
+        """Return the natural log of the probability that the first success occurs after the given trial.
+
+        :param int trials: The number of trials to find the log probability for
+        :param bool strict: Whether to throw errors for invalid input, or return negative infinity
+        :returns float: The log of the probability of getting the first success after this trial
+
+        :raises NonsenseError: If the number of trials is outside the valid range
+        :raises NonsenseError: If the number of trials is not an integer
+        """
+        if self._check_nonsense(trials, strict=strict) is not None:
+            return -math.inf
+
+        return _xlog(trials, self._log_complement)
+
+    def _in_upper_tail(self, trials: float) -> bool:
+        """Check if the number of trials is above the mean."""
+        return self._probability > 0 and trials * self._probability > 1
+
+    def _is_cheap(self, event: Event) -> bool:
+        """Return True, because the geometric CDF is a closed form."""
+        return True
+
+    def _pmf_recurrence(self) -> tuple[int, Callable[[int], float]] | None:
+        """Return the mode, which is always the first trial, and the constant ratio :math:`1 - p`.
+
+        There's no recurrence when the probability is 0, since the first success never happens.
+        """
+        if self._probability == 0:
+            return None
+
+        complement = 1 - self._probability
+        return 1, lambda k: complement
+
+    def _invalid_array(self, trials: FloatArray) -> BoolArray:
+        """Return a boolean array which is True wherever :meth:`_check_nonsense` would fail."""
+        import numpy as np
+
+        invalid: BoolArray = (trials <= 0) | (trials != np.floor(trials))
+        return invalid
+
+    def pmf_array(self, trials: npt.ArrayLike, *, strict: bool = True) -> FloatArray:
+        """Return :meth:`pmf` for every element of an array of trial numbers, in one vectorized pass.
+
+        :param trials: The trial numbers to find the probabilities of
+        :param bool strict: Whether to throw errors for invalid input, or return 0 for those elements
+        :returns: An array of probabilities with the same shape as ``trials``
+
+        :raises NonsenseError: If any number of trials is outside the valid range
+        :raises NonsenseError: If any number of trials is not an integer
+        """
+        import numpy as np
+
+        x, invalid = self._validate_array(trials, strict=strict)
+        return np.where(invalid, 0.0, self._probability * (1 - self._probability) ** (x - 1))
+
+    def cdf_array(self, trials: npt.ArrayLike, *, strict: bool = True) -> FloatArray:
+        """Return :meth:`cdf` for every element of an array of trial numbers, in one vectorized pass.
+
+        :param trials: The trial numbers to find the probabilities for
+        :param bool strict: Whether to throw errors for invalid input, or return 0 for those elements
+        :returns: An array of probabilities with the same shape as ``trials``
+
+        :raises NonsenseError: If any number of trials is outside the valid range
+        :raises NonsenseError: If any number of trials is not an integer
+        """
+        import numpy as np
+
+        x, invalid = self._validate_array(trials, strict=strict)
+        return np.where(invalid, 0.0, 1 - (1 - self._probability) ** x)
+
+    def sf_array(self, trials: npt.ArrayLike, *, strict: bool = True) -> FloatArray:
+        """Return the probability that the first success comes after each trial number in an array.
+
+        :param trials: The trial numbers to find the probabilities for
+        :param bool strict: Whether to throw errors for invalid input, or return 0 for those elements
+        :returns: An array of probabilities with the same shape as ``trials``
+
+        :raises NonsenseError: If any number of trials is outside the valid range
+        :raises NonsenseError: If any number of trials is not an integer
+        """
+        import numpy as np
+
+        x, invalid = self._validate_array(trials, strict=strict)
+        return np.where(invalid, 0.0, (1 - self._probability) ** x)
+
+    def ppf(self, probability: float, *, strict: bool = True) -> float:
+        r"""Return the smallest number of trials whose CDF is at least the given probability.
+
+        This uses the closed form :math:`\left\lceil \frac{\ln(1 - q)}{\ln(1 - p)} \right\rceil`,
+        and then checks it against :meth:`cdf` in case of rounding errors.
+
+        :param float probability: The probability, between 0 and 1
+        :param bool strict: Whether to throw errors for invalid input, or return NaN
+        :returns int: The smallest number of trials whose CDF is at least the probability, or infinity
+
+        :raises NonsenseError: If the probability is not between 0 and 1
+        """
+        if self._check_probability(probability, strict=strict) is not None:
+            return math.nan
+
+        p = self._probability
+
+        if probability == 0 or p == 1:
+            return 1
+
+        if probability == 1 or p == 0:
+            return math.inf
+
+        trials = max(math.ceil(math.log1p(-probability) / self._log_complement), 1)
+
+        while trials > 1 and self.cdf(trials - 1) >= probability:
+            trials -= 1
+
+        while self.cdf(trials) < probability:
+            trials += 1
+
+        return trials
+
+    def isf(self, probability: float, *, strict: bool = True) -> float:
+        r"""Return the smallest number of trials whose survival function is at most the given probability.
+
+        The survival function is :math:`(1 - p)^x`, so this uses the closed form
+        :math:`\left\lceil \frac{\ln q}{\ln(1 - p)} \right\rceil`, and then checks it for rounding errors.
+
+        :param float probability: The probability, between 0 and 1
+        :param bool strict: Whether to throw errors for invalid input, or return NaN
+        :returns int: The smallest number of trials whose survival function is at most the probability, or infinity
+
+        :raises NonsenseError: If the probability is not between 0 and 1
+        """
+        if self._check_probability(probability, strict=strict) is not None:
+            return math.nan
+
+        p = self._probability
+
+        if probability == 1 or p == 1:
+            return 1
+
+        if probability == 0 or p == 0:
+            return math.inf
+
+        trials = max(math.ceil(math.log(probability) / self._log_complement), 1)
+
+        while trials > 1 and (1 - p) ** (trials - 1) <= probability:
+            trials -= 1
+
+        while (1 - p) ** trials > probability:
+            trials += 1
+
+        return trials
+
+    def ppf_array(self, probabilities: npt.ArrayLike, *, strict: bool = True) -> FloatArray:
+        """Return :meth:`ppf` for every element of an array of probabilities, in one vectorized pass.
+
+        :param probabilities: The probabilities to find the numbers of trials for
+        :param bool strict: Whether to throw errors for invalid input, or return NaN for those elements
+        :returns: An array of numbers of trials with the same shape as ``probabilities``
+
+        :raises NonsenseError: If any probability is not between 0 and 1
+        """
+        import numpy as np
+
+        q, invalid = self._validate_probabilities(probabilities, strict=strict)
+        p = self._probability
+
+        if p == 1:
+            trials = np.ones_like(q)
+        elif p == 0:
+            trials = np.where(q == 0, 1.0, np.inf)
+        else:
+            with np.errstate(divide='ignore'):
+                trials = np.maximum(np.ceil(np.log1p(-q) / self._log_complement), 1)
+
+            # The logarithms can be off by one in either direction, so check against the CDF
+            finite = np.isfinite(trials)
+            trials = np.where(finite & (trials > 1) & (1 - (1 - p) ** (trials - 1) >= q), trials - 1, trials)
+            trials = np.where(finite & (1 - (1 - p) ** trials < q), trials + 1, trials)
+
+        return np.where(invalid, np.nan, trials)
+
+    def isf_array(self, probabilities: npt.ArrayLike, *, strict: bool = True) -> FloatArray:
+        """Return :meth:`isf` for every element of an array of probabilities, in one vectorized pass.
+
+        :param probabilities: The probabilities to find the numbers of trials for
+        :param bool strict: Whether to throw errors for invalid input, or return NaN for those elements
+        :returns: An array of numbers of trials with the same shape as ``probabilities``
+
+        :raises NonsenseError: If any probability is not between 0 and 1
+        """
+        import numpy as np
+
+        q, invalid = self._validate_probabilities(probabilities, strict=strict)
+        p = self._probability
+
+        if p == 1:
+            trials = np.ones_like(q)
+        elif p == 0:
+            trials = np.where(q == 1, 1.0, np.inf)
+        else:
+            with np.errstate(divide='ignore'):
+                trials = np.maximum(np.ceil(np.log(q) / self._log_complement), 1)
+
+            finite = np.isfinite(trials)
+            trials = np.where(finite & (trials > 1) & ((1 - p) ** (trials - 1) <= q), trials - 1, trials)
+            trials = np.where(finite & ((1 - p) ** trials > q), trials + 1, trials)
+
+        return np.where(invalid, np.nan, trials)
+
+    def _sample(self, rng: np.random.Generator, size: int | tuple[int, ...]) -> IntArray:
+        """Generate geometric random variates by inversion. See :func:`probcalc.sampling.geometric`.
+
+        :raises NonsenseError: If the probability is 0, since the first success never happens
+        """
+        from . import sampling
+
+        if self._probability == 0:
+            raise NonsenseError('Cannot sample from a geometric distribution with probability 0')
+
+        return sampling.geometric(rng, self._probability, size)
+
+
+def _pmf_window(distribution: Distribution) -> tuple[int, Sequence[float]]:
+    """Return the first value and the PMF values of a window covering every value with non-negligible probability.
+
+    This is the cached table of the distribution if it has one, or the PMF from :meth:`ppf` to :meth:`isf` of
+    :data:`probcalc.tables.NEGLIGIBLE` otherwise, which must both be finite.
+    """
+    from .tables import NEGLIGIBLE
+
+    table = distribution._pmf_table()
+    if table is not None:
+        return table.start, table.probabilities
+
+    start = int(distribution.ppf(NEGLIGIBLE))
+    stop = int(distribution.isf(NEGLIGIBLE))
+    return start, [distribution.pmf(k) for k in range(start, stop + 1)]
+
+
+class SumDistribution(Distribution):
+    """The distribution of a sum of independent discrete random variables, when it has no closed form.
+
+    Sums are normally made by adding distributions, like ``Geo(0.2) + Geo(0.3)`` or ``sum(distributions)``,
+    or with :func:`sum_iid`, rather than by constructing this class directly. Each term of the sum is a distinct
+    distribution and how many independent copies of it are in the sum. The PMF is a table built by convolving
+    the tables of the terms with :mod:`probcalc.convolution`, which is cached like the tables of other discrete
+    distributions, so every calculation after the first one is just a lookup.
+    """
+
+    __slots__ = ('_terms', '_minimum', '_maximum', '_expected_entries', '_array_fill_value')
+
+    def __init__(self, terms: tuple[tuple[Distribution, int], ...]):
+        """Construct the distribution of a sum from its terms, which are pairs of a discrete distribution and a count.
+
+        :raises NonsenseError: If there are no terms, or any distribution is continuous, or any count isn't positive
+        :raises NonsenseError: If any distribution never takes a finite value, like ``Geo(0)``
+        """
+        from .tables import NEGLIGIBLE
+
+        if not terms:
+            raise NonsenseError('Cannot have a sum with no terms')
+
+        for distribution, count in terms:
+            if distribution._accepts_floats or isinstance(distribution, SumDistribution):
+                raise NonsenseError(f'Cannot have {distribution!r} as a term of a sum')
+
+            if not isinstance(count, int) or count < 1:
+                raise NonsenseError(f'Cannot add up {count} copies of {distribution!r}')
+
+            if math.isinf(distribution.ppf(NEGLIGIBLE)):
+                raise NonsenseError(f'Cannot add {distribution!r}, because it never takes a finite value')
+
+        super().__init__(accepts_floats=False)
+
+        self._terms = terms
+
+        # The support of each term runs from its PPF at 0 to its PPF at 1
+        self._minimum = sum(count * int(distribution.ppf(0)) for distribution, count in terms)
+
+        maxima = [count * distribution.ppf(1) for distribution, count in terms]
+        self._maximum = None if any(map(math.isinf, maxima)) else int(sum(maxima))
+        self._array_fill_value = self._minimum
+
+        # The window of a sum grows like its standard deviation, so like the root of the sum of squared widths
+        squared_widths = [
+            count * (distribution.isf(NEGLIGIBLE) - distribution.ppf(NEGLIGIBLE) + 1) ** 2
+            for distribution, count in terms
+        ]
+        self._expected_entries = int(math.sqrt(sum(squared_widths))) + 1
+
+    def __repr__(self) -> str:
+        """Return a nice repr of the distribution, like ``Geo(0.2) + sum_iid(Geo(0.3), 4)``."""
+        return ' + '.join(
+            repr(distribution) if count == 1 else f'sum_iid({distribution!r}, {count})'
+            for distribution, count in self._terms
+        )
+
+    @property
+    def terms(self) -> tuple[tuple[Distribution, int], ...]:
+        """The distinct distributions in the sum, each with how many independent copies of it are added."""
+        return self._terms
+
+    def _check_nonsense(self, value: int, *, strict: bool) -> Literal[None, -1]:
+        """Check if the given value is nonsense.
+
+        :param int value: The value to check
+        :param bool strict: Whether to throw errors or just return -1
+        :returns: None on success, -1 on fail
+        :rtype: Literal[None, -1]
+
+        :raises NonsenseError: If the value is outside the support of the sum
+        :raises NonsenseError: If the value is not an integer
+        """
+        if value < self._minimum:
+            if strict:
+                raise NonsenseError(f'Cannot have a sum ({value}) less than the smallest possible ({self._minimum})')
+
+            return -1
+
+        if self._maximum is not None and value > self._maximum:
+            if strict:
+                raise NonsenseError(f'Cannot have a sum ({value}) more than the largest possible ({self._maximum})')
+
+            return -1
+
+        if value != int(value):
+            if strict:
+                raise NonsenseError(f'Cannot ask probability of a sum of {value}')
+
+            return -1
+
+        return None
+
+    def _pmf_table(self) -> PMFTable:
+        """Return the cached :class:`probcalc.tables.PMFTable` for this distribution, building it if needed.
+
+        The table is the convolution of the tables of the terms. It's always needed, so if it's too big
+        for the memory budget of the cache, then it's built without being cached.
+        """
+        def build() -> PMFTable:
+            from . import convolution
+
+            start, pmf = convolution.convolve(
+                (*_pmf_window(distribution), count) for distribution, count in self._terms
+            )
+            from .tables import PMFTable
+
+            return PMFTable(start, pmf, 0.0, 0.0)
+
+        table: PMFTable | None = _table_module().get_table(self._table_key(), self._expected_entries, build)
+        return table if table is not None else build()
+
+    def _table_key(self) -> tuple[str, str]:
+        """Return the key of the table for this distribution in :mod:`probcalc.tables`."""
+        return self.__class__.__name__, repr(self)
+
+    def _is_cheap(self, event: Event) -> bool:
+        """Check if the table for this distribution is already built, so the event is quick to calculate."""
+        return bool(_table_module().is_cached(self._table_key()))
+
+    def _in_upper_tail(self, value: float) -> bool:
+        """Check if the value is above the median."""
+        table = self._pmf_table()
+        return value > table.stop or (value in table and table.cdf(int(value)) > 0.5)
+
+    def pmf(self, value: int, *, strict: bool = True) -> float:
+        """Return the probability that the sum is the given value.
+
+        :param int value: The value to find the probability of
+        :param bool strict: Whether to throw errors for invalid input, or return 0
+        :returns float: The probability of the sum being this value
+
+        :raises NonsenseError: If the value is outside the support of the sum
+        :raises NonsenseError: If the value is not an integer
+        """
+        if self._check_nonsense(value, strict=strict) is not None:
+            return 0
+
+        table = self._pmf_table()
+        return table.pmf(value) if value in table else 0.0
+
+    def cdf(self, value: int, *, strict: bool = True) -> float:
+        """Return the probability that the sum is less than or equal to the given value.
+
+        :param int value: The value to find the probability for
+        :param bool strict: Whether to throw errors for invalid input, or return 0
+        :returns float: The probability of the sum being less than or equal to this value
+
+        :raises NonsenseError: If the value is outside the support of the sum
+        :raises NonsenseError: If the value is not an integer
+        """
+        if self._check_nonsense(value, strict=strict) is not None:
+            return 0
+
+        table = self._pmf_table()
+        if value in table:
+            return table.cdf(value)
+
+        return 0.0 if value < table.start else 1.0
+
+    def sf(self, value: int, *, strict: bool = True) -> float:
+        """Return the probability that the sum is more than the given value.
+
+        :param int value: The value to find the probability for
+        :param bool strict: Whether to throw errors for invalid input, or return 0
+        :returns float: The probability of the sum being more than this value
+
+        :raises NonsenseError: If the value is outside the support of the sum
+        :raises NonsenseError: If the value is not an integer
+        """
+        if self._check_nonsense(value, strict=strict) is not None:
+            return 0
+
+        table = self._pmf_table()
+        if value in table:
+            return table.sf(value)
+
+        return 1.0 if value < table.start else 0.0
+
+    def ppf(self, probability: float, *, strict: bool = True) -> float:
+        """Return the smallest value whose CDF is at least the given probability, with a binary search of the table.
+
+        :param float probability: The probability, between 0 and 1
+        :param bool strict: Whether to throw errors for invalid input, or return NaN
+        :returns: The smallest value whose CDF is at least the probability, or infinity
+
+        :raises NonsenseError: If the probability is not between 0 and 1
+        """
+        if self._check_probability(probability, strict=strict) is not None:
+            return math.nan
+
+        if probability == 0:
+            return self._minimum
+
+        if probability == 1:
+            return math.inf if self._maximum is None else self._maximum
+
+        table = self._pmf_table()
+        found = table.ppf(probability)
+
+        # Only probabilities within rounding error of 1 are above the window
+        return found if found is not None else table.stop
+
+    def isf(self, probability: float, *, strict: bool = True) -> float:
+        """Return the smallest value whose survival function is at most the given probability, like :meth:`ppf`.
+
+        :param float probability: The probability, between 0 and 1
+        :param bool strict: Whether to throw errors for invalid input, or return NaN
+        :returns: The smallest value whose survival function is at most the probability, or infinity
+
+        :raises NonsenseError: If the probability is not between 0 and 1
+        """
+        if self._check_probability(probability, strict=strict) is not None:
+            return math.nan
+
+        if probability == 1:
+            return self._minimum
+
+        if probability == 0:
+            return math.inf if self._maximum is None else self._maximum
+
+        table = self._pmf_table()
+        found = table.isf(probability)
+        return found if found is not None else table.start
+
+    def _invalid_array(self, values: FloatArray) -> BoolArray:
+        """Return a boolean array which is True wherever :meth:`_check_nonsense` would fail."""
+        import numpy as np
+
+        invalid: BoolArray = (values < self._minimum) | (values != np.floor(values))
+
+        if self._maximum is not None:
+            invalid |= values > self._maximum
+
+        return invalid
+
+    def pmf_array(self, values: npt.ArrayLike, *, strict: bool = True) -> FloatArray:
+        """Return :meth:`pmf` for every element of an array of values, by looking them up in the table.
+
+        :param values: The values to find the probabilities of
+        :param bool strict: Whether to throw errors for invalid input, or return 0 for those elements
+        :returns: An array of probabilities with the same shape as ``values``
+
+        :raises NonsenseError: If any value is outside the support of the sum
+        :raises NonsenseError: If any value is not an integer
+        """
+        import numpy as np
+
+        k, invalid = self._validate_array(values, strict=strict)
+        pmf = self._lookup_array('pmf', k, np.zeros_like)
+        return np.where(invalid, 0.0, pmf)
+
+    def cdf_array(self, values: npt.ArrayLike, *, strict: bool = True) -> FloatArray:
+        """Return :meth:`cdf` for every element of an array of values, by looking them up in the table.
+
+        :param values: The values to find the probabilities for
+        :param bool strict: Whether to throw errors for invalid input, or return 0 for those elements
+        :returns: An array of probabilities with the same shape as ``values``
+
+        :raises NonsenseError: If any value is outside the support of the sum
+        :raises NonsenseError: If any value is not an integer
+        """
+        import numpy as np
+
+        k, invalid = self._validate_array(values, strict=strict)
+        start = self._pmf_table().start
+        cdf = self._lookup_array('cdf', k, lambda outside: np.where(outside < start, 0.0, 1.0))
+        return np.where(invalid, 0.0, cdf)
+
+    def sf_array(self, values: npt.ArrayLike, *, strict: bool = True) -> FloatArray:
+        """Return :meth:`sf` for every element of an array of values, by looking them up in the table.
+
+        :param values: The values to find the probabilities for
+        :param bool strict: Whether to throw errors for invalid input, or return 0 for those elements
+        :returns: An array of probabilities with the same shape as ``values``
+
+        :raises NonsenseError: If any value is outside the support of the sum
+        :raises NonsenseError: If any value is not an integer
+        """
+        import numpy as np
+
+        k, invalid = self._validate_array(values, strict=strict)
+        start = self._pmf_table().start
+        sf = self._lookup_array('sf', k, lambda outside: np.where(outside < start, 1.0, 0.0))
+        return np.where(invalid, 0.0, sf)
+
+
+def _sum_terms(terms: Iterable[tuple[Distribution, int]]) -> Distribution | None:
+    """Return the distribution of a sum of independent random variables, using closed forms wherever possible.
+
+    Sums are flattened, copies of the same distribution are counted together, and then each distribution
+    is combined with :meth:`probcalc.distribution_classes.Distribution._sum_of_copies` and
+    :meth:`probcalc.distribution_classes.Distribution._sum_with` if it can be. Whatever's left is a
+    :class:`SumDistribution`, with its terms sorted so that the order of the sum doesn't matter.
+
+    :param terms: Pairs of a distribution and how many independent copies of it are in the sum
+    :returns: The distribution of the sum, or None if it has continuous terms with no closed form
+    """
+    # Distributions can't be compared with == because that makes an event, so they're keyed by type and parameters
+    counts: dict[tuple[type, tuple[Any, ...]], tuple[Distribution, int]] = {}
+
+    for distribution, count in terms:
+        flattened = [(term, n * count) for term, n in distribution.terms] \
+            if isinstance(distribution, SumDistribution) else [(distribution, count)]
+
+        for term, n in flattened:
+            key = (term.__class__, term.parameters)
+            counts[key] = (term, counts[key][1] + n) if key in counts else (term, n)
+
+    combined: list[tuple[Distribution, int]] = []
+
+    for distribution, count in counts.values():
+        if count > 1 and (copies := distribution._sum_of_copies(count)) is not None:
+            distribution, count = copies, 1
+
+        if count == 1:
+            for i, (other, other_count) in enumerate(combined):
+                if other_count == 1:
+                    total = other._sum_with(distribution)
+
+                    if total is None:
+                        total = distribution._sum_with(other)
+
+                    if total is not None:
+                        combined[i] = (total, 1)
+                        break
+
+            else:
+                combined.append((distribution, count))
+
+        else:
+            combined.append((distribution, count))
+
+    if len(combined) == 1 and combined[0][1] == 1:
+        return combined[0][0]
+
+    if any(distribution._accepts_floats for distribution, _ in combined):
+        return None
+
+    return SumDistribution(tuple(sorted(combined, key=lambda term: repr(term[0]))))
+
+
+def sum_iid(distribution: Distribution, n: int) -> Distribution:
+    r"""Return the distribution of the sum of ``n`` independent random variables from the given distribution.
+
+    This uses a closed form if there is one, like ``sum_iid(Po(3), 10) is Po(30)``. Otherwise, it's a
+    :class:`SumDistribution`, whose table is found with about :math:`\log_2 n` convolutions by repeated squaring.
+
+    :param Distribution distribution: The distribution of each random variable
+    :param int n: The number of random variables
+    :returns Distribution: The distribution of the sum
+
+    :raises NonsenseError: If ``n`` isn't a positive integer, or the sum has no closed form and can't be convolved
+    """
+    if not isinstance(n, int) or n < 1:
+        raise NonsenseError(f'Cannot add up {n} random variables')
+
+    total = _sum_terms([(distribution, n)])
+
+    if total is None:
+        raise NonsenseError(f'Cannot find the distribution of a sum of {distribution!r}, because it is continuous')
+
+    return total
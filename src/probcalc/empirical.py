@@ -0,0 +1,519 @@
+# probcalc - Calculate probabilities for distributions
+# Copyright (C) 2022 D. Dyson (DoctorDalek1963)
+
+# This program is licensed under GNU GPLv3, available here:
+# <https://www.gnu.org/licenses/gpl-3.0.html>
+
+"""A module for empirical distributions of observed data, which can be used with ``P()`` like any other distribution.
+
+An :class:`EmpiricalDistribution` stores its samples as a sorted array of the distinct values and
+the cumulative count of samples up to each one. This is a lossless compression of the sorted array
+of samples, so every PMF, CDF, and survival function is one binary search with :func:`numpy.searchsorted`,
+and the counts are exact integers, so the tails don't lose any precision.
+
+Big datasets can be built up from a stream of chunks with :class:`EmpiricalBuilder`, which merges each
+chunk into the distinct values as it goes. With ``max_values``, it switches to a histogram whenever there
+would be more distinct values than that, rounding every sample down to a multiple of a bin width, which
+is a power of 2 that doubles as needed. That keeps the memory bounded, however many distinct values there
+are, at the cost of only knowing which bin each sample is in.
+
+NumPy is needed for this module. Install it with ``pip install probcalc[numpy]``.
+
+:Example:
+
+>>> from probcalc import P
+>>> from probcalc.empirical import EmpiricalDistribution
+>>> E = EmpiricalDistribution([3, 1, 4, 1, 5, 9, 2, 6, 5, 3, 5])
+>>> E
+Empirical(11 samples, 7 values)
+>>> P(E > 4)
+0.4545454545
+>>> P(E == 5)
+0.2727272727
+"""
+
+from __future__ import annotations
+
+import math
+from typing import TYPE_CHECKING, Iterable, Literal
+
+try:
+    import numpy as np
+    import numpy.typing as npt
+
+except ImportError as e:  # pragma: no cover
+    raise ImportError(
+        'NumPy is needed for empirical distributions. Install it with `pip install probcalc[numpy]`'
+    ) from e
+
+from .distribution_classes import Distribution, Event, NonsenseError
+
+if TYPE_CHECKING:
+    from .sampling import IntArray
+    from .vectorized import BoolArray, FloatArray
+
+
+def _aggregate(values: npt.NDArray[np.generic], counts: IntArray) -> tuple[npt.NDArray[np.generic], IntArray]:
+    """Combine the counts of equal values, which must be sorted, so that each value only appears once."""
+    if len(values) == 0:
+        return values, counts
+
+    starts = np.flatnonzero(np.concatenate(([True], values[1:] != values[:-1])))
+    return values[starts], np.add.reduceat(counts, starts)
+
+
+def _round_down(values: npt.NDArray[np.generic], bin_width: float) -> npt.NDArray[np.generic]:
+    """Round values down to multiples of the bin width, keeping integers as integers."""
+    if values.dtype.kind in 'iu':
+        return values // int(bin_width) * int(bin_width)
+
+    rounded: npt.NDArray[np.generic] = np.floor(values.astype(np.float64) / bin_width) * bin_width
+    return rounded
+
+
+def _as_samples(
+    samples: npt.ArrayLike,
+    counts: npt.ArrayLike | None
+) -> tuple[npt.NDArray[np.generic], IntArray]:
+    """Check some samples and their counts, and return them as flat arrays, sorted by value.
+
+    :raises NonsenseError: If the samples aren't numbers, or any is NaN, or the counts don't match the samples
+    """
+    values = np.ravel(np.asarray(samples))
+
+    if values.dtype.kind not in 'iuf':
+        raise NonsenseError(f'Samples must be numbers, not {values.dtype}')
+
+    if values.dtype.kind == 'f' and np.isnan(values).any():
+        raise NonsenseError('Cannot have NaN as a sample')
+
+    if counts is None:
+        weights = np.ones(len(values), dtype=np.int64)
+    else:
+        weights = np.ravel(np.asarray(counts))
+
+        if weights.shape != values.shape:
+            raise NonsenseError(f'Cannot have {len(weights)} counts for {len(values)} samples')
+
+        if weights.dtype.kind not in 'iu' or (weights < 0).any():
+            raise NonsenseError('Counts must be non-negative integers')
+
+        weights = weights.astype(np.int64)
+
+    order = np.argsort(values, kind='stable')
+    return values[order], weights[order]
+
+
+class EmpiricalDistribution(Distribution):
+    """The distribution of some observed data, which picks one of the samples uniformly at random.
+
+    The samples can be integers, in which case the distribution is discrete, or floats, in which case
+    it can also be compared with floats. Either way, the probability of any value is the fraction of the
+    samples equal to it, so ``E < x`` and ``E <= x`` are different, unlike for a normal distribution.
+
+    Empirical distributions aren't interned, since their samples are arrays, which can't be hashed.
+    """
+
+    __slots__ = ('_values', '_cumulative', '_total', '_bin_width')
+
+    _values: npt.NDArray[np.generic]
+    """The distinct values of the samples, in increasing order."""
+
+    _cumulative: IntArray
+    """The number of samples less than or equal to each value, with an extra 0 at the start."""
+
+    def __init__(self, samples: npt.ArrayLike, counts: npt.ArrayLike | None = None, bin_width: float = 0):
+        """Create an empirical distribution from some samples.
+
+        :param samples: The samples, which are ints or floats
+        :param counts: How many times each sample was observed, or None if each was observed once
+        :param float bin_width: If this isn't 0, then every sample is rounded down to a multiple of it
+
+        :raises NonsenseError: If there are no samples, or any sample is NaN
+        :raises NonsenseError: If the counts aren't non-negative integers, one for each sample
+        :raises NonsenseError: If the bin width is negative
+        """
+        if bin_width < 0:
+            raise NonsenseError(f'Cannot have negative bin width ({bin_width})')
+
+        values, weights = _as_samples(samples, counts)
+
+        if bin_width:
+            values = _round_down(values, bin_width)
+
+        values, weights = _aggregate(values, weights)
+
+        # Values that were never observed would break the binary searches of the PMF
+        observed = weights > 0
+        values = values[observed]
+        weights = weights[observed]
+
+        if len(values) == 0:
+            raise NonsenseError('Cannot have an empirical distribution with no samples')
+
+        super().__init__(accepts_floats=values.dtype.kind == 'f')
+
+        self._values = values
+        self._cumulative = np.concatenate(([0], np.cumsum(weights)))
+        self._total = int(self._cumulative[-1])
+        self._bin_width = bin_width
+
+    @classmethod
+    def from_chunks(cls, chunks: Iterable[npt.ArrayLike], *, max_values: int | None = None) -> EmpiricalDistribution:
+        """Create an empirical distribution from a stream of chunks of samples, with an :class:`EmpiricalBuilder`.
+
+        :param chunks: The chunks of samples, like arrays read from a file one at a time
+        :param max_values: The most distinct values to keep before switching to a histogram, or None for no limit
+        :returns EmpiricalDistribution: The distribution of all the samples
+        """
+        builder = EmpiricalBuilder(max_values=max_values)
+
+        for chunk in chunks:
+            builder.add(chunk)
+
+        return builder.build()
+
+    def __repr__(self) -> str:
+        """Return a short repr of the distribution, with the numbers of samples and distinct values."""
+        if self._bin_width:
+            return f'Empirical({self._total} samples, {len(self._values)} bins of width {self._bin_width})'
+
+        return f'Empirical({self._total} samples, {len(self._values)} values)'
+
+    def __hash__(self) -> int:
+        """Hash the distribution by its identity, because its parameters are arrays, which can't be hashed."""
+        return object.__hash__(self)
+
+    def __reduce__(self) -> tuple[type[Distribution], tuple[object, ...]]:
+        """Pickle the distribution by its distinct values and their counts, rather than every sample."""
+        return self.__class__, (self._values, np.diff(self._cumulative), self._bin_width)
+
+    @property
+    def values(self) -> npt.NDArray[np.generic]:
+        """The distinct values of the samples, in increasing order, or the bottoms of the bins in histogram mode."""
+        return self._values
+
+    @property
+    def counts(self) -> IntArray:
+        """The number of samples equal to each of :attr:`values`."""
+        return np.diff(self._cumulative)
+
+    @property
+    def total(self) -> int:
+        """The number of samples."""
+        return self._total
+
+    @property
+    def bin_width(self) -> float:
+        """The width of the bins that the samples were rounded down into, or 0 if they're exact."""
+        return self._bin_width
+
+    def _check_nonsense(self, value: float, *, strict: bool) -> Literal[None, -1]:
+        """Check if the given value is nonsense.
+
+        :param float value: The value to check
+        :param bool strict: Whether to throw errors or just return -1
+        :returns: None on success, -1 on fail
+        :rtype: Literal[None, -1]
+
+        :raises NonsenseError: If the value is NaN
+        :raises NonsenseError: If the value isn't an integer, and the samples are integers
+        """
+        if math.isnan(value):
+            if strict:
+                raise NonsenseError('Cannot ask probability of NaN')
+
+            return -1
+
+        if not self._accepts_floats and not math.isinf(value) and value != int(value):
+            if strict:
+                raise NonsenseError(f'Cannot ask probability of {value} when every sample is an integer')
+
+            return -1
+
+        return None
+
+    def _count_at_most(self, value: float) -> int:
+        """Return the number of samples less than or equal to the value, with a binary search."""
+        return int(self._cumulative[np.searchsorted(self._values, value, side='right')])
+
+    def pmf(self, value: float, *, strict: bool = True) -> float:
+        """Return the fraction of the samples that are equal to the given value.
+
+        :param float value: The value to find the probability of
+        :param bool strict: Whether to throw errors for invalid input, or return 0
+        :returns float: The probability of getting this value
+
+        :raises NonsenseError: If the value is NaN, or not an integer when every sample is
+        """
+        if self._check_nonsense(value, strict=strict) is not None:
+            return 0
+
+        index = int(np.searchsorted(self._values, value, side='left'))
+
+        if index == len(self._values) or self._values[index] != value:
+            return 0.0
+
+        return int(self._cumulative[index + 1] - self._cumulative[index]) / self._total
+
+    def cdf(self, value: float, *, strict: bool = True) -> float:
+        """Return the fraction of the samples that are less than or equal to the given value.
+
+        :param float value: The value to find the probability for
+        :param bool strict: Whether to throw errors for invalid input, or return 0
+        :returns float: The probability of getting less than or equal to this value
+
+        :raises NonsenseError: If the value is NaN, or not an integer when every sample is
+        """
+        if self._check_nonsense(value, strict=strict) is not None:
+            return 0
+
+        return self._count_at_most(value) / self._total
+
+    def sf(self, value: float, *, strict: bool = True) -> float:
+        """Return the fraction of the samples that are more than the given value.
+
+        This is counted directly, so it's exact, however small it is.
+
+        :param float value: The value to find the probability for
+        :param bool strict: Whether to throw errors for invalid input, or return 0
+        :returns float: The probability of getting more than this value
+
+        :raises NonsenseError: If the value is NaN, or not an integer when every sample is
+        """
+        if self._check_nonsense(value, strict=strict) is not None:
+            return 0
+
+        return (self._total - self._count_at_most(value)) / self._total
+
+    def _in_upper_tail(self, value: float) -> bool:
+        """Check if the value is above the median."""
+        return self._count_at_most(value) * 2 > self._total
+
+    def _is_cheap(self, event: Event) -> bool:
+        """Return True, because every probability is a binary search."""
+        return True
+
+    def _quantile_indices(self, column: str, probabilities: FloatArray) -> IntArray:
+        """Return the indices in :attr:`values` of :meth:`ppf` or :meth:`isf` for an array of valid probabilities.
+
+        The probabilities are converted to the exact counts of samples that they need, so that the results
+        agree exactly with :meth:`cdf` and :meth:`sf`, and then those counts are found with one binary search.
+
+        :param str column: Which function to invert, out of ``'cdf'`` for :meth:`ppf` and ``'sf'`` for :meth:`isf`
+        :param probabilities: The probabilities, which must be between 0 and 1
+        :returns: The indices of the values
+        """
+        total = self._total
+
+        if column == 'cdf':
+            # The smallest count whose fraction of the total is at least each probability
+            needed = np.ceil(probabilities * total)
+            needed = np.where((needed - 1) / total >= probabilities, needed - 1, needed)
+            needed = np.where(needed / total < probabilities, needed + 1, needed)
+        else:
+            # The largest count above a value whose fraction of the total is at most each probability
+            allowed = np.floor(probabilities * total)
+            allowed = np.where((allowed + 1) / total <= probabilities, allowed + 1, allowed)
+            allowed = np.where(allowed / total > probabilities, allowed - 1, allowed)
+            needed = total - allowed
+
+        indices: IntArray = np.searchsorted(self._cumulative[1:], needed, side='left')
+        return np.minimum(indices, len(self._values) - 1)
+
+    def ppf(self, probability: float, *, strict: bool = True) -> float:
+        """Return the smallest value whose CDF is at least the given probability.
+
+        :param float probability: The probability, between 0 and 1
+        :param bool strict: Whether to throw errors for invalid input, or return NaN
+        :returns: The smallest value whose CDF is at least the probability
+
+        :raises NonsenseError: If the probability is not between 0 and 1
+        """
+        if self._check_probability(probability, strict=strict) is not None:
+            return math.nan
+
+        index = self._quantile_indices('cdf', np.array([probability], dtype=np.float64))[0]
+        result: float = self._values[index].item()
+        return result
+
+    def isf(self, probability: float, *, strict: bool = True) -> float:
+        """Return the smallest value whose survival function is at most the given probability.
+
+        :param float probability: The probability, between 0 and 1
+        :param bool strict: Whether to throw errors for invalid input, or return NaN
+        :returns: The smallest value whose survival function is at most the probability
+
+        :raises NonsenseError: If the probability is not between 0 and 1
+        """
+        if self._check_probability(probability, strict=strict) is not None:
+            return math.nan
+
+        index = self._quantile_indices('sf', np.array([probability], dtype=np.float64))[0]
+        result: float = self._values[index].item()
+        return result
+
+    def _invalid_array(self, values: FloatArray) -> BoolArray:
+        """Return a boolean array which is True wherever :meth:`_check_nonsense` would fail."""
+        invalid: BoolArray = np.isnan(values)
+
+        if not self._accepts_floats:
+            invalid |= np.isfinite(values) & (values != np.floor(values))
+
+        return invalid
+
+    def pmf_array(self, values: npt.ArrayLike, *, strict: bool = True) -> FloatArray:
+        """Return :meth:`pmf` for every element of an array of values, with one vectorized binary search.
+
+        :param values: The values to find the probabilities of
+        :param bool strict: Whether to throw errors for invalid input, or return 0 for those elements
+        :returns: An array of probabilities with the same shape as ``values``
+
+        :raises NonsenseError: If any value is NaN, or not an integer when every sample is
+        """
+        x, invalid = self._validate_array(values, strict=strict)
+
+        # The number of samples less than each value and less than or equal to it
+        below = self._cumulative[np.searchsorted(self._values, x, side='left')]
+        at_most = self._cumulative[np.searchsorted(self._values, x, side='right')]
+
+        return np.where(invalid, 0.0, (at_most - below) / self._total)
+
+    def cdf_array(self, values: npt.ArrayLike, *, strict: bool = True) -> FloatArray:
+        """Return :meth:`cdf` for every element of an array of values, with one vectorized binary search.
+
+        :param values: The values to find the probabilities for
+        :param bool strict: Whether to throw errors for invalid input, or return 0 for those elements
+        :returns: An array of probabilities with the same shape as ``values``
+
+        :raises NonsenseError: If any value is NaN, or not an integer when every sample is
+        """
+        x, invalid = self._validate_array(values, strict=strict)
+        at_most = self._cumulative[np.searchsorted(self._values, x, side='right')]
+        return np.where(invalid, 0.0, at_most / self._total)
+
+    def sf_array(self, values: npt.ArrayLike, *, strict: bool = True) -> FloatArray:
+        """Return :meth:`sf` for every element of an array of values, with one vectorized binary search.
+
+        :param values: The values to find the probabilities for
+        :param bool strict: Whether to throw errors for invalid input, or return 0 for those elements
+        :returns: An array of probabilities with the same shape as ``values``
+
+        :raises NonsenseError: If any value is NaN, or not an integer when every sample is
+        """
+        x, invalid = self._validate_array(values, strict=strict)
+        at_most = self._cumulative[np.searchsorted(self._values, x, side='right')]
+        return np.where(invalid, 0.0, (self._total - at_most) / self._total)
+
+    def _quantile_array(self, column: str, probabilities: npt.ArrayLike, *, strict: bool) -> FloatArray:
+        """Evaluate :meth:`ppf` or :meth:`isf` for every element of an array of probabilities, in one vectorized pass.
+
+        :param str column: Which function to invert, out of ``'cdf'`` for :meth:`ppf` and ``'sf'`` for :meth:`isf`
+        :param probabilities: The probabilities to find the values for
+        :param bool strict: Whether to throw errors for invalid input, or return NaN for those elements
+        :returns: An array of values with the same shape as ``probabilities``
+
+        :raises NonsenseError: If any probability is not between 0 and 1
+        """
+        q, invalid = self._validate_probabilities(probabilities, strict=strict)
+        results = self._values[self._quantile_indices(column, q)].astype(np.float64)
+        return np.where(invalid, np.nan, results)
+
+    def _sample(self, rng: np.random.Generator, size: int | tuple[int, ...]) -> FloatArray | IntArray:
+        """Pick samples uniformly at random, with replacement, by a binary search of the cumulative counts."""
+        picks = rng.integers(0, self._total, size)
+        result: FloatArray | IntArray = self._values[  # type: ignore[assignment]
+            np.searchsorted(self._cumulative[1:], picks, side='right')
+        ]
+        return result
+
+
+class EmpiricalBuilder:
+    """Build an :class:`EmpiricalDistribution` from a stream of chunks of samples, in bounded memory.
+
+    Each chunk is merged into the sorted distinct values and their counts as soon as it's added, so only the
+    distinct values are kept, not every sample. If ``max_values`` is given, then whenever there would be more
+    distinct values than that, every value is rounded down to a multiple of a bin width, which starts at the
+    smallest power of 2 that could be enough, and doubles until it is. The bins are nested, so rounding a
+    value down to a bin and then to a wider bin gives the same result as rounding it straight to the wider bin.
+    """
+
+    __slots__ = ('_values', '_counts', '_max_values', '_bin_width')
+
+    def __init__(self, *, max_values: int | None = None):
+        """Create a builder with no samples.
+
+        :param max_values: The most distinct values to keep before switching to a histogram, or None for no limit
+
+        :raises ValueError: If ``max_values`` isn't a positive integer
+        """
+        if max_values is not None and (not isinstance(max_values, int) or max_values < 1):
+            raise ValueError(f'max_values must be a positive integer, not {max_values}')
+
+        self._values: npt.NDArray[np.generic] = np.array([], dtype=np.int64)
+        self._counts: IntArray = np.array([], dtype=np.int64)
+        self._max_values = max_values
+        self._bin_width: float = 0
+
+    def __repr__(self) -> str:
+        """Return a simple repr of the builder, with the numbers of samples and distinct values so far."""
+        return f'{self.__class__.__module__}.{self.__class__.__name__}' \
+            f'({int(self._counts.sum())} samples, {len(self._values)} values)'
+
+    @property
+    def bin_width(self) -> float:
+        """The current width of the bins that the samples are rounded down into, or 0 if they're exact."""
+        return self._bin_width
+
+    def add(self, chunk: npt.ArrayLike, counts: npt.ArrayLike | None = None) -> None:
+        """Merge a chunk of samples into the distinct values.
+
+        :param chunk: The samples, which are ints or floats
+        :param counts: How many times each sample was observed, or None if each was observed once
+
+        :raises NonsenseError: If any sample is NaN, or the counts don't match the samples
+        """
+        values, weights = _as_samples(chunk, counts)
+
+        if self._bin_width:
+            values = _round_down(values, self._bin_width)
+
+        values = np.concatenate((self._values, values))
+        weights = np.concatenate((self._counts, weights))
+
+        # Both parts are already sorted, so the stable sort just merges them
+        order = np.argsort(values, kind='stable')
+        self._values, self._counts = _aggregate(values[order], weights[order])
+
+        if self._max_values is not None and len(self._values) > self._max_values:
+            self._compress(self._max_values)
+
+    def _compress(self, max_values: int) -> None:
+        """Round the values down into wider bins until there are at most ``max_values`` of them."""
+        span = float(self._values[-1] - self._values[0])
+
+        # A narrower bin could never fit the span into max_values bins, so there's no point trying one
+        width = 2.0 ** math.floor(math.log2(span / max_values)) if span > 0 else 1.0
+        width = max(width, self._bin_width * 2)
+
+        if self._values.dtype.kind in 'iu':
+            width = max(width, 1.0)
+
+        while True:
+            values, counts = _aggregate(_round_down(self._values, width), self._counts)
+
+            if len(values) <= max_values:
+                break
+
+            width *= 2
+
+        self._values = values
+        self._counts = counts
+        self._bin_width = int(width) if values.dtype.kind in 'iu' else width
+
+    def build(self) -> EmpiricalDistribution:
+        """Return the empirical distribution of every sample added so far.
+
+        :raises NonsenseError: If no samples have been added
+        """
+        return EmpiricalDistribution(self._values, self._counts, self._bin_width)
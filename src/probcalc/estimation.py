@@ -0,0 +1,339 @@
+# probcalc - Calculate probabilities for distributions
+# Copyright (C) 2022 D. Dyson (DoctorDalek1963)
+
+# This program is licensed under GNU GPLv3, available here:
+# <https://www.gnu.org/licenses/gpl-3.0.html>
+
+r"""A module to estimate the parameters of distributions from streams of data, in one pass and constant memory.
+
+:class:`MomentEstimator` keeps the count, mean, and sum of squared deviations of everything it's seen,
+updated with Welford's algorithm, which doesn't suffer from the cancellation of the textbook formula
+:math:`\frac{\sum x^2}{n} - \bar{x}^2`. :class:`ProportionEstimator` just counts successes and trials.
+
+Both take one value at a time with ``add()``, or a whole chunk with ``update()``, which can be any iterable
+(read lazily, one value at a time) or an array, which is reduced with NumPy in one vectorized pass. Estimators
+from parallel workers can be combined with ``merge()``, which gives exactly the same result as if one estimator
+had seen all the data, up to rounding, using the pairwise formulas of Chan, Golub, and LeVeque. They're small and
+picklable, so they can be sent back from worker processes.
+
+Each estimator then makes a ready-to-use distribution, with the maximum likelihood estimates of its parameters,
+except that the normal distribution uses the sample standard deviation, with Bessel's correction.
+
+:Example:
+
+>>> from probcalc import P
+>>> from probcalc.estimation import MomentEstimator
+>>> estimator = MomentEstimator()
+>>> estimator.update([2, 4, 4, 4, 5, 5, 7, 9])
+>>> estimator.mean, estimator.variance
+(5.0, 4.0)
+>>> estimator.poisson()
+Po(5.0)
+>>> P(estimator.poisson() <= 5)
+0.6159606548
+"""
+
+from __future__ import annotations
+
+import math
+from typing import TYPE_CHECKING, Any, Iterable, cast
+
+from .distribution_classes import NonsenseError
+from .distributions import BinomialDistribution, GeometricDistribution, NormalDistribution, PoissonDistribution
+
+if TYPE_CHECKING:
+    import numpy.typing as npt
+
+
+def _is_array(values: Any) -> bool:
+    """Check if a chunk can be converted to a NumPy array without iterating over it in Python."""
+    return hasattr(values, '__array__')
+
+
+class MomentEstimator:
+    """An online estimator of the mean and variance of a stream of numbers, with Welford's algorithm."""
+
+    __slots__ = ('_count', '_mean', '_m2')
+
+    def __init__(self) -> None:
+        """Create an estimator that hasn't seen any data."""
+        self._count = 0
+        self._mean = 0.0
+
+        # The sum of the squared deviations from the mean
+        self._m2 = 0.0
+
+    def __repr__(self) -> str:
+        """Return a simple repr of the estimator, containing its count, mean, and variance."""
+        variance = self.variance if self._count else math.nan
+        return f'{self.__class__.__module__}.{self.__class__.__name__}' \
+            f'(count={self._count}, mean={self._mean!r}, variance={variance!r})'
+
+    @property
+    def count(self) -> int:
+        """The number of values that the estimator has seen."""
+        return self._count
+
+    @property
+    def mean(self) -> float:
+        """The mean of the values.
+
+        :raises NonsenseError: If the estimator hasn't seen any values
+        """
+        self._check_count(1)
+        return self._mean
+
+    @property
+    def variance(self) -> float:
+        """The population variance of the values, which divides by the count.
+
+        :raises NonsenseError: If the estimator hasn't seen any values
+        """
+        self._check_count(1)
+        return self._m2 / self._count
+
+    @property
+    def sample_variance(self) -> float:
+        """The sample variance of the values, which divides by one less than the count.
+
+        :raises NonsenseError: If the estimator has seen fewer than 2 values
+        """
+        self._check_count(2)
+        return self._m2 / (self._count - 1)
+
+    def _check_count(self, minimum: int) -> None:
+        """Raise an error if the estimator hasn't seen enough values.
+
+        :raises NonsenseError: If the count is less than the minimum
+        """
+        if self._count < minimum:
+            raise NonsenseError(f'Cannot estimate from {self._count} values, at least {minimum} are needed')
+
+    def add(self, value: float) -> None:
+        """Add one value to the estimator.
+
+        :param float value: The value
+
+        :raises NonsenseError: If the value is NaN
+        """
+        if math.isnan(value):
+            raise NonsenseError('Cannot estimate from NaN')
+
+        self._count += 1
+        delta = value - self._mean
+        self._mean += delta / self._count
+        self._m2 += delta * (value - self._mean)
+
+    def update(self, values: Iterable[float] | npt.ArrayLike) -> None:
+        """Add a chunk of values to the estimator.
+
+        Arrays are reduced in one vectorized pass with NumPy and then merged in, and any other iterable
+        is read lazily, one value at a time, so it can be a generator of any length.
+
+        :param values: The values
+
+        :raises NonsenseError: If any of the values are NaN
+        """
+        if not _is_array(values):
+            for value in cast('Iterable[float]', values):
+                self.add(value)
+
+            return
+
+        import numpy as np
+
+        array = np.ravel(np.asarray(values, dtype=np.float64))
+
+        if len(array) == 0:
+            return
+
+        mean = float(array.mean())
+
+        if math.isnan(mean):
+            raise NonsenseError('Cannot estimate from NaN')
+
+        self._combine(len(array), mean, float(np.square(array - mean).sum()))
+
+    def _combine(self, count: int, mean: float, m2: float) -> None:
+        """Combine the statistics of another set of values into this estimator, with Chan's pairwise formulas."""
+        total = self._count + count
+
+        if total == 0:
+            return
+
+        delta = mean - self._mean
+        self._mean += delta * count / total
+        self._m2 += m2 + delta * delta * self._count * count / total
+        self._count = total
+
+    def merge(self, other: MomentEstimator) -> None:
+        """Merge the values seen by another estimator into this one, like from a parallel worker.
+
+        :param MomentEstimator other: The other estimator, which isn't changed
+        """
+        self._combine(other._count, other._mean, other._m2)
+
+    @classmethod
+    def merged(cls, estimators: Iterable[MomentEstimator]) -> MomentEstimator:
+        """Return a new estimator that has seen all the values seen by the given estimators.
+
+        :param estimators: The estimators, which aren't changed
+        :returns MomentEstimator: The merged estimator
+        """
+        result = cls()
+
+        for estimator in estimators:
+            result.merge(estimator)
+
+        return result
+
+    def normal(self) -> NormalDistribution:
+        """Return a normal distribution with the mean and sample standard deviation of the values.
+
+        :raises NonsenseError: If the estimator has seen fewer than 2 values, or they're all the same
+        """
+        return NormalDistribution(self.mean, math.sqrt(self.sample_variance))
+
+    def poisson(self) -> PoissonDistribution:
+        """Return a Poisson distribution whose rate is the mean of the values, which should be counts.
+
+        :raises NonsenseError: If the estimator hasn't seen any values, or their mean is negative
+        """
+        return PoissonDistribution(self.mean)
+
+    def geometric(self) -> GeometricDistribution:
+        """Return a geometric distribution whose probability is the reciprocal of the mean of the values.
+
+        The values should be the numbers of trials up to and including each first success, so they're at least 1.
+
+        :raises NonsenseError: If the estimator hasn't seen any values, or their mean is less than 1
+        """
+        if self.mean < 1:
+            raise NonsenseError(f'Cannot estimate geometric distribution from a mean of {self.mean}, less than 1')
+
+        return GeometricDistribution(1 / self.mean)
+
+    def binomial(self, number_of_trials: int) -> BinomialDistribution:
+        """Return a binomial distribution whose mean is the mean of the values, which should be numbers of successes.
+
+        :param int number_of_trials: The number of trials behind each value
+        :raises NonsenseError: If the estimator hasn't seen any values, or their mean is out of range
+        """
+        if number_of_trials <= 0:
+            raise NonsenseError(f'Cannot estimate binomial distribution with {number_of_trials} trials')
+
+        return BinomialDistribution(number_of_trials, self.mean / number_of_trials)
+
+
+class ProportionEstimator:
+    """An online estimator of the probability of success, by counting successes and trials."""
+
+    __slots__ = ('_successes', '_trials')
+
+    def __init__(self) -> None:
+        """Create an estimator that hasn't seen any trials."""
+        self._successes = 0
+        self._trials = 0
+
+    def __repr__(self) -> str:
+        """Return a simple repr of the estimator, containing its counts."""
+        return f'{self.__class__.__module__}.{self.__class__.__name__}' \
+            f'(successes={self._successes}, trials={self._trials})'
+
+    @property
+    def successes(self) -> int:
+        """The number of successes that the estimator has seen."""
+        return self._successes
+
+    @property
+    def trials(self) -> int:
+        """The number of trials that the estimator has seen."""
+        return self._trials
+
+    @property
+    def probability(self) -> float:
+        """The proportion of the trials that were successes.
+
+        :raises NonsenseError: If the estimator hasn't seen any trials
+        """
+        if self._trials == 0:
+            raise NonsenseError('Cannot estimate probability from 0 trials')
+
+        return self._successes / self._trials
+
+    def add(self, successes: int, trials: int = 1) -> None:
+        """Add some trials to the estimator.
+
+        :param int successes: The number of successes, which can be a bool for one trial
+        :param int trials: The number of trials
+
+        :raises NonsenseError: If the numbers are negative, or there are more successes than trials
+        """
+        if not 0 <= successes <= trials:
+            raise NonsenseError(f'Cannot have {successes} successes in {trials} trials')
+
+        self._successes += int(successes)
+        self._trials += int(trials)
+
+    def update(self, outcomes: Iterable[bool] | npt.ArrayLike) -> None:
+        """Add a chunk of trials to the estimator, each of which is True or 1 for a success, and False or 0 otherwise.
+
+        Like :meth:`MomentEstimator.update`, arrays are counted with NumPy, and other iterables are read lazily.
+
+        :param outcomes: The outcomes of the trials
+
+        :raises NonsenseError: If any outcome isn't 0 or 1
+        """
+        if not _is_array(outcomes):
+            for outcome in cast('Iterable[bool]', outcomes):
+                self.add(outcome)
+
+            return
+
+        import numpy as np
+
+        array = np.ravel(np.asarray(outcomes))
+        successes = int(np.count_nonzero(array))
+
+        if successes != np.count_nonzero(array == 1):
+            raise NonsenseError('Every outcome must be a success (1) or a failure (0)')
+
+        self._successes += successes
+        self._trials += len(array)
+
+    def merge(self, other: ProportionEstimator) -> None:
+        """Merge the trials seen by another estimator into this one, like from a parallel worker.
+
+        :param ProportionEstimator other: The other estimator, which isn't changed
+        """
+        self._successes += other._successes
+        self._trials += other._trials
+
+    @classmethod
+    def merged(cls, estimators: Iterable[ProportionEstimator]) -> ProportionEstimator:
+        """Return a new estimator that has seen all the trials seen by the given estimators.
+
+        :param estimators: The estimators, which aren't changed
+        :returns ProportionEstimator: The merged estimator
+        """
+        result = cls()
+
+        for estimator in estimators:
+            result.merge(estimator)
+
+        return result
+
+    def binomial(self, number_of_trials: int) -> BinomialDistribution:
+        """Return a binomial distribution with the estimated probability of success.
+
+        :param int number_of_trials: The number of trials in the distribution
+        :raises NonsenseError: If the estimator hasn't seen any trials
+        """
+        return BinomialDistribution(number_of_trials, self.probability)
+
+    def geometric(self) -> GeometricDistribution:
+        """Return a geometric distribution with the estimated probability of success.
+
+        :raises NonsenseError: If the estimator hasn't seen any trials
+        """
+        return GeometricDistribution(self.probability)
@@ -0,0 +1,222 @@
+# probcalc - Calculate probabilities for distributions
+# Copyright (C) 2022 D. Dyson (DoctorDalek1963)
+
+# This program is licensed under GNU GPLv3, available here:
+# <https://www.gnu.org/licenses/gpl-3.0.html>
+
+r"""A module to find the critical regions of hypothesis tests.
+
+For a lower tail test at significance level :math:`\alpha`, the critical region is :math:`X \leq c`
+for the largest :math:`c` with :math:`P(X \leq c) \leq \alpha`, and for an upper tail test, it's
+:math:`X \geq c` for the smallest :math:`c` with :math:`P(X \geq c) \leq \alpha`. A two tailed test
+splits the significance level equally between the tails. The actual significance level is the
+probability of the critical region, which is at most :math:`\alpha` for discrete distributions.
+
+Rather than trying every :math:`c` in turn, each boundary starts from :meth:`ppf` or :meth:`isf`, which
+use the cached table or closed form of the distribution, and then a guided binary search of the CDF
+makes it exact, which usually takes one or two evaluations. :func:`critical_regions` finds lots of
+critical regions together, with one vectorized :meth:`ppf_array` or :meth:`isf_array` for each
+distribution when NumPy is installed.
+
+:Example:
+
+>>> from probcalc import B
+>>> from probcalc.hypothesis import critical_region
+>>> region = critical_region(B(20, 0.5), 0.05, 'lower')
+>>> region.lower, region.upper, round(region.significance, 6)
+(5, None, 0.020695)
+>>> region = critical_region(B(20, 0.5), 0.05, 'two')
+>>> region.lower, region.upper, round(region.significance, 6)
+(5, 15, 0.041389)
+"""
+
+from __future__ import annotations
+
+from typing import Iterable, Literal, NamedTuple, Sequence, Tuple
+
+from .distribution_classes import Distribution, NonsenseError
+from .distributions import _smallest_satisfying
+
+Tail = Literal['lower', 'upper', 'two']
+"""Which tail of the distribution the critical region is in, or ``'two'`` for both."""
+
+_Test = Tuple[Distribution, float, Tail]
+"""A hypothesis test, as the distribution under the null hypothesis, the significance level, and the tail."""
+
+
+class CriticalRegion(NamedTuple):
+    """The critical region of a hypothesis test, as the boundaries of its tails and its actual significance level."""
+
+    lower: float | None
+    """The critical region includes every value less than or equal to this, or None if there's no lower tail."""
+
+    upper: float | None
+    """The critical region includes every value greater than or equal to this, or None if there's no upper tail."""
+
+    significance: float
+    """The probability of the critical region under the null hypothesis."""
+
+
+def _support(distribution: Distribution) -> tuple[int, int | None]:
+    """Return the smallest and largest values in the support of a discrete distribution, or None if it's unbounded."""
+    maximum = distribution.ppf(1)
+    return int(distribution.ppf(0)), None if maximum == float('inf') else int(maximum)
+
+
+def _lower_tail(distribution: Distribution, alpha: float, guess: float) -> tuple[float | None, float]:
+    """Return the boundary and probability of the lower tail of a critical region.
+
+    :param Distribution distribution: The distribution under the null hypothesis
+    :param float alpha: The significance level of this tail
+    :param float guess: The :meth:`ppf` of the significance level
+    :returns: The largest value whose CDF is at most the significance level, or None, and its CDF
+    """
+    if distribution._accepts_floats:
+        return guess, distribution.cdf(guess)  # type: ignore[arg-type]
+
+    minimum, maximum = _support(distribution)
+
+    # The ppf is the smallest value whose CDF is at least alpha, so the answer is either it or one less
+    outside = _smallest_satisfying(lambda k: distribution.cdf(k) > alpha, int(guess), minimum, maximum)
+
+    if outside == minimum:
+        return None, 0.0
+
+    return outside - 1, distribution.cdf(outside - 1)
+
+
+def _upper_tail(distribution: Distribution, alpha: float, guess: float) -> tuple[float | None, float]:
+    """Return the boundary and probability of the upper tail of a critical region.
+
+    :param Distribution distribution: The distribution under the null hypothesis
+    :param float alpha: The significance level of this tail
+    :param float guess: The :meth:`isf` of the significance level
+    :returns: The smallest value whose survival function at the value below is at most the significance level,
+        or None, and that survival function
+    """
+    if distribution._accepts_floats:
+        return guess, distribution.sf(guess)  # type: ignore[arg-type]
+
+    minimum, maximum = _support(distribution)
+    inside = _smallest_satisfying(lambda k: distribution.sf(k) <= alpha, int(guess), minimum, maximum) + 1
+
+    if maximum is not None and inside > maximum:
+        return None, 0.0
+
+    return inside, distribution.sf(inside - 1)
+
+
+def _check_test(alpha: float, tail: str) -> None:
+    """Check the significance level and tail of a hypothesis test.
+
+    :raises NonsenseError: If the significance level is not strictly between 0 and 1
+    :raises ValueError: If the tail isn't one of ``'lower'``, ``'upper'``, or ``'two'``
+    """
+    if not 0 < alpha < 1:
+        raise NonsenseError(f'Significance level must be between 0 and 1, not {alpha}')
+
+    if tail not in ('lower', 'upper', 'two'):
+        raise ValueError(f"Tail must be 'lower', 'upper', or 'two', not {tail!r}")
+
+
+def _tail_alpha(alpha: float, tail: Tail) -> float:
+    """Return the significance level of each tail, which is half of the total for a two tailed test."""
+    return alpha / 2 if tail == 'two' else alpha
+
+
+def _region(
+    distribution: Distribution,
+    alpha: float,
+    tail: Tail,
+    lower_guess: float,
+    upper_guess: float
+) -> CriticalRegion:
+    """Return the critical region of a hypothesis test, given the :meth:`ppf` and :meth:`isf` of each tail's level."""
+    tail_alpha = _tail_alpha(alpha, tail)
+    lower = upper = None
+    significance = 0.0
+
+    if tail != 'upper':
+        lower, probability = _lower_tail(distribution, tail_alpha, lower_guess)
+        significance += probability
+
+    if tail != 'lower':
+        upper, probability = _upper_tail(distribution, tail_alpha, upper_guess)
+        significance += probability
+
+    return CriticalRegion(lower, upper, significance)
+
+
+def critical_region(distribution: Distribution, alpha: float, tail: Tail = 'lower') -> CriticalRegion:
+    """Return the critical region of a hypothesis test.
+
+    :param Distribution distribution: The distribution of the test statistic under the null hypothesis
+    :param float alpha: The significance level, like 0.05 for 5%
+    :param str tail: ``'lower'`` or ``'upper'`` for a one tailed test, or ``'two'`` for a two tailed test
+    :returns CriticalRegion: The boundaries of the critical region, and its actual significance level
+
+    :raises NonsenseError: If the significance level is not strictly between 0 and 1
+    :raises ValueError: If the tail isn't one of ``'lower'``, ``'upper'``, or ``'two'``
+    """
+    _check_test(alpha, tail)
+    tail_alpha = _tail_alpha(alpha, tail)
+
+    lower_guess = distribution.ppf(tail_alpha) if tail != 'upper' else 0
+    upper_guess = distribution.isf(tail_alpha) if tail != 'lower' else 0
+    return _region(distribution, alpha, tail, lower_guess, upper_guess)
+
+
+def _quantiles(distribution: Distribution, column: str, probabilities: Sequence[float]) -> list[float]:
+    """Return the :meth:`ppf` or :meth:`isf` of every probability, in one vectorized call if NumPy is installed."""
+    if not probabilities:
+        return []
+
+    try:
+        import numpy  # noqa: F401
+    except ImportError:
+        function = distribution.ppf if column == 'cdf' else distribution.isf
+        return [function(probability) for probability in probabilities]
+
+    array_function = distribution.ppf_array if column == 'cdf' else distribution.isf_array
+    quantiles: list[float] = array_function(probabilities).tolist()
+    return quantiles
+
+
+def critical_regions(tests: Iterable[_Test]) -> list[CriticalRegion]:
+    """Return the critical regions of lots of hypothesis tests, evaluated together.
+
+    The tests are grouped by distribution, so that the starting points of the searches for each distribution
+    are found together with :meth:`ppf_array` and :meth:`isf_array`, which share one table lookup.
+
+    :param tests: The hypothesis tests, as tuples of the distribution, the significance level, and the tail,
+        like the arguments of :func:`critical_region`
+    :returns: The critical region of each test, in the same order
+
+    :raises NonsenseError: If any significance level is not strictly between 0 and 1
+    :raises ValueError: If any tail isn't one of ``'lower'``, ``'upper'``, or ``'two'``
+    """
+    tests = list(tests)
+    groups: dict[Distribution, list[int]] = {}
+
+    for index, (distribution, alpha, tail) in enumerate(tests):
+        _check_test(alpha, tail)
+        groups.setdefault(distribution, []).append(index)
+
+    results: list[CriticalRegion | None] = [None] * len(tests)
+
+    for distribution, indices in groups.items():
+        lower_indices = [i for i in indices if tests[i][2] != 'upper']
+        upper_indices = [i for i in indices if tests[i][2] != 'lower']
+
+        lower_guesses = dict(zip(lower_indices, _quantiles(
+            distribution, 'cdf', [_tail_alpha(tests[i][1], tests[i][2]) for i in lower_indices]
+        )))
+        upper_guesses = dict(zip(upper_indices, _quantiles(
+            distribution, 'sf', [_tail_alpha(tests[i][1], tests[i][2]) for i in upper_indices]
+        )))
+
+        for i in indices:
+            _, alpha, tail = tests[i]
+            results[i] = _region(distribution, alpha, tail, lower_guesses.get(i, 0), upper_guesses.get(i, 0))
+
+    return results  # type: ignore[return-value]
@@ -0,0 +1,329 @@
+# probcalc - Calculate probabilities for distributions
+# Copyright (C) 2022 D. Dyson (DoctorDalek1963)
+
+# This program is licensed under GNU GPLv3, available here:
+# <https://www.gnu.org/licenses/gpl-3.0.html>
+
+"""A module to count and time probability calculations, to find out where the CPU time goes.
+
+Instrumentation is off by default. :func:`enable` wraps ``P()``, ``P.batch()``, and the
+:meth:`~probcalc.distribution_classes.Distribution.calculate`, ``calculate_many()``, ``pmf()``,
+and ``cdf()`` methods of every distribution class, and :func:`disable` puts the original methods
+back, so when it's disabled, it costs nothing at all.
+
+While it's enabled, every call is counted and timed for its distribution class. Calls to
+``P()`` and ``calculate()`` are also split up by the shape of the event, like ``'range'`` for
+``a < X < b``. The times include nested calls, so the time for ``P()`` includes its ``cdf()`` calls.
+We also count hits and misses in the table cache (see :mod:`probcalc.tables`), and the number of
+PMF terms that were computed and summed, both to build the tables and in direct sums of the PMF
+(see :mod:`probcalc.summation`), like the log CDFs far out in the tails.
+
+The counters can be read with :func:`snapshot`, or exported for Prometheus with :func:`prometheus_text`.
+Functions added with :func:`add_callback` get called with a :class:`Call` after every instrumented call,
+so they can see the distribution itself, and group its parameters however they like.
+
+:Example:
+
+>>> from probcalc import P, B, instrumentation
+>>> instrumentation.enable()
+>>> X = B(20, 0.5)
+>>> P(4 < X <= 12)
+0.8625030518
+>>> stats = instrumentation.snapshot()
+>>> stats.calls['BinomialDistribution', 'P', 'range'].calls
+1
+>>> stats.calls['BinomialDistribution', 'cdf', ''].calls
+2
+>>> instrumentation.disable()
+>>> instrumentation.reset()
+"""
+
+from __future__ import annotations
+
+import functools
+import threading
+import time
+from typing import Any, Callable, Hashable, NamedTuple
+
+from . import summation, tables
+from .distribution_classes import Distribution, Event, ProbabilityCalculator
+
+_DISTRIBUTION_METHODS = ('calculate', 'calculate_many', 'pmf', 'cdf')
+_CALCULATOR_METHODS = {'__call__': 'P', 'batch': 'P.batch'}
+
+
+class Call(NamedTuple):
+    """A record of one instrumented call, which gets passed to callbacks."""
+
+    distribution: Distribution | None
+    """The distribution, or None for a call to ``P.batch()``, which can cover many distributions."""
+
+    method: str
+    """The name of the method, or ``'P'`` or ``'P.batch'`` for the calculator."""
+
+    shape: str
+    """The shape of the event for ``P()`` and ``calculate()`` (see :func:`event_shape`), or an empty string."""
+
+    seconds: float
+    """The wall time of the call, including nested calls."""
+
+
+class CallStats(NamedTuple):
+    """The number of calls to one method and the total time spent in them."""
+
+    calls: int
+    seconds: float
+
+
+class Snapshot(NamedTuple):
+    """A copy of every counter at one point in time."""
+
+    calls: dict[tuple[str, str, str], CallStats]
+    """The calls and time for each distribution class name, method, and event shape."""
+
+    pmf_terms: dict[str, int]
+    """The number of PMF terms computed and summed, in tables and direct sums, for each distribution class name."""
+
+    cache_hits: dict[str, int]
+    """The number of table cache hits, for each distribution class name."""
+
+    cache_misses: dict[str, int]
+    """The number of table cache misses, for each distribution class name."""
+
+
+def event_shape(event: Event) -> str:
+    """Return the shape of an event, which is how it's grouped in the counters.
+
+    The shapes are ``'all'`` for no bounds, ``'lower'`` for ``X > a``, ``'upper'`` for ``X < b``,
+    ``'range'`` for ``a < X < b``, ``'equal'`` for ``X == a``, and ``'not equal'`` for ``X != a``.
+    """
+    lower = event.bounds.lower
+    upper = event.bounds.upper
+
+    if lower[0] is not None and lower == upper and lower[1]:
+        return 'not equal' if event.negated else 'equal'
+
+    if lower[0] is None:
+        return 'all' if upper[0] is None else 'upper'
+
+    return 'lower' if upper[0] is None else 'range'
+
+
+_lock = threading.Lock()
+_calls: dict[tuple[str, str, str], list[float]] = {}
+_pmf_terms: dict[str, int] = {}
+_cache_hits: dict[str, int] = {}
+_cache_misses: dict[str, int] = {}
+_callbacks: list[Callable[[Call], None]] = []
+_originals: dict[tuple[type, str], Callable[..., Any]] = {}
+
+
+def _record(distribution: Distribution | None, method: str, shape: str, seconds: float) -> None:
+    """Add one call to the counters, and pass it to the callbacks."""
+    key = (distribution.__class__.__name__ if distribution is not None else '', method, shape)
+
+    with _lock:
+        totals = _calls.get(key)
+
+        if totals is None:
+            _calls[key] = [1, seconds]
+        else:
+            totals[0] += 1
+            totals[1] += seconds
+
+    if _callbacks:
+        call = Call(distribution, method, shape, seconds)
+        for callback in list(_callbacks):
+            callback(call)
+
+
+def _on_table_lookup(key: Hashable, hit: bool, entries: int) -> None:
+    """Count a lookup in the table cache. This is the observer for :mod:`probcalc.tables`."""
+    name = str(key[0]) if isinstance(key, tuple) and key else repr(key)
+
+    with _lock:
+        counts = _cache_hits if hit else _cache_misses
+        counts[name] = counts.get(name, 0) + 1
+        _pmf_terms[name] = _pmf_terms.get(name, 0) + entries
+
+
+def _on_pmf_sum(distribution: Distribution | None, terms: int) -> None:
+    """Count the terms of a direct sum of a PMF. This is the observer for :mod:`probcalc.summation`."""
+    name = distribution.__class__.__name__ if distribution is not None else ''
+
+    with _lock:
+        _pmf_terms[name] = _pmf_terms.get(name, 0) + terms
+
+
+def _wrap_distribution_method(name: str, function: Callable[..., Any]) -> Callable[..., Any]:
+    """Wrap a method of a distribution class to count and time its calls."""
+    @functools.wraps(function)
+    def wrapper(self: Distribution, *args: Any, **kwargs: Any) -> Any:
+        start = time.perf_counter()
+
+        try:
+            return function(self, *args, **kwargs)
+
+        finally:
+            shape = event_shape(args[0]) if name == 'calculate' and args and isinstance(args[0], Event) else ''
+            _record(self, name, shape, time.perf_counter() - start)
+
+    return wrapper
+
+
+def _wrap_calculator_method(name: str, function: Callable[..., Any]) -> Callable[..., Any]:
+    """Wrap a method of :class:`probcalc.distribution_classes.ProbabilityCalculator` to count and time its calls."""
+    @functools.wraps(function)
+    def wrapper(self: ProbabilityCalculator, argument: Any, /) -> Any:
+        start = time.perf_counter()
+
+        try:
+            return function(self, argument)
+
+        finally:
+            if isinstance(argument, Event):
+                _record(argument.distribution, name, event_shape(argument), time.perf_counter() - start)
+            elif isinstance(argument, Distribution):
+                _record(argument, name, 'all', time.perf_counter() - start)
+            else:
+                _record(None, name, '', time.perf_counter() - start)
+
+    return wrapper
+
+
+def _distribution_classes() -> list[type[Distribution]]:
+    """Return every subclass of :class:`probcalc.distribution_classes.Distribution`, including itself."""
+    classes = [Distribution]
+
+    for cls in classes:
+        classes.extend(subclass for subclass in cls.__subclasses__() if subclass not in classes)
+
+    return classes
+
+
+def enable() -> None:
+    """Start counting and timing calls.
+
+    This wraps the methods of every distribution class that exists when it's called,
+    so a distribution class defined later is only instrumented after calling this again.
+    """
+    with _lock:
+        for cls in _distribution_classes():
+            for name in _DISTRIBUTION_METHODS:
+                function = cls.__dict__.get(name)
+
+                if function is None or getattr(function, '__isabstractmethod__', False):
+                    continue
+
+                if (cls, name) not in _originals:
+                    _originals[cls, name] = function
+                    setattr(cls, name, _wrap_distribution_method(name, function))
+
+        for name, label in _CALCULATOR_METHODS.items():
+            if (ProbabilityCalculator, name) not in _originals:
+                function = ProbabilityCalculator.__dict__[name]
+                _originals[ProbabilityCalculator, name] = function
+                setattr(ProbabilityCalculator, name, _wrap_calculator_method(label, function))
+
+        tables._observer = _on_table_lookup
+        summation._observer = _on_pmf_sum
+
+
+def disable() -> None:
+    """Stop counting and timing calls, and put the original methods back. The counters are kept."""
+    with _lock:
+        for (cls, name), function in _originals.items():
+            setattr(cls, name, function)
+
+        _originals.clear()
+        tables._observer = None
+        summation._observer = None
+
+
+def is_enabled() -> bool:
+    """Check if instrumentation is enabled."""
+    return bool(_originals)
+
+
+def reset() -> None:
+    """Set every counter back to 0."""
+    with _lock:
+        _calls.clear()
+        _pmf_terms.clear()
+        _cache_hits.clear()
+        _cache_misses.clear()
+
+
+def add_callback(callback: Callable[[Call], None]) -> None:
+    """Add a function to be called with a :class:`Call` after every instrumented call.
+
+    Callbacks run in the thread that made the call, so they should be quick.
+    """
+    with _lock:
+        _callbacks.append(callback)
+
+
+def remove_callback(callback: Callable[[Call], None]) -> None:
+    """Remove a function added with :func:`add_callback`.
+
+    :raises ValueError: If the function isn't a callback
+    """
+    with _lock:
+        _callbacks.remove(callback)
+
+
+def snapshot() -> Snapshot:
+    """Return a copy of every counter."""
+    with _lock:
+        return Snapshot(
+            {key: CallStats(int(calls), seconds) for key, (calls, seconds) in _calls.items()},
+            dict(_pmf_terms),
+            dict(_cache_hits),
+            dict(_cache_misses)
+        )
+
+
+def _labels(**labels: str) -> str:
+    """Format Prometheus labels, leaving out empty ones."""
+    escaped = (
+        name + '="' + value.replace('\\', '\\\\').replace('"', '\\"').replace('\n', '\\n') + '"'
+        for name, value in labels.items() if value
+    )
+    return '{' + ','.join(escaped) + '}'
+
+
+def prometheus_text(prefix: str = 'probcalc') -> str:
+    """Return the counters in the Prometheus text exposition format.
+
+    :param str prefix: The prefix of every metric name
+    :returns str: The metrics, ready to be served on a ``/metrics`` endpoint
+    """
+    stats = snapshot()
+    lines = []
+
+    def metric(name: str, help_text: str, samples: list[tuple[str, float]]) -> None:
+        lines.append(f'# HELP {prefix}_{name} {help_text}')
+        lines.append(f'# TYPE {prefix}_{name} counter')
+        lines.extend(f'{prefix}_{name}{labels} {value!r}' for labels, value in samples)
+
+    calls = sorted(stats.calls.items())
+
+    metric('calls_total', 'Calls to instrumented probcalc functions.', [
+        (_labels(distribution=distribution, method=method, shape=shape), result.calls)
+        for (distribution, method, shape), result in calls
+    ])
+    metric('seconds_total', 'Wall time spent in instrumented probcalc functions, including nested calls.', [
+        (_labels(distribution=distribution, method=method, shape=shape), result.seconds)
+        for (distribution, method, shape), result in calls
+    ])
+    metric('pmf_terms_total', 'PMF terms computed and summed, to build tables or in direct sums.', [
+        (_labels(distribution=name), terms) for name, terms in sorted(stats.pmf_terms.items())
+    ])
+    metric('table_cache_hits_total', 'Hits in the table cache.', [
+        (_labels(distribution=name), hits) for name, hits in sorted(stats.cache_hits.items())
+    ])
+    metric('table_cache_misses_total', 'Misses in the table cache.', [
+        (_labels(distribution=name), misses) for name, misses in sorted(stats.cache_misses.items())
+    ])
+
+    return '\n'.join(lines) + '\n'
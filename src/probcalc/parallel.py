@@ -0,0 +1,259 @@
+# probcalc - Calculate probabilities for distributions
+# Copyright (C) 2022 D. Dyson (DoctorDalek1963)
+
+# This program is licensed under GNU GPLv3, available here:
+# <https://www.gnu.org/licenses/gpl-3.0.html>
+
+"""A module to calculate the probabilities of lots of events in parallel, using every core.
+
+:class:`BatchEvaluator` reads events from any iterable, splits them into chunks, and spreads
+the chunks over a :class:`concurrent.futures.ProcessPoolExecutor` (or a thread pool). The input
+is read lazily, with only a few chunks in flight per worker, so it can be a generator of tens of
+millions of events. Each result is exactly what ``P(event)`` would give in the main process.
+
+To keep the messages to worker processes small, each chunk sends every distinct distribution once,
+as its class and parameters, and then each event as a tuple of its bounds and an index into those.
+
+:Example:
+
+>>> from probcalc import B, parallel
+>>> X = B(20, 0.5)
+>>> with parallel.BatchEvaluator(workers=2, processes=False) as evaluator:
+...     list(evaluator.map(a < X <= a + 5 for a in range(0, 20, 5)))
+[0.02069377899, 0.5674037933, 0.4059925079, 0.005908966064]
+"""
+
+from __future__ import annotations
+
+import concurrent.futures
+import itertools
+import math
+import os
+from collections import deque
+from typing import Any, Iterable, Iterator, Sequence, Tuple
+
+from .distribution_classes import Distribution, Event, ProbabilityCalculator, _Bounds
+from .utility import round_sig_fig
+
+_Row = Tuple[int, Any, bool, Any, bool, bool]
+"""An encoded event: the index of its distribution, its lower and upper bounds, and whether it's negated."""
+
+_Chunk = Tuple[Sequence[Tuple[type, Tuple[Any, ...]]], Sequence[_Row]]
+"""An encoded chunk: every distinct distribution as its class and parameters, and then every event."""
+
+_MAX_CHUNK_SIZE = 10_000
+_UNSIZED_CHUNK_SIZE = 1000
+
+
+def _encode(events: list[Event]) -> _Chunk:
+    """Encode a chunk of events compactly, to send to a worker process."""
+    indices: dict[int, int] = {}
+    distributions: list[tuple[type, tuple[Any, ...]]] = []
+    rows: list[_Row] = []
+
+    for event in events:
+        distribution = event.distribution
+        index = indices.get(id(distribution))
+
+        if index is None:
+            index = indices[id(distribution)] = len(distributions)
+            distributions.append((distribution.__class__, distribution.parameters))
+
+        lower, upper = event.bounds.lower, event.bounds.upper
+        rows.append((index, lower[0], lower[1], upper[0], upper[1], event.negated))
+
+    return distributions, rows
+
+
+def _calculate_encoded(chunk: _Chunk, sig_figs: int) -> list[float]:
+    """Decode a chunk of events in a worker process and calculate their probabilities like ``P()`` does."""
+    distributions, rows = chunk
+    built: list[Distribution] = [cls(*parameters) for cls, parameters in distributions]
+
+    return [
+        round_sig_fig(
+            Event(built[index], _Bounds((lower, lower_inclusive), (upper, upper_inclusive)), negated)
+            .calculate(strict=True),
+            sig_figs
+        )
+        for index, lower, lower_inclusive, upper, upper_inclusive, negated in rows
+    ]
+
+
+def _calculate(events: list[Event], sig_figs: int) -> list[float]:
+    """Calculate the probabilities of a chunk of events like ``P()`` does, in a worker thread."""
+    return [round_sig_fig(event.calculate(strict=True), sig_figs) for event in events]
+
+
+class BatchEvaluator:
+    """An evaluator that calculates the probabilities of many events with a pool of workers.
+
+    Use it as a context manager, or call :meth:`shutdown` when you're done with it, to stop the workers.
+
+    Processes get around the GIL, so they're the best choice for big batches. Threads start
+    faster and don't need to send anything between processes, so they're better for small
+    batches, or for Python builds without a GIL.
+    """
+
+    def __init__(
+        self,
+        workers: int | None = None,
+        *,
+        processes: bool = True,
+        chunk_size: int | None = None,
+        calculator: ProbabilityCalculator | None = None
+    ):
+        """Create an evaluator and start its pool of workers.
+
+        :param workers: The number of workers, or None for the number of CPUs
+        :param bool processes: Whether to use processes, or threads
+        :param chunk_size: The number of events sent to a worker at once, or None to choose automatically
+        :param calculator: The calculator whose number of significant figures should be used, or None for ``P``
+
+        :raises ValueError: If the number of workers or the chunk size is not positive
+        """
+        if workers is not None and workers <= 0:
+            raise ValueError(f'Number of workers must be positive, not {workers}')
+
+        if chunk_size is not None and chunk_size <= 0:
+            raise ValueError(f'Chunk size must be positive, not {chunk_size}')
+
+        if calculator is None:
+            from . import P
+            calculator = P
+
+        self._workers = workers or os.cpu_count() or 1
+        self._processes = processes
+        self._chunk_size = chunk_size
+        self._calculator = calculator
+
+        self._executor: concurrent.futures.Executor = (
+            concurrent.futures.ProcessPoolExecutor(self._workers) if processes
+            else concurrent.futures.ThreadPoolExecutor(self._workers)
+        )
+
+    def __repr__(self) -> str:
+        """Return a simple repr of the evaluator, with its number and type of workers."""
+        kind = 'processes' if self._processes else 'threads'
+        return f'<{self.__class__.__name__} with {self._workers} {kind}>'
+
+    def __enter__(self) -> BatchEvaluator:
+        """Return the evaluator itself."""
+        return self
+
+    def __exit__(self, *exc_info: object) -> None:
+        """Shut down the workers."""
+        self.shutdown()
+
+    def shutdown(self) -> None:
+        """Shut down the workers, waiting for them to finish what they're doing."""
+        self._executor.shutdown(wait=True)
+
+    def _choose_chunk_size(self, queries: Iterable[Event | Distribution]) -> int:
+        """Return the chunk size to use, which gives a few chunks per worker if we know how many events there are."""
+        if self._chunk_size is not None:
+            return self._chunk_size
+
+        if not hasattr(queries, '__len__'):
+            return _UNSIZED_CHUNK_SIZE
+
+        return max(1, min(_MAX_CHUNK_SIZE, math.ceil(len(queries) / (4 * self._workers))))  # type: ignore[arg-type]
+
+    def _submit_chunks(
+        self,
+        queries: Iterable[Event | Distribution]
+    ) -> Iterator[tuple[int, concurrent.futures.Future[list[float]]]]:
+        """Read the events a chunk at a time and submit each chunk, generating their start indices and futures.
+
+        Each chunk is only read from the input and submitted when the next chunk is requested.
+        """
+        chunk_size = self._choose_chunk_size(queries)
+        sig_figs = self._calculator._sig_figs
+        iterator = iter(queries)
+        start = 0
+
+        while True:
+            # This checks every event in the main process, so errors like non-events are raised straight away
+            chunk = [ProbabilityCalculator._as_event(query) for query in itertools.islice(iterator, chunk_size)]
+
+            if not chunk:
+                return
+
+            if self._processes:
+                future = self._executor.submit(_calculate_encoded, _encode(chunk), sig_figs)
+            else:
+                future = self._executor.submit(_calculate, chunk, sig_figs)
+
+            yield start, future
+            start += len(chunk)
+
+    def map(self, queries: Iterable[Event | Distribution]) -> Iterator[float]:
+        """Generate the probabilities of the events, in the same order as the events.
+
+        :param queries: The events to find the probabilities of. A distribution on its own covers every value
+        :returns: A generator of the probabilities, rounded like ``P()`` rounds them
+
+        :raises NonsenseError: If the bounds of any event are invalid, or one of them is not an event at all
+        """
+        in_flight: deque[concurrent.futures.Future[list[float]]] = deque()
+
+        for _, future in self._submit_chunks(queries):
+            in_flight.append(future)
+
+            if len(in_flight) >= 2 * self._workers:
+                yield from in_flight.popleft().result()
+
+        while in_flight:
+            yield from in_flight.popleft().result()
+
+    def map_unordered(self, queries: Iterable[Event | Distribution]) -> Iterator[tuple[int, float]]:
+        """Generate the index and probability of each event, in whatever order they're finished.
+
+        This is faster than :meth:`map` when some chunks take much longer than others,
+        because one slow chunk doesn't hold up the results of the chunks after it.
+
+        :param queries: The events to find the probabilities of. A distribution on its own covers every value
+        :returns: A generator of tuples of the index of each event and its probability
+
+        :raises NonsenseError: If the bounds of any event are invalid, or one of them is not an event at all
+        """
+        in_flight: dict[concurrent.futures.Future[list[float]], int] = {}
+
+        def finished(wait_for: str) -> Iterator[tuple[int, float]]:
+            done, _ = concurrent.futures.wait(in_flight, return_when=wait_for)
+
+            for future in done:
+                start = in_flight.pop(future)
+                yield from enumerate(future.result(), start)
+
+        for start, future in self._submit_chunks(queries):
+            in_flight[future] = start
+
+            if len(in_flight) >= 2 * self._workers:
+                yield from finished(concurrent.futures.FIRST_COMPLETED)
+
+        yield from finished(concurrent.futures.ALL_COMPLETED)
+
+
+def evaluate(
+    queries: Iterable[Event | Distribution],
+    workers: int | None = None,
+    *,
+    processes: bool = True,
+    chunk_size: int | None = None
+) -> list[float]:
+    """Calculate the probabilities of many events in parallel, and return them in order.
+
+    This is a shortcut for :meth:`BatchEvaluator.map` with a temporary :class:`BatchEvaluator`.
+    Starting a pool of workers takes some time, so keep an evaluator around if you have lots of batches.
+
+    :param queries: The events to find the probabilities of. A distribution on its own covers every value
+    :param workers: The number of workers, or None for the number of CPUs
+    :param bool processes: Whether to use processes, or threads
+    :param chunk_size: The number of events sent to a worker at once, or None to choose automatically
+    :returns: The probabilities, rounded like ``P()`` rounds them
+
+    :raises NonsenseError: If the bounds of any event are invalid, or one of them is not an event at all
+    """
+    with BatchEvaluator(workers, processes=processes, chunk_size=chunk_size) as evaluator:
+        return list(evaluator.map(queries))
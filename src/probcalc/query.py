@@ -0,0 +1,384 @@
+# probcalc - Calculate probabilities for distributions
+# Copyright (C) 2022 D. Dyson (DoctorDalek1963)
+
+# This program is licensed under GNU GPLv3, available here:
+# <https://www.gnu.org/licenses/gpl-3.0.html>
+
+"""A module to compile queries written as strings into prepared queries, which can be run many times.
+
+A query looks just like it would in Python, like ``P(a < B(n, p) <= b)``, but any name other than
+a distribution is a parameter, which gets its value when the query is run. :func:`prepare` parses
+and checks a query once, and caches the result by its source, so running a prepared query again
+with new values for its parameters just builds the distribution and event, without any parsing.
+
+Nothing is ever passed to :func:`eval`, so queries from untrusted sources are safe to run.
+
+:Example:
+
+>>> from probcalc import query
+>>> bucket = query.prepare('P(a < B(n, p) <= b)')
+>>> bucket.parameters
+('a', 'n', 'p', 'b')
+>>> bucket(a=4, n=20, p=0.5, b=12)
+0.8625030518
+>>> bucket.many([{'a': 0, 'n': 20, 'p': 0.5, 'b': 5}, {'a': 5, 'n': 20, 'p': 0.5, 'b': 10}])
+[0.02069377899, 0.5674037933]
+"""
+
+from __future__ import annotations
+
+import functools
+import re
+from typing import TYPE_CHECKING, Any, Callable, Iterable, Mapping, Optional, Tuple, Union
+
+from .distribution_classes import Distribution, Event, NonsenseError, _Bounds, _NO_BOUND
+from .distributions import BinomialDistribution, GeometricDistribution, NormalDistribution, PoissonDistribution
+
+if TYPE_CHECKING:
+    from .distribution_classes import ProbabilityCalculator
+
+DISTRIBUTIONS: dict[str, Callable[..., Distribution]] = {
+    'B': BinomialDistribution,
+    'Po': PoissonDistribution,
+    'N': NormalDistribution,
+    'Geo': GeometricDistribution
+}
+"""The distributions that can be used in queries, by the same aliases that ``probcalc`` exports."""
+
+_Operand = Union[int, float, str]
+"""A number, or the name of a parameter."""
+
+_Bound = Optional[Tuple[_Operand, bool]]
+"""A bound of a prepared event, as its value and whether it's inclusive, or None for no bound."""
+
+_TOKEN_RE = re.compile(r'\s*(?:(?P<number>(?:\d+(?:\.\d*)?|\.\d+)(?:[eE][-+]?\d+)?)|(?P<name>[A-Za-z_]\w*)|'
+                       r'(?P<symbol><=|>=|==|!=|<|>|[-+(),]))')
+
+_FLIPPED = {'<': '>', '<=': '>=', '>': '<', '>=': '<=', '==': '==', '!=': '!='}
+"""The operator with its sides swapped, so that ``a < X`` can be treated as ``X > a``."""
+
+
+class QuerySyntaxError(ValueError):
+    """An error in the syntax of a query, which says where the error is."""
+
+    def __init__(self, message: str, source: str, position: int):
+        """Create the error from a message and the position of the problem in the source."""
+        super().__init__(f'{message} at position {position}: {source!r}')
+        self.source = source
+        self.position = position
+
+
+class _Parser:
+    """A simple recursive descent parser for queries."""
+
+    def __init__(self, source: str):
+        """Split the source into tokens of their kind, text, and position."""
+        self.source = source
+        self.tokens: list[tuple[str, str, int]] = []
+        self.index = 0
+        self.parameters: dict[str, None] = {}
+
+        position = 0
+        source = source.rstrip()
+
+        while position < len(source):
+            match = _TOKEN_RE.match(source, position)
+
+            if match is None:
+                rest = source[position:]
+                raise QuerySyntaxError('Unexpected character', self.source, position + len(rest) - len(rest.lstrip()))
+
+            kind = match.lastgroup
+            assert kind is not None
+            self.tokens.append((kind, match[kind], match.start(kind)))
+            position = match.end()
+
+    def peek(self) -> tuple[str, str, int]:
+        """Return the next token without consuming it, which is an ``'end'`` token at the end."""
+        return self.tokens[self.index] if self.index < len(self.tokens) else ('end', '', len(self.source))
+
+    def take(self, text: str | None = None, kind: str | None = None) -> str | None:
+        """Consume and return the next token if it matches the text or kind, or return None."""
+        token_kind, token_text, _ = self.peek()
+
+        if token_kind == 'end' or token_text != (text or token_text) or token_kind != (kind or token_kind):
+            return None
+
+        self.index += 1
+        return token_text
+
+    def expect(self, text: str | None = None, kind: str | None = None) -> str:
+        """Consume and return the next token, which must match the text or kind.
+
+        :raises QuerySyntaxError: If it doesn't match
+        """
+        token = self.take(text, kind)
+
+        if token is None:
+            _, found, position = self.peek()
+            raise QuerySyntaxError(f'Expected {text or kind}, not {found or "the end"!r}', self.source, position)
+
+        return token
+
+    def operand(self) -> _Operand:
+        """Parse a number or the name of a parameter, with an optional sign."""
+        sign = self.take('-') or self.take('+') or ''
+        _, found, position = self.peek()
+
+        if (number := self.take(kind='number')) is not None:
+            text = sign + number
+            return int(text) if text.lstrip('-+').isdigit() else float(text)
+
+        if (name := self.take(kind='name')) is not None and name not in DISTRIBUTIONS and name != 'P':
+            if sign == '-':
+                raise QuerySyntaxError('Parameters cannot be negated', self.source, position)
+
+            if self.peek()[1] == '(':
+                raise QuerySyntaxError(f'Unknown distribution {name!r}', self.source, position)
+
+            # This is a dictionary rather than a set, to keep the order that the parameters appear in
+            self.parameters[name] = None
+            return name
+
+        raise QuerySyntaxError(f'Expected a number or parameter, not {found or "the end"!r}', self.source, position)
+
+    def distribution(self) -> tuple[Callable[..., Distribution], tuple[_Operand, ...]]:
+        """Parse a distribution like ``B(n, 0.5)``, and return its class and arguments."""
+        _, found, position = self.peek()
+        name = self.take(kind='name')
+
+        if name not in DISTRIBUTIONS:
+            raise QuerySyntaxError(
+                f'Expected a distribution out of {", ".join(DISTRIBUTIONS)}, not {found or "the end"!r}',
+                self.source,
+                position
+            )
+
+        self.expect('(')
+        arguments = [self.operand()]
+
+        while self.take(','):
+            arguments.append(self.operand())
+
+        self.expect(')')
+
+        return DISTRIBUTIONS[name], tuple(arguments)
+
+    def comparison(self) -> tuple[str, _Operand] | None:
+        """Parse an optional comparison operator and the operand after it."""
+        _, found, _ = self.peek()
+
+        if found not in _FLIPPED:
+            return None
+
+        self.index += 1
+        return found, self.operand()
+
+    def query(self) -> PreparedQuery:
+        """Parse a whole query, with or without ``P()`` around it."""
+        # P isn't allowed as a parameter, so it can only be the start of P()
+        wrapped = self.take('P') is not None
+
+        if wrapped:
+            self.expect('(')
+
+        kind, _, _ = self.peek()
+        before: tuple[str, _Operand] | None = None
+
+        if kind != 'name' or self.peek()[1] not in DISTRIBUTIONS:
+            value = self.operand()
+            _, operator, position = self.peek()
+
+            if operator not in _FLIPPED:
+                raise QuerySyntaxError('Expected a comparison', self.source, position)
+
+            self.index += 1
+            before = (_FLIPPED[operator], value)
+
+        factory, arguments = self.distribution()
+        after = self.comparison()
+
+        if wrapped:
+            self.expect(')')
+
+        kind, found, position = self.peek()
+
+        if kind != 'end':
+            raise QuerySyntaxError(f'Unexpected {found!r}', self.source, position)
+
+        lower, upper, negated = _bounds(self.source, before, after)
+        return PreparedQuery(self.source, tuple(self.parameters), factory, arguments, lower, upper, negated)
+
+
+def _bounds(source: str, *comparisons: tuple[str, _Operand] | None) -> tuple[_Bound, _Bound, bool]:
+    """Turn the comparisons on either side of a distribution into the lower and upper bounds of an event.
+
+    Each comparison is an operator and an operand, as if the distribution were on the left.
+
+    :returns: The lower bound, the upper bound, and whether the event is negated
+    :raises NonsenseError: If the comparisons can't make an event, like ``a < X > b`` or ``a < X == b``
+    """
+    lower: _Bound = None
+    upper: _Bound = None
+    negated = False
+    given = [comparison for comparison in comparisons if comparison is not None]
+
+    for operator, operand in given:
+        if operator in ('==', '!='):
+            if len(given) > 1:
+                raise NonsenseError(f'Cannot have inequality and equality mixed together: {source!r}')
+
+            lower = upper = (operand, True)
+            negated = operator == '!='
+
+        elif operator in ('>', '>='):
+            if lower is not None:
+                raise NonsenseError(f'Cannot have two lower bounds: {source!r}')
+
+            lower = (operand, operator == '>=')
+
+        else:
+            if upper is not None:
+                raise NonsenseError(f'Cannot have two upper bounds: {source!r}')
+
+            upper = (operand, operator == '<=')
+
+    return lower, upper, negated
+
+
+class PreparedQuery:
+    """A query that has been parsed and checked once, and can then be run with different parameters.
+
+    Get one with :func:`prepare`, and run it by calling it with a value for each of its :attr:`parameters`.
+    """
+
+    __slots__ = ('source', 'parameters', '_factory', '_arguments', '_lower', '_upper', '_negated')
+
+    source: str
+    """The text of the query."""
+
+    parameters: tuple[str, ...]
+    """The names of the parameters, in the order that they first appear in the query."""
+
+    def __init__(
+        self,
+        source: str,
+        parameters: tuple[str, ...],
+        factory: Callable[..., Distribution],
+        arguments: tuple[_Operand, ...],
+        lower: _Bound,
+        upper: _Bound,
+        negated: bool
+    ):
+        """Create a prepared query from its parsed parts. Use :func:`prepare` rather than calling this directly."""
+        self.source = source
+        self.parameters = parameters
+        self._factory = factory
+        self._arguments = arguments
+        self._lower = lower
+        self._upper = upper
+        self._negated = negated
+
+    def __repr__(self) -> str:
+        """Return a simple repr of the prepared query, with its source."""
+        return f'<{self.__class__.__name__} {self.source!r}>'
+
+    def event(self, **bindings: Any) -> Event:
+        """Return the event that this query is about, with the given values for its parameters.
+
+        :param bindings: A value for each parameter
+        :returns Event: The event
+
+        :raises TypeError: If a parameter is missing, or there are values for parameters that don't exist
+        :raises NonsenseError: If the values don't make sense for the distribution or its bounds
+        """
+        if len(bindings) != len(self.parameters):
+            unknown = set(bindings) - set(self.parameters)
+            if unknown:
+                raise TypeError(f'Unknown parameters {", ".join(sorted(unknown))} for {self!r}')
+
+        try:
+            distribution = self._factory(*[
+                bindings[argument] if isinstance(argument, str) else argument for argument in self._arguments
+            ])
+
+            lower: tuple[Any, bool] = _NO_BOUND
+            upper: tuple[Any, bool] = _NO_BOUND
+
+            if self._lower is not None:
+                value = self._lower[0]
+                lower = (bindings[value] if isinstance(value, str) else value, self._lower[1])
+
+            if self._upper is self._lower:
+                upper = lower
+            elif self._upper is not None:
+                value = self._upper[0]
+                upper = (bindings[value] if isinstance(value, str) else value, self._upper[1])
+
+        except KeyError as e:
+            raise TypeError(f'Missing parameter {e.args[0]} for {self!r}') from None
+
+        for bound in (lower, upper):
+            if bound[0] is not None and not distribution._accepts(bound[0]):
+                raise NonsenseError(f'Cannot compare {distribution!r} with {bound[0]!r}')
+
+        if lower[0] is not None and upper[0] is not None and lower[0] > upper[0]:
+            raise NonsenseError('Cannot have lower bound greater than upper bound')
+
+        return Event(distribution, _Bounds(lower, upper), self._negated)
+
+    def __call__(self, calculator: ProbabilityCalculator | None = None, /, **bindings: Any) -> float:
+        """Return the probability of the event with the given values for its parameters, rounded like ``P()``.
+
+        :param calculator: The calculator whose number of significant figures should be used, or None for ``P``
+        :param bindings: A value for each parameter
+        :returns float: The probability
+
+        :raises TypeError: If a parameter is missing, or there are values for parameters that don't exist
+        :raises NonsenseError: If the values don't make sense for the distribution or the event
+        """
+        if calculator is None:
+            from . import P
+            calculator = P
+
+        return calculator(self.event(**bindings))
+
+    def many(
+        self,
+        bindings: Iterable[Mapping[str, Any]],
+        calculator: ProbabilityCalculator | None = None
+    ) -> list[float]:
+        """Return the probabilities for several sets of values for the parameters, like ``P.batch()``.
+
+        Events about the same distribution share their work, so this is faster than calling the query for each set.
+
+        :param bindings: The sets of values, each of which is a mapping from the names of the parameters to values
+        :param calculator: The calculator whose number of significant figures should be used, or None for ``P``
+        :returns: The probabilities, in the same order as the sets of values
+
+        :raises TypeError: If a parameter is missing from any set, or there are values for parameters that don't exist
+        :raises NonsenseError: If the values don't make sense for the distribution or the event
+        """
+        if calculator is None:
+            from . import P
+            calculator = P
+
+        return calculator.batch([self.event(**values) for values in bindings])
+
+
+@functools.lru_cache(maxsize=1024)
+def prepare(source: str) -> PreparedQuery:
+    """Parse and check a query like ``P(a < B(n, p) <= b)``, and return a prepared query to run it.
+
+    The query can be written with or without ``P()`` around it. The distribution can be compared
+    with up to two numbers or parameters, just like in Python, and any name that isn't a distribution
+    is a parameter. The results are cached by the source, so preparing the same query again is just
+    a dictionary lookup.
+
+    :param str source: The query
+    :returns PreparedQuery: The prepared query
+
+    :raises QuerySyntaxError: If the query can't be parsed
+    :raises NonsenseError: If the comparisons can't make an event, like ``a < B(n, p) > b``
+    """
+    return _Parser(source).query()
@@ -0,0 +1,90 @@
+# probcalc - Calculate probabilities for distributions
+# Copyright (C) 2022 D. Dyson (DoctorDalek1963)
+
+# This program is licensed under GNU GPLv3, available here:
+# <https://www.gnu.org/licenses/gpl-3.0.html>
+
+"""A module to make random number generators for the ``rvs()`` methods of the distributions.
+
+Every distribution can generate random variates with
+:meth:`probcalc.distribution_classes.Distribution.rvs`, which takes a seed and returns a NumPy array.
+The same seed always gives the same variates. For parallel workers, :func:`spawn` makes independent
+generators from one seed, so that their streams never overlap.
+
+NumPy is an optional dependency, so this module is only imported when ``rvs()`` is first used.
+Install it with ``pip install probcalc[numpy]``.
+
+:Example:
+
+>>> from probcalc import B, sampling
+>>> X = B(20, 0.25)
+>>> X.rvs(8, seed=1234).tolist()
+[9, 4, 8, 4, 4, 3, 4, 4]
+>>> [X.rvs(3, seed=generator).tolist() for generator in sampling.spawn(1234, 2)]
+[[5, 4, 6], [6, 5, 4]]
+"""
+
+from __future__ import annotations
+
+from typing import Sequence, Union
+
+try:
+    import numpy as np
+    import numpy.typing as npt
+
+except ImportError as e:  # pragma: no cover
+    raise ImportError('NumPy is needed for random sampling. Install it with `pip install probcalc[numpy]`') from e
+
+IntArray = npt.NDArray[np.int64]
+
+Seed = Union[None, int, Sequence[int], np.random.SeedSequence, np.random.Generator]
+"""Anything that can seed a random number generator.
+
+None gives fresh entropy from the operating system. A :class:`numpy.random.Generator` is used
+as it is, so repeated calls continue its stream rather than starting again.
+"""
+
+
+def generator(seed: Seed = None) -> np.random.Generator:
+    """Return a random number generator for the given seed.
+
+    :param seed: The seed. See :data:`Seed`
+    :returns: The generator, which is ``seed`` itself if it's already a generator
+    """
+    if isinstance(seed, np.random.Generator):
+        return seed
+
+    return np.random.default_rng(seed)
+
+
+def spawn(seed: int | Sequence[int] | np.random.SeedSequence | None, count: int) -> list[np.random.Generator]:
+    """Return independent random number generators for parallel workers.
+
+    This uses :meth:`numpy.random.SeedSequence.spawn`, so the streams are reproducible from
+    the seed, and they're statistically independent of each other.
+
+    :param seed: The seed to spawn the generators from, or None for fresh entropy
+    :param int count: The number of generators
+    :returns: A list of ``count`` generators
+    """
+    sequence = seed if isinstance(seed, np.random.SeedSequence) else np.random.SeedSequence(seed)
+    return [np.random.default_rng(child) for child in sequence.spawn(count)]
+
+
+def geometric(rng: np.random.Generator, probability: float, size: int | tuple[int, ...]) -> IntArray:
+    r"""Generate geometric random variates by inverting the CDF.
+
+    If :math:`U` is uniform on :math:`(0, 1]`, then :math:`\left\lceil \frac{\ln U}{\ln(1 - p)} \right\rceil`
+    is geometric with probability :math:`p`. Using :func:`numpy.log1p` keeps this accurate for small :math:`p`.
+
+    :param rng: The random number generator
+    :param float probability: The probability of success, which must be positive
+    :param size: The shape of the output
+    :returns: An array of trial numbers
+    """
+    if probability == 1:
+        return np.ones(size, dtype=np.int64)
+
+    uniform = 1 - rng.random(size)
+    trials: IntArray = np.maximum(np.ceil(np.log(uniform) / np.log1p(-probability)), 1).astype(np.int64)
+    return trials
@@ -0,0 +1,208 @@
+# probcalc - Calculate probabilities for distributions
+# Copyright (C) 2022 D. Dyson (DoctorDalek1963)
+
+# This program is licensed under GNU GPLv3, available here:
+# <https://www.gnu.org/licenses/gpl-3.0.html>
+
+r"""A module to sum PMF values accurately, without wasting work on terms that are too small to matter.
+
+:func:`sum_pmf` starts at the value in the range that's closest to the mode, where the biggest terms are,
+and expands outwards with the ratio of consecutive PMF values, which only costs one multiplication or
+division per term. The PMFs of binomial, Poisson, and geometric distributions are log-concave, which means
+this ratio keeps falling as we move away from the mode. So once the ratio :math:`r` is below 1, the rest of
+the tail after a term :math:`t` is at most the geometric series :math:`t \frac{r}{1 - r}`, and the sum stops
+in each direction as soon as that bound is below the tolerance, relative to the total so far.
+
+Every term is added with Neumaier's improvement of Kahan summation, which keeps the rounding error of
+the sum independent of the number of terms.
+
+Distributions use this with :meth:`probcalc.distribution_classes.Distribution._sum_pmf`, which any discrete
+distribution can support by returning its mode and PMF ratio from ``_pmf_recurrence()``. The log CDFs and
+log survival functions of binomial and Poisson distributions also use :func:`sum_tail` far out in the tails,
+where the closed forms underflow.
+
+:Example:
+
+>>> from probcalc import summation
+>>> total = summation.NeumaierSum()
+>>> for value in [1.0, 1e100, 1.0, -1e100]:
+...     total.add(value)
+>>> total.value
+2.0
+>>> round(summation.sum_pmf(lambda k: 0.5 ** k, 1, None, mode=1, ratio=lambda k: 0.5), 15)
+1.0
+"""
+
+from __future__ import annotations
+
+from typing import TYPE_CHECKING, Callable
+
+if TYPE_CHECKING:
+    from .distribution_classes import Distribution
+
+DEFAULT_TOLERANCE = 1e-17
+"""Sums stop when the rest of each tail is provably less than this fraction of the total so far."""
+
+
+class NeumaierSum:
+    """A running sum of floats, with Neumaier's compensated summation.
+
+    The compensation holds the low-order bits that were lost from the total in each addition, and it's
+    only added back at the end, so the error doesn't grow with the number of terms like it does for
+    naive summation. Unlike Kahan's original algorithm, this also works when a term is bigger than the total.
+    """
+
+    __slots__ = ('_total', '_compensation')
+
+    def __init__(self, initial: float = 0.0):
+        """Start a sum at the given value."""
+        self._total = initial
+        self._compensation = 0.0
+
+    def __repr__(self) -> str:
+        """Return a simple repr of the sum, containing its value."""
+        return f'{self.__class__.__module__}.{self.__class__.__name__}({self.value!r})'
+
+    def add(self, value: float) -> None:
+        """Add a value to the sum."""
+        total = self._total + value
+
+        if abs(self._total) >= abs(value):
+            self._compensation += (self._total - total) + value
+        else:
+            self._compensation += (value - total) + self._total
+
+        self._total = total
+
+    @property
+    def value(self) -> float:
+        """The value of the sum."""
+        return self._total + self._compensation
+
+
+def _sum_tail(
+    term: float,
+    ratio: Callable[[int], float],
+    first: int,
+    last: int | None,
+    step: int,
+    tolerance: float
+) -> tuple[float, int]:
+    """Return the sum from :func:`sum_tail` and the number of terms in it."""
+    total = NeumaierSum(term)
+    terms = 1
+
+    k = first
+    while k != last and term > 0:
+        r = ratio(k)
+
+        # The ratios keep falling, so the rest of the tail is at most a geometric series with this ratio
+        if r < 1 and term * r / (1 - r) <= tolerance * total.value:
+            break
+
+        term *= r
+        k += step
+        total.add(term)
+        terms += 1
+
+    return total.value, terms
+
+
+def sum_tail(
+    term: float,
+    ratio: Callable[[int], float],
+    first: int,
+    last: int | None,
+    step: int,
+    *,
+    tolerance: float = DEFAULT_TOLERANCE,
+    distribution: Distribution | None = None
+) -> float:
+    """Return the sum of consecutive PMF values, starting with ``term`` at ``first`` and moving away from the mode.
+
+    Each term is found from the one before with the ratio, and the sum stops when the rest of the tail is
+    provably less than the tolerance, so the PMF must be log-concave. The terms can be scaled by any constant,
+    so ``term`` can be 1 to find the sum relative to the first term, which can't underflow.
+
+    :param float term: The PMF at ``first``, or 1 for the sum relative to it
+    :param ratio: A function that takes ``k`` and returns ``pmf(k + step) / pmf(k)``
+    :param int first: The first value in the sum, which must be in the support
+    :param last: The last value in the sum, or None if the tail is unbounded
+    :param int step: 1 to sum upwards, or -1 to sum downwards
+    :param float tolerance: The largest fraction of the sum that the terms left out can add up to
+    :param distribution: The distribution whose PMF this is, which is only used to count the terms
+    :returns float: The sum
+    """
+    total, terms = _sum_tail(term, ratio, first, last, step, tolerance)
+
+    if _observer is not None:
+        _observer(distribution, terms)
+
+    return total
+
+
+def sum_pmf(
+    pmf: Callable[[int], float],
+    lower: int,
+    upper: int | None,
+    *,
+    mode: int | None = None,
+    ratio: Callable[[int], float] | None = None,
+    tolerance: float = DEFAULT_TOLERANCE,
+    distribution: Distribution | None = None
+) -> float:
+    """Return the sum of a PMF over the values from ``lower`` to ``upper`` inclusive.
+
+    If the mode and ratio are given, then the PMF must be log-concave, and the sum starts at the value closest
+    to the mode and stops when the rest is negligible, as described above. Otherwise, every term is evaluated
+    with ``pmf`` and added up, so ``upper`` can't be None.
+
+    :param pmf: The PMF, which is called with ints in the support
+    :param int lower: The first value to include, which must be in the support
+    :param upper: The last value to include, or None to include the whole upper tail
+    :param mode: The mode of the distribution
+    :param ratio: A function that takes ``k`` and returns ``pmf(k + 1) / pmf(k)``
+    :param float tolerance: The largest fraction of the sum that the terms left out of each tail can add up to
+    :param distribution: The distribution whose PMF this is, which is only used to count the terms
+    :returns float: The sum
+
+    :raises ValueError: If ``upper`` is None without a mode and ratio
+    """
+    if upper is not None and upper < lower:
+        return 0.0
+
+    if mode is None or ratio is None:
+        if upper is None:
+            raise ValueError('Cannot sum a PMF over an unbounded range without its mode and ratio')
+
+        total = NeumaierSum()
+        for k in range(lower, upper + 1):
+            total.add(pmf(k))
+
+        if _observer is not None:
+            _observer(distribution, upper - lower + 1)
+
+        return total.value
+
+    start = max(mode, lower) if upper is None else min(max(mode, lower), upper)
+    term = pmf(start)
+
+    # Each tail includes the term at the start, so it's subtracted once
+    below, terms_below = _sum_tail(term, lambda k: 1 / ratio(k - 1), start, lower, -1, tolerance)
+    above, terms_above = _sum_tail(term, ratio, start, upper, 1, tolerance)
+
+    if _observer is not None:
+        _observer(distribution, terms_below + terms_above - 1)
+
+    total = NeumaierSum(below)
+    total.add(above)
+    total.add(-term)
+    return total.value
+
+
+_observer: Callable[[Distribution | None, int], None] | None = None
+"""A function that gets called after every sum, used by :mod:`probcalc.instrumentation`.
+
+It's called with the distribution that was passed to the sum, if any, and the number of PMF terms
+that were added up. It's None when instrumentation is disabled, so that sums cost nothing extra.
+"""
@@ -0,0 +1,567 @@
+# probcalc - Calculate probabilities for distributions
+# Copyright (C) 2022 D. Dyson (DoctorDalek1963)
+
+# This program is licensed under GNU GPLv3, available here:
+# <https://www.gnu.org/licenses/gpl-3.0.html>
+
+"""A module to build and cache tables of PMF and CDF values for discrete distributions.
+
+The first time a discrete distribution needs its CDF, it builds a :class:`PMFTable` covering
+every value with non-negligible probability, and later queries just look values up in that table.
+Tables are shared between distributions with the same parameters, and they're kept in a global
+LRU cache with a memory budget, so a long-running process can't grow without bound.
+
+Tables for big distributions that get used all the time can be saved to a file once with
+:func:`save_table`, and then loaded by every process with :func:`load_table`. Loading a table
+memory-maps the file rather than reading it, so it's instant, and every process on the machine
+shares the same physical pages. Values outside the window of a loaded table are calculated as usual.
+
+:Example:
+
+>>> from probcalc import B, tables
+>>> tables.clear_cache()
+>>> X = B(1000, 0.3)
+>>> round(X.cdf(310), 10)
+0.7663050434
+>>> round(X.cdf(290), 10)
+0.2569083995
+>>> tables.cache_info()
+CacheInfo(hits=1, misses=1, entries=1, nbytes=6384, budget=67108864)
+"""
+
+from __future__ import annotations
+
+import sys
+import threading
+from array import array
+from bisect import bisect_left
+from collections import OrderedDict
+from itertools import accumulate
+from typing import TYPE_CHECKING, Any, Callable, Hashable, NamedTuple, Union
+
+if TYPE_CHECKING:
+    import os
+
+    from .distribution_classes import Distribution
+    from .vectorized import BoolArray, FloatArray
+
+NEGLIGIBLE = 1e-20
+"""Tables stop at the first value on each side of the mode whose probability is smaller than this."""
+
+_BYTES_PER_ENTRY = 3 * array('d').itemsize
+
+_Column = Union['array[float]', 'memoryview[Any]']
+"""A column of a table, which is a memoryview when the table is mapped from a file."""
+
+
+class PMFTable:
+    """A window of PMF values for one discrete distribution, with cumulative sums from both ends.
+
+    The window is every integer from :attr:`start` to :attr:`stop` inclusive. The probabilities
+    outside the window are accounted for in the cumulative sums, so :meth:`cdf` and :meth:`sf`
+    are exact up to floating point error for every value in the window.
+    """
+
+    start: int
+    """The first value in the table."""
+
+    stop: int
+    """The last value in the table."""
+
+    _pmf: _Column
+    _cdf: _Column
+    _sf: _Column
+    _lower_tail: float
+
+    def __init__(self, start: int, pmf: array[float], lower_tail: float, upper_tail: float):
+        """Create a table from PMF values and the probabilities of being below and above the window.
+
+        :param int start: The value that the first PMF value belongs to
+        :param pmf: The PMF values, starting at ``start``
+        :param float lower_tail: The probability of getting a value less than ``start``
+        :param float upper_tail: The probability of getting a value more than the last value in the table
+        """
+        self.start = start
+        self.stop = start + len(pmf) - 1
+
+        self._pmf = pmf
+        self._lower_tail = lower_tail
+        self._cdf = array('d', accumulate(pmf, initial=lower_tail))[1:]
+
+        # The survival function at each value is the sum of everything above it, so accumulate from the top
+        reversed_sf = array('d', accumulate(reversed(pmf), initial=upper_tail))[:-1]
+        reversed_sf.reverse()
+        self._sf = reversed_sf
+
+    @classmethod
+    def _from_columns(cls, start: int, pmf: _Column, cdf: _Column, sf: _Column, lower_tail: float) -> PMFTable:
+        """Create a table from columns that have already been accumulated, without copying them.
+
+        This is used by :func:`load_table` to wrap the columns mapped from a file.
+        """
+        table = cls.__new__(cls)
+        table.start = start
+        table.stop = start + len(pmf) - 1
+        table._pmf = pmf
+        table._cdf = cdf
+        table._sf = sf
+        table._lower_tail = lower_tail
+        return table
+
+    def __repr__(self) -> str:
+        """Return a simple repr of the table, containing its window."""
+        return f'{self.__class__.__module__}.{self.__class__.__name__}(start={self.start}, stop={self.stop})'
+
+    def __contains__(self, value: object) -> bool:
+        """Check if the value is inside the window of this table."""
+        return isinstance(value, (int, float)) and self.start <= value <= self.stop
+
+    @property
+    def probabilities(self) -> _Column:
+        """The PMF values in the window, from :attr:`start` to :attr:`stop`."""
+        return self._pmf
+
+    @property
+    def nbytes(self) -> int:
+        """The number of bytes taken up by the values in this table."""
+        return _BYTES_PER_ENTRY * len(self._pmf)
+
+    def pmf(self, value: int) -> float:
+        """Return the PMF at the given value, which must be inside the window."""
+        return self._pmf[int(value) - self.start]
+
+    def cdf(self, value: int) -> float:
+        """Return the CDF at the given value, which must be inside the window."""
+        return self._cdf[int(value) - self.start]
+
+    def sf(self, value: int) -> float:
+        """Return the survival function at the given value, which must be inside the window."""
+        return self._sf[int(value) - self.start]
+
+    def ppf(self, probability: float) -> int | None:
+        """Return the smallest value in the window whose CDF is at least the given probability.
+
+        This is a binary search of the cumulative sums, so it only takes logarithmic time.
+
+        :param float probability: The probability, between 0 and 1
+        :returns: The value, or None if it isn't in the window
+        """
+        index = bisect_left(self._cdf, probability)
+
+        # If the CDF just below the window is already big enough, then the answer is below the window
+        if index == len(self._cdf) or (index == 0 and self._lower_tail >= probability):
+            return None
+
+        return self.start + index
+
+    def isf(self, probability: float) -> int | None:
+        """Return the smallest value in the window whose survival function is at most the given probability.
+
+        This is a binary search of the cumulative sums, like :meth:`ppf`.
+
+        :param float probability: The probability, between 0 and 1
+        :returns: The value, or None if it isn't in the window
+        """
+        # The survival function decreases, so bisect doesn't work directly
+        low = 0
+        high = len(self._sf)
+        while low < high:
+            middle = (low + high) // 2
+
+            if self._sf[middle] <= probability:
+                high = middle
+            else:
+                low = middle + 1
+
+        if low == len(self._sf) or (low == 0 and 1 - self._lower_tail <= probability):
+            return None
+
+        return self.start + low
+
+    def lookup_array(self, column: str, values: FloatArray) -> tuple[FloatArray, BoolArray]:
+        """Look up every element of an array of values that's inside the window.
+
+        This needs NumPy to be installed, but it doesn't copy the table.
+
+        :param str column: Which values to look up, out of ``'pmf'``, ``'cdf'``, and ``'sf'``
+        :param values: An array of integer values
+        :returns: The looked up values, with 0 outside the window, and a mask of which elements were inside the window
+        """
+        import numpy as np
+
+        inside = (values >= self.start) & (values <= self.stop)
+        table = np.frombuffer(getattr(self, '_' + column), dtype=np.float64)
+
+        results = np.zeros_like(values)
+        results[inside] = table[values[inside].astype(np.int64) - self.start]
+        return results, inside
+
+    def quantile_array(self, column: str, probabilities: FloatArray) -> tuple[FloatArray, BoolArray]:
+        """Find :meth:`ppf` or :meth:`isf` for every element of an array of probabilities, with binary searches.
+
+        This needs NumPy to be installed, but it doesn't copy the table.
+
+        :param str column: Which function to invert, out of ``'cdf'`` for :meth:`ppf` and ``'sf'`` for :meth:`isf`
+        :param probabilities: An array of probabilities between 0 and 1
+        :returns: The values, with 0 where they're outside the window, and a mask of which elements were inside
+        """
+        import numpy as np
+
+        size = len(self._pmf)
+
+        if column == 'cdf':
+            indices = np.searchsorted(np.frombuffer(self._cdf, dtype=np.float64), probabilities, side='left')
+            inside = (indices < size) & ((indices > 0) | (self._lower_tail < probabilities))
+        else:
+            # Search the reversed survival function, which increases, for the last element at most each probability
+            reversed_sf = np.frombuffer(self._sf, dtype=np.float64)[::-1]
+            indices = size - np.searchsorted(reversed_sf, probabilities, side='right')
+            inside = (indices < size) & ((indices > 0) | (1 - self._lower_tail > probabilities))
+
+        results = np.where(inside, self.start + indices, 0).astype(np.float64)
+        return results, inside
+
+
+def build_table(
+    mode: int,
+    mode_pmf: float,
+    ratio: Callable[[int], float],
+    *,
+    minimum: int,
+    maximum: int | None,
+    lower_tail: Callable[[int], float],
+    upper_tail: Callable[[int], float]
+) -> PMFTable:
+    """Build a :class:`PMFTable` by walking outwards from the mode with the ratio of consecutive PMF values.
+
+    This only needs one direct evaluation of the PMF, at the mode. Every other value is found with
+    one multiplication or division, which is much cheaper than calling :func:`math.lgamma` for each.
+
+    :param int mode: The mode of the distribution
+    :param float mode_pmf: The PMF at the mode
+    :param ratio: A function that takes ``k`` and returns ``pmf(k + 1) / pmf(k)``
+    :param int minimum: The smallest value in the support of the distribution
+    :param maximum: The largest value in the support of the distribution, or None if it's unbounded
+    :param lower_tail: A function that takes ``k`` and returns the probability of getting less than ``k``
+    :param upper_tail: A function that takes ``k`` and returns the probability of getting more than ``k``
+    :returns PMFTable: The table
+    """
+    below = array('d')
+    term = mode_pmf
+    start = mode
+    while start > minimum:
+        step = ratio(start - 1)
+        term = term / step if step != 0 else 0.0
+
+        if term < NEGLIGIBLE:
+            break
+
+        below.append(term)
+        start -= 1
+
+    above = array('d')
+    term = mode_pmf
+    stop = mode
+    while maximum is None or stop < maximum:
+        term *= ratio(stop)
+
+        if term < NEGLIGIBLE:
+            break
+
+        above.append(term)
+        stop += 1
+
+    below.reverse()
+    below.append(mode_pmf)
+    below.extend(above)
+
+    return PMFTable(
+        start,
+        below,
+        lower_tail(start) if start > minimum else 0.0,
+        upper_tail(stop) if maximum is None or stop < maximum else 0.0
+    )
+
+
+class CacheInfo(NamedTuple):
+    """Statistics about the table cache, in the style of :func:`functools.lru_cache`."""
+
+    hits: int
+    misses: int
+    entries: int
+    nbytes: int
+    budget: int
+
+
+class _TableCache:
+    """A thread-safe LRU cache of :class:`PMFTable` objects, with a limit on their total size in bytes."""
+
+    def __init__(self, budget: int):
+        """Create an empty cache with the given memory budget in bytes."""
+        self._budget = budget
+        self._tables: OrderedDict[Hashable, PMFTable] = OrderedDict()
+        self._nbytes = 0
+        self._hits = 0
+        self._misses = 0
+        self._lock = threading.Lock()
+
+        # Tables loaded from files are pinned here, outside the LRU order and the memory budget
+        self._pinned: dict[Hashable, PMFTable] = {}
+
+    def get(self, key: Hashable, expected_entries: int, builder: Callable[[], PMFTable]) -> PMFTable | None:
+        """Return the table for the given key, building and caching it if needed.
+
+        :param key: The key identifying the distribution, which is a tuple of the name of its class and its parameters
+        :param int expected_entries: Roughly how many values the table would hold
+        :param builder: A function that builds the table
+        :returns: The table, or None if it would take up too much of the memory budget
+        """
+        with self._lock:
+            table = self._pinned.get(key)
+
+            if table is not None:
+                self._hits += 1
+
+            elif (table := self._tables.get(key)) is not None:
+                self._tables.move_to_end(key)
+                self._hits += 1
+
+            else:
+                self._misses += 1
+
+        if table is not None:
+            if _observer is not None:
+                _observer(key, True, 0)
+
+            return table
+
+        # One table shouldn't be able to evict everything else
+        if expected_entries * _BYTES_PER_ENTRY > self._budget // 4:
+            if _observer is not None:
+                _observer(key, False, 0)
+
+            return None
+
+        table = builder()
+
+        if _observer is not None:
+            _observer(key, False, table.stop - table.start + 1)
+
+        with self._lock:
+            if key not in self._tables:
+                self._tables[key] = table
+                self._nbytes += table.nbytes
+                self._evict()
+
+        return table
+
+    def __contains__(self, key: Hashable) -> bool:
+        """Check if there's a table for the given key, without counting it as a hit or a miss."""
+        with self._lock:
+            return key in self._pinned or key in self._tables
+
+    def pin(self, key: Hashable, table: PMFTable) -> None:
+        """Pin a table, so that it's always used for the given key and never evicted."""
+        with self._lock:
+            self._pinned[key] = table
+
+    def unpin_all(self) -> None:
+        """Unpin every pinned table."""
+        with self._lock:
+            self._pinned.clear()
+
+    def _evict(self) -> None:
+        """Remove the least recently used tables until the cache fits in its budget."""
+        while self._nbytes > self._budget and self._tables:
+            _, table = self._tables.popitem(last=False)
+            self._nbytes -= table.nbytes
+
+    def set_budget(self, budget: int) -> None:
+        """Set the memory budget in bytes, evicting tables if needed."""
+        with self._lock:
+            self._budget = budget
+            self._evict()
+
+    def clear(self) -> None:
+        """Remove every table from the cache and reset the statistics. Pinned tables stay pinned."""
+        with self._lock:
+            self._tables.clear()
+            self._nbytes = 0
+            self._hits = 0
+            self._misses = 0
+
+    def info(self) -> CacheInfo:
+        """Return statistics about the cache."""
+        with self._lock:
+            return CacheInfo(self._hits, self._misses, len(self._tables), self._nbytes, self._budget)
+
+
+_observer: Callable[[Hashable, bool, int], None] | None = None
+"""A function that gets called after every lookup in the cache, used by :mod:`probcalc.instrumentation`.
+
+It's called with the key, whether the lookup was a hit, and the number of PMF values computed to build
+the table, which is 0 for a hit. The first element of every key is the name of the distribution class.
+"""
+
+DEFAULT_BUDGET = 64 * 1024 * 1024
+"""The default memory budget of the table cache, in bytes."""
+
+_cache = _TableCache(DEFAULT_BUDGET)
+
+
+def get_table(key: Hashable, expected_entries: int, builder: Callable[[], PMFTable]) -> PMFTable | None:
+    """Return the cached table for the given key, building it with ``builder`` if needed.
+
+    This is used by distributions. See :meth:`_TableCache.get`.
+    """
+    return _cache.get(key, expected_entries, builder)
+
+
+def is_cached(key: Hashable) -> bool:
+    """Check if there's a cached table for the given key, without counting it as a hit or a miss."""
+    return key in _cache
+
+
+def set_memory_budget(nbytes: int) -> None:
+    """Set the total number of bytes that cached tables can take up.
+
+    :raises ValueError: If ``nbytes`` is negative
+    """
+    if not isinstance(nbytes, int) or nbytes < 0:
+        raise ValueError(f'Memory budget must be a non-negative integer, not {nbytes}')
+
+    _cache.set_budget(nbytes)
+
+
+def clear_cache() -> None:
+    """Remove every cached table. Tables loaded with :func:`load_table` stay loaded."""
+    _cache.clear()
+
+
+def cache_info() -> CacheInfo:
+    """Return the hits, misses, number of entries, size in bytes, and memory budget of the table cache."""
+    return _cache.info()
+
+
+_FILE_MAGIC = b'PROBCALC'
+_FILE_VERSION = 1
+
+_FILE_HEADER = '<8sI32sqqdI'
+"""The header of a table file, which is packed little-endian with :mod:`struct`.
+
+The fields are the magic bytes, the version of the format, the SHA-256 hash of the key, the first value
+in the table, the number of values, the probability below the window, and the length of the key. The key
+comes after the header as JSON, padded to a multiple of 8 bytes, and then the PMF, CDF, and survival
+function columns, each as little-endian 64-bit floats.
+"""
+
+
+def _encode_key(key: tuple[Any, ...]) -> tuple[bytes, bytes]:
+    """Return a key as JSON, and its hash."""
+    import hashlib
+    import json
+
+    encoded = json.dumps(list(key)).encode()
+    return encoded, hashlib.sha256(encoded).digest()
+
+
+def save_table(distribution: Distribution, path: str | os.PathLike[str]) -> None:
+    """Build the table for a distribution, if it's not already cached, and save it to a file for :func:`load_table`.
+
+    The file starts with a header containing a hash of the parameters of the distribution,
+    so that a file can't be loaded for the wrong distribution by mistake.
+
+    :param Distribution distribution: The distribution, which must be binomial or Poisson
+    :param path: The path of the file to write
+    :raises ValueError: If the distribution has no table, or it's too big for the memory budget
+    """
+    import struct
+
+    key = distribution._table_key()
+    table = distribution._pmf_table()
+
+    if key is None or table is None:
+        raise ValueError(f'{distribution!r} has no table to save, or it is too big for the memory budget')
+
+    encoded_key, digest = _encode_key(key)
+    length = table.stop - table.start + 1
+    header = struct.pack(_FILE_HEADER, _FILE_MAGIC, _FILE_VERSION, digest, table.start, length,
+                         table._lower_tail, len(encoded_key))
+
+    with open(path, 'wb') as file:
+        file.write(header)
+        file.write(encoded_key)
+        file.write(bytes(-(len(header) + len(encoded_key)) % 8))
+
+        for column in (table._pmf, table._cdf, table._sf):
+            values = array('d', column)
+
+            if sys.byteorder != 'little':
+                values.byteswap()
+
+            file.write(values.tobytes())
+
+
+def load_table(path: str | os.PathLike[str], distribution: Distribution | None = None) -> tuple[Any, ...]:
+    """Memory-map a table saved by :func:`save_table`, so that its distribution uses it from now on.
+
+    The table isn't copied or counted in the memory budget, and it's never evicted from the cache.
+    Every process that loads the same file shares the same physical memory for it.
+
+    :param path: The path of the file
+    :param distribution: The distribution that the table must be for, or None to accept any distribution
+    :returns: The key of the distribution that the table is for, like ``('PoissonDistribution', 10000000)``
+    :raises ValueError: If the file isn't a valid table, or it's for a different distribution
+    """
+    import json
+    import mmap
+    import struct
+
+    with open(path, 'rb') as file:
+        mapped = mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ)
+
+    header_size = struct.calcsize(_FILE_HEADER)
+
+    if len(mapped) < header_size or mapped[:len(_FILE_MAGIC)] != _FILE_MAGIC:
+        raise ValueError(f'{path} is not a probcalc table')
+
+    _, version, digest, start, length, lower_tail, key_length = struct.unpack_from(_FILE_HEADER, mapped)
+
+    if version != _FILE_VERSION:
+        raise ValueError(f'{path} has version {version} of the table format, not version {_FILE_VERSION}')
+
+    encoded_key = mapped[header_size:header_size + key_length]
+    key = tuple(json.loads(encoded_key))
+
+    if _encode_key(key)[1] != digest:
+        raise ValueError(f'{path} is corrupted, because its key does not match its hash')
+
+    if distribution is not None and distribution._table_key() != key:
+        raise ValueError(f'{path} is a table for {key}, not {distribution!r}')
+
+    offset = header_size + key_length + -(header_size + key_length) % 8
+    column_size = length * 8
+
+    if len(mapped) != offset + 3 * column_size:
+        raise ValueError(f'{path} is corrupted, because it is the wrong size')
+
+    view = memoryview(mapped)
+    columns: list[_Column] = [
+        view[offset + i * column_size:offset + (i + 1) * column_size].cast('d') for i in range(3)
+    ]
+
+    # Big-endian machines can't use the columns directly, so they get swapped copies instead
+    if sys.byteorder != 'little':
+        for i, column in enumerate(columns):
+            swapped = array('d', column)
+            swapped.byteswap()
+            columns[i] = swapped
+
+    pmf, cdf, sf = columns
+    _cache.pin(key, PMFTable._from_columns(start, pmf, cdf, sf, lower_tail))
+    return key
+
+
+def unload_tables() -> None:
+    """Stop using every table loaded with :func:`load_table`. They're unmapped once nothing uses them."""
+    _cache.unpin_all()
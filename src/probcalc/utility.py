@@ -6,39 +6,59 @@
 
 """A simple utility module to just provide helper functions for the maths."""
 
-from functools import reduce
-from math import floor, log10, pi, sqrt
-from operator import mul
-
-# Compute constants at import time for slight speed increase
-TWO_OVER_ROOT_PI = 2 / sqrt(pi)
-
-
-def factorial(n: int) -> int:
-    """Return the factorial of ``n``."""
-    return reduce(mul, range(1, n + 1), 1)
+from __future__ import annotations
 
+import functools
+from math import cos, erfc, exp, floor, inf, lgamma, log, log1p, log10, pi, sqrt
 
-def factorial_fraction(n: int) -> float:
-    """Return ``1 / factorial(n)``, but without overflowing."""
-    return reduce(lambda a, b: a / b, range(1, n + 1), 1.0)
+# These used to be defined here, so they're still available from here
+from .combinatorics import (  # noqa: F401
+    choose as choose,
+    factorial as factorial,
+    factorial_fraction as factorial_fraction
+)
 
+# Compute constants at import time for slight speed increase
+TWO_OVER_ROOT_PI = 2 / sqrt(pi)
+_ROOT_TWO = sqrt(2)
+_ROOT_TWO_PI = sqrt(2 * pi)
+_HALF_LOG_TWO_PI = 0.5 * log(2 * pi)
 
-def choose(n: int, r: int) -> int:
-    r"""Return the number of ways to choose ``r`` items from ``n`` elements.
+# Constants for the modified Lentz algorithm used to evaluate continued fractions
+_LENTZ_TINY = 1e-300
+_LENTZ_EPSILON = 1e-16
 
-    This is often written as :math:`\binom{n}{r}` or :math:`^nC_r`.
+# The continued fraction for the incomplete beta function converges well within this many
+# iterations everywhere it's used, so needing any more means that something has gone wrong
+_BETA_MAX_ITERATIONS = 300
 
-    :param int n: The number of items to choose from
-    :param int r: The number of items to be chosen
-    :returns int: The number of ways to choose ``r`` from ``n``
+# Close to the peak of the beta density, the continued fraction needs more iterations the bigger
+# the shape parameters are. It's only evaluated up to this many standard deviations below the mean,
+# and the density from there up to the point is integrated with Gauss-Legendre quadrature of this order
+_BETA_QUADRATURE_START = 4.0
+_BETA_QUADRATURE_ORDER = 16
 
-    :raises ValueError: If ``r > n``
-    """
-    if r > n:
-        raise ValueError(f'Cannot choose {r} items from only {n} elements')
+# Coefficients of Peter Acklam's rational approximation to the inverse of the standard normal CDF.
+# The central coefficients are used when 0.02425 <= p <= 0.5, and the tail coefficients below that
+_ACKLAM_CENTRAL_NUMERATOR = (
+    -3.969683028665376e+01, 2.209460984245205e+02, -2.759285104469687e+02,
+    1.383577518672690e+02, -3.066479806614716e+01, 2.506628277459239e+00
+)
+_ACKLAM_CENTRAL_DENOMINATOR = (
+    -5.447609879822406e+01, 1.615858368580409e+02, -1.556989798598866e+02,
+    6.680131188771972e+01, -1.328068155288572e+01, 1.0
+)
+_ACKLAM_TAIL_NUMERATOR = (
+    -7.784894002430293e-03, -3.223964580411365e-01, -2.400758277161838e+00,
+    -2.549732539343734e+00, 4.374664141464968e+00, 2.938163982698783e+00
+)
+_ACKLAM_TAIL_DENOMINATOR = (
+    7.784695709041462e-03, 3.224671290700398e-01, 2.445134137142996e+00, 3.754408661907416e+00, 1.0
+)
+_ACKLAM_LOW = 0.02425
 
-    return factorial(n) // (factorial(r) * factorial(n - r))
+# Coefficients of the asymptotic series for the tail of the normal CDF, in powers of 1 / z^2, highest first
+_NORMAL_TAIL_SERIES = (10395.0, -945.0, 105.0, -15.0, 3.0, -1.0, 1.0)
 
 
 def round_sig_fig(n: float, sig_fig: int) -> float:
@@ -61,3 +81,387 @@ def round_sig_fig(n: float, sig_fig: int) -> float:
     """
     # This code was taken from a comment on this SO answer: https://stackoverflow.com/a/3411435/12985838
     return n if n == 0 else round(n, -int(floor(log10(abs(n)))) + (sig_fig - 1))
+
+
+def xlogy(x: float, y: float) -> float:
+    """Return ``x * log(y)``, but with 0 whenever ``x`` is 0, even if ``y`` is also 0."""
+    if x == 0:
+        return 0.0
+
+    return x * log(y) if y > 0 else -inf
+
+
+def xlog1py(x: float, y: float) -> float:
+    """Return ``x * log1p(y)``, like :func:`xlogy`."""
+    if x == 0:
+        return 0.0
+
+    return x * log1p(y) if y > -1 else -inf
+
+
+def _beta_continued_fraction(a: float, b: float, x: float) -> float:
+    """Evaluate the continued fraction for the incomplete beta function with the modified Lentz algorithm.
+
+    This converges quickly when ``x`` is well below the mean ``a / (a + b)``, so the caller
+    should use the symmetry relation and quadrature to make sure that's the case.
+
+    The algorithm is taken from section 6.4 of *Numerical Recipes in C* (2nd edition).
+
+    :raises ArithmeticError: If the continued fraction doesn't converge
+    """
+    qab = a + b
+    qap = a + 1
+    qam = a - 1
+
+    c = 1.0
+    d = 1 - qab * x / qap
+    if abs(d) < _LENTZ_TINY:
+        d = _LENTZ_TINY
+
+    d = 1 / d
+    h = d
+
+    for m in range(1, _BETA_MAX_ITERATIONS + 1):
+        m2 = 2 * m
+
+        # Even step of the recurrence
+        aa = m * (b - m) * x / ((qam + m2) * (a + m2))
+        d = 1 + aa * d
+        if abs(d) < _LENTZ_TINY:
+            d = _LENTZ_TINY
+
+        c = 1 + aa / c
+        if abs(c) < _LENTZ_TINY:
+            c = _LENTZ_TINY
+
+        d = 1 / d
+        h *= d * c
+
+        # Odd step of the recurrence
+        aa = -(a + m) * (qab + m) * x / ((a + m2) * (qap + m2))
+        d = 1 + aa * d
+        if abs(d) < _LENTZ_TINY:
+            d = _LENTZ_TINY
+
+        c = 1 + aa / c
+        if abs(c) < _LENTZ_TINY:
+            c = _LENTZ_TINY
+
+        d = 1 / d
+        delta = d * c
+        h *= delta
+
+        if abs(delta - 1) < _LENTZ_EPSILON:
+            return h
+
+    raise ArithmeticError(
+        f'The incomplete beta function with a={a}, b={b} and x={x} '
+        f'did not converge within {_BETA_MAX_ITERATIONS} iterations'
+    )
+
+
+@functools.lru_cache(maxsize=None)
+def _gauss_legendre(order: int) -> tuple[tuple[float, float], ...]:
+    """Return the ``(node, weight)`` pairs of Gauss-Legendre quadrature of the given order on ``[-1, 1]``.
+
+    The nodes are the roots of the Legendre polynomial, found with Newton's method.
+    """
+    pairs = []
+    for i in range(1, order + 1):
+        node = cos(pi * (i - 0.25) / (order + 0.5))
+
+        while True:
+            # Evaluate the Legendre polynomial and its derivative with the three-term recurrence
+            current, previous = 1.0, 0.0
+            for j in range(1, order + 1):
+                current, previous = ((2 * j - 1) * node * current - (j - 1) * previous) / j, current
+
+            derivative = order * (node * current - previous) / (node * node - 1)
+            step = current / derivative
+            node -= step
+
+            if abs(step) < _LENTZ_EPSILON:
+                break
+
+        pairs.append((node, 2 / ((1 - node * node) * derivative * derivative)))
+
+    return tuple(pairs)
+
+
+def _incomplete_beta_below_peak(a: float, b: float, x: float, y: float, log_front: float) -> float:
+    r"""Return :math:`I_x(a, b)` for a point ``x`` no higher than about the mean of the beta distribution.
+
+    If ``x`` is close to the mean, then the continued fraction is evaluated further down instead,
+    and the density from there up to ``x`` is added with Gauss-Legendre quadrature. This keeps
+    the cost bounded however big ``a`` and ``b`` are.
+
+    :param float y: Exactly ``1 - x``
+    :param float log_front: The log of :math:`x^a y^b / B(a, b)`
+    """
+    start = a / (a + b) - _BETA_QUADRATURE_START * sqrt(a * b / (a + b + 1)) / (a + b)
+
+    if start <= 0 or x <= start:
+        return exp(log_front) * _beta_continued_fraction(a, b, x) / a
+
+    # Everything is scaled relative to the density at x, and written
+    # in terms of distances from x to keep the precision
+    width = x - start
+    total = _beta_continued_fraction(a, b, start) / a * exp(a * log1p(-width / x) + b * log1p(width / y))
+
+    density_sum = 0.0
+    for node, weight in _gauss_legendre(_BETA_QUADRATURE_ORDER):
+        offset = 0.5 * width * (node - 1)
+        density_sum += weight * exp((a - 1) * log1p(offset / x) + (b - 1) * log1p(-offset / y))
+
+    total += 0.5 * width * density_sum / (x * y)
+    return exp(log_front) * total
+
+
+def regularized_incomplete_beta(a: float, b: float, x: float, y: float | None = None) -> float:
+    r"""Return the regularized incomplete beta function :math:`I_x(a, b)`.
+
+    This is evaluated with a continued fraction, so the cost doesn't depend on the size
+    of ``a`` and ``b`` in the way that a sum of terms would. Whichever of :math:`I_x(a, b)`
+    and :math:`1 - I_x(a, b) = I_{1 - x}(b, a)` converges faster is evaluated directly.
+
+    If ``1 - x`` is known more precisely than it can be computed from ``x``, like when
+    ``x`` is ``1 - p`` for a tiny ``p``, then it should be passed as ``y``.
+
+    :Example:
+
+    >>> round(regularized_incomplete_beta(2, 3, 0.4), 10)
+    0.5248
+
+    :param float a: The first shape parameter, which must be positive
+    :param float b: The second shape parameter, which must be positive
+    :param float x: The point to evaluate at, between 0 and 1
+    :param y: The value of ``1 - x``, if it's known exactly
+    :type y: float or None
+    :returns float: The value of :math:`I_x(a, b)`
+
+    :raises ValueError: If ``a`` or ``b`` is not positive
+    :raises ArithmeticError: If the continued fraction doesn't converge
+    """
+    if a <= 0 or b <= 0:
+        raise ValueError(f'Shape parameters of the incomplete beta function must be positive, not {a} and {b}')
+
+    if y is None:
+        y = 1 - x
+
+    if x <= 0:
+        return 0.0
+
+    if y <= 0:
+        return 1.0
+
+    log_x = log(x) if x <= 0.5 else log1p(-y)
+    log_y = log(y) if y <= 0.5 else log1p(-x)
+    log_front = lgamma(a + b) - lgamma(a) - lgamma(b) + a * log_x + b * log_y
+
+    if x < (a + 1) / (a + b + 2):
+        return _incomplete_beta_below_peak(a, b, x, y, log_front)
+
+    return 1 - _incomplete_beta_below_peak(b, a, y, x, log_front)
+
+
+def _lower_gamma_series(a: float, x: float) -> float:
+    """Evaluate the series for the regularized lower incomplete gamma function :math:`P(a, x)`.
+
+    This converges quickly when ``x < a + 1``. The algorithm is taken from section 6.2
+    of *Numerical Recipes in C* (2nd edition).
+    """
+    term = 1 / a
+    total = term
+    ap = a
+
+    max_iterations = 200 + int(10 * sqrt(a))
+    for _ in range(max_iterations):
+        ap += 1
+        term *= x / ap
+        total += term
+
+        if abs(term) < abs(total) * _LENTZ_EPSILON:
+            break
+
+    return total * exp(-x + a * log(x) - lgamma(a))
+
+
+def _upper_gamma_continued_fraction(a: float, x: float) -> float:
+    """Evaluate the continued fraction for the regularized upper incomplete gamma function :math:`Q(a, x)`.
+
+    This converges quickly when ``x >= a + 1``. It uses the modified Lentz algorithm,
+    and is taken from section 6.2 of *Numerical Recipes in C* (2nd edition).
+    """
+    b = x + 1 - a
+    c = 1 / _LENTZ_TINY
+    d = 1 / b
+    h = d
+
+    max_iterations = 200 + int(10 * sqrt(a))
+    for i in range(1, max_iterations + 1):
+        an = -i * (i - a)
+        b += 2
+
+        d = an * d + b
+        if abs(d) < _LENTZ_TINY:
+            d = _LENTZ_TINY
+
+        c = b + an / c
+        if abs(c) < _LENTZ_TINY:
+            c = _LENTZ_TINY
+
+        d = 1 / d
+        delta = d * c
+        h *= delta
+
+        if abs(delta - 1) < _LENTZ_EPSILON:
+            break
+
+    return h * exp(-x + a * log(x) - lgamma(a))
+
+
+def regularized_lower_gamma(a: float, x: float) -> float:
+    r"""Return the regularized lower incomplete gamma function :math:`P(a, x)`.
+
+    This uses a series when ``x < a + 1`` and a continued fraction for :math:`1 - P(a, x)`
+    otherwise, so that the cost stays small for very large ``a`` and ``x``.
+
+    :Example:
+
+    >>> round(regularized_lower_gamma(3, 2), 10)
+    0.3233235838
+
+    :param float a: The shape parameter, which must be positive
+    :param float x: The point to evaluate at, which must not be negative
+    :returns float: The value of :math:`P(a, x)`
+
+    :raises ValueError: If ``a`` is not positive
+    """
+    if a <= 0:
+        raise ValueError(f'Shape parameter of the incomplete gamma function must be positive, not {a}')
+
+    if x <= 0:
+        return 0.0
+
+    if x < a + 1:
+        return _lower_gamma_series(a, x)
+
+    return 1 - _upper_gamma_continued_fraction(a, x)
+
+
+def regularized_upper_gamma(a: float, x: float) -> float:
+    r"""Return the regularized upper incomplete gamma function :math:`Q(a, x) = 1 - P(a, x)`.
+
+    See :func:`regularized_lower_gamma`. Small values of :math:`Q(a, x)` are
+    evaluated directly, rather than by subtracting from 1.
+
+    :Example:
+
+    >>> round(regularized_upper_gamma(3, 2), 10)
+    0.6766764162
+
+    :param float a: The shape parameter, which must be positive
+    :param float x: The point to evaluate at, which must not be negative
+    :returns float: The value of :math:`Q(a, x)`
+
+    :raises ValueError: If ``a`` is not positive
+    """
+    if a <= 0:
+        raise ValueError(f'Shape parameter of the incomplete gamma function must be positive, not {a}')
+
+    if x <= 0:
+        return 1.0
+
+    if x < a + 1:
+        return 1 - _lower_gamma_series(a, x)
+
+    return _upper_gamma_continued_fraction(a, x)
+
+
+def _horner(coefficients: tuple[float, ...], x: float) -> float:
+    """Evaluate the polynomial with the given coefficients, highest power first, at ``x``."""
+    result = 0.0
+    for coefficient in coefficients:
+        result = result * x + coefficient
+
+    return result
+
+
+def log_standard_normal_cdf(z: float) -> float:
+    r"""Return the natural log of the CDF of the standard normal distribution, :math:`\ln \Phi(z)`.
+
+    This uses :func:`math.erfc` while the CDF fits in a float, and otherwise an asymptotic series,
+    so it stays accurate far into the lower tail, where the CDF itself underflows to 0. Above 0,
+    it uses :func:`math.log1p` with the upper tail, since the CDF is close to 1 there.
+
+    :Example:
+
+    >>> round(log_standard_normal_cdf(-1), 10)
+    -1.841021645
+    >>> round(log_standard_normal_cdf(-40), 6)
+    -804.608442
+
+    :param float z: The value to find the log probability for
+    :returns float: The log of the probability
+    """
+    if z > 0:
+        return log1p(-0.5 * erfc(z / _ROOT_TWO))
+
+    cdf = 0.5 * erfc(-z / _ROOT_TWO)
+
+    if cdf >= 1e-300:
+        return log(cdf)
+
+    # Here, z < -37, so 1 / z^2 is small and the series converges quickly
+    inverse_squared = 1 / (z * z)
+    return -0.5 * z * z - log(-z) - _HALF_LOG_TWO_PI + log(_horner(_NORMAL_TAIL_SERIES, inverse_squared))
+
+
+def standard_normal_ppf(p: float) -> float:
+    r"""Return the inverse of the CDF of the standard normal distribution, :math:`\Phi^{-1}(p)`.
+
+    This starts with Peter Acklam's rational approximation, which has a relative error of
+    about :math:`10^{-9}`, and then takes one step of Halley's method, which brings it to
+    full double precision. The upper half uses :math:`\Phi^{-1}(p) = -\Phi^{-1}(1 - p)`.
+
+    :Example:
+
+    >>> round(standard_normal_ppf(0.975), 10)
+    1.9599639845
+    >>> round(standard_normal_ppf(1e-10), 10)
+    -6.3613409024
+
+    :param float p: The probability, which must be between 0 and 1
+    :returns float: The value :math:`z` such that :math:`\Phi(z) = p`
+
+    :raises ValueError: If ``p`` is not between 0 and 1
+    """
+    if not 0 <= p <= 1:
+        raise ValueError(f'Probability must be between 0 and 1, not {p}')
+
+    if p == 0:
+        return -inf
+
+    if p == 1:
+        return inf
+
+    # 1 - p is exact here, and the refinement below is only accurate in the lower tail
+    if p > 0.5:
+        return -standard_normal_ppf(1 - p)
+
+    if p < _ACKLAM_LOW:
+        q = sqrt(-2 * log(p))
+        x = _horner(_ACKLAM_TAIL_NUMERATOR, q) / _horner(_ACKLAM_TAIL_DENOMINATOR, q)
+
+    else:
+        q = p - 0.5
+        r = q * q
+        x = q * _horner(_ACKLAM_CENTRAL_NUMERATOR, r) / _horner(_ACKLAM_CENTRAL_DENOMINATOR, r)
+
+    # exp() overflows past about 709, which only happens for p smaller than about 1e-308
+    if x * x < 1400:
+        error = 0.5 * erfc(-x / _ROOT_TWO) - p
+        u = error * _ROOT_TWO_PI * exp(0.5 * x * x)
+        x -= u / (1 + 0.5 * x * u)
+
+    return x
@@ -0,0 +1,402 @@
+# probcalc - Calculate probabilities for distributions
+# Copyright (C) 2022 D. Dyson (DoctorDalek1963)
+
+# This program is licensed under GNU GPLv3, available here:
+# <https://www.gnu.org/licenses/gpl-3.0.html>
+
+"""A module of NumPy versions of the special functions in :mod:`probcalc.utility`.
+
+These functions evaluate whole arrays in one pass, and they back the ``*_array`` methods of
+the distributions. NumPy is an optional dependency, so this module is only imported when one
+of those methods is first used. Install it with ``pip install probcalc[numpy]``.
+"""
+
+from __future__ import annotations
+
+import math
+from typing import Callable
+
+try:
+    import numpy as np
+    import numpy.typing as npt
+
+except ImportError as e:  # pragma: no cover
+    raise ImportError('NumPy is needed for array methods. Install it with `pip install probcalc[numpy]`') from e
+
+from .utility import (
+    _ACKLAM_CENTRAL_DENOMINATOR, _ACKLAM_CENTRAL_NUMERATOR, _ACKLAM_LOW, _ACKLAM_TAIL_DENOMINATOR,
+    _ACKLAM_TAIL_NUMERATOR, _BETA_MAX_ITERATIONS, _BETA_QUADRATURE_ORDER, _BETA_QUADRATURE_START, _gauss_legendre
+)
+
+FloatArray = npt.NDArray[np.float64]
+BoolArray = npt.NDArray[np.bool_]
+
+# Compute constants at import time for slight speed increase
+_HALF_LOG_TWO_PI = 0.5 * math.log(2 * math.pi)
+_ROOT_TWO_PI = math.sqrt(2 * math.pi)
+_LENTZ_TINY = 1e-300
+_LENTZ_EPSILON = 1e-16
+
+# Below this, lgamma() uses the recurrence relation to shift its argument up before using Stirling's series
+_STIRLING_CUTOFF = 16
+
+
+def as_float_array(values: npt.ArrayLike) -> FloatArray:
+    """Return the given values as a NumPy array of floats, without copying if possible."""
+    return np.asarray(values, dtype=np.float64)
+
+
+def lgamma(x: npt.ArrayLike) -> FloatArray:
+    r"""Return the natural log of the absolute value of the gamma function, for positive ``x``.
+
+    This is the array version of :func:`math.lgamma`. Small arguments are shifted up with
+    :math:`\Gamma(x + 1) = x \Gamma(x)` and then Stirling's series is used.
+
+    :Example:
+
+    >>> round(float(lgamma([11.0])[0]), 10)
+    15.1044125731
+    """
+    z = np.array(x, dtype=np.float64)
+    log_shift = np.zeros_like(z)
+
+    small = z < _STIRLING_CUTOFF
+    while small.any():
+        log_shift[small] += np.log(z[small])
+        z[small] += 1
+        small = z < _STIRLING_CUTOFF
+
+    inverse = 1 / z
+    inverse_squared = inverse * inverse
+    series = inverse * (1 / 12 + inverse_squared * (-1 / 360 + inverse_squared * (
+        1 / 1260 + inverse_squared * (-1 / 1680 + inverse_squared * (1 / 1188 + inverse_squared * (-691 / 360360))))))
+
+    result: FloatArray = (z - 0.5) * np.log(z) - z + _HALF_LOG_TWO_PI + series - log_shift
+    return result
+
+
+def _avoid_tiny(array: FloatArray) -> FloatArray:
+    """Replace values that are too close to 0 with a tiny number, as the modified Lentz algorithm needs."""
+    return np.where(np.abs(array) < _LENTZ_TINY, _LENTZ_TINY, array)
+
+
+def _lentz(
+    initial_c: float,
+    initial_d: FloatArray,
+    steps: Callable[[int, list[FloatArray]], list[tuple[FloatArray, FloatArray]]],
+    parameters: list[FloatArray],
+    max_iterations: int,
+    *,
+    strict: bool = False
+) -> FloatArray:
+    """Evaluate a continued fraction for every element with the modified Lentz algorithm.
+
+    Elements are dropped from the working arrays as soon as they converge, so the total cost
+    is proportional to the total number of iterations each element needs, not the worst case.
+
+    :param float initial_c: The starting value of the ``c`` coefficient
+    :param initial_d: The starting value of the ``d`` coefficient
+    :param steps: Given the iteration number and the remaining parameters, return the
+        ``(a, b)`` pairs of the continued fraction terms for this iteration
+    :param parameters: The parameters of each element, which get passed to ``steps``
+    :param int max_iterations: The maximum number of iterations before giving up on convergence
+    :param bool strict: Whether to raise an error if any element doesn't converge, or return its last value
+    :returns: The value of the continued fraction for each element
+
+    :raises ArithmeticError: If ``strict`` is true and any element doesn't converge
+    """
+    result = np.empty_like(initial_d)
+    remaining = np.arange(initial_d.size)
+
+    d = 1 / _avoid_tiny(initial_d)
+    c = np.full_like(d, initial_c)
+    h = d.copy()
+
+    with np.errstate(all='ignore'):
+        for m in range(1, max_iterations + 1):
+            if remaining.size == 0:
+                break
+
+            for aa, bb in steps(m, parameters):
+                d = 1 / _avoid_tiny(aa * d + bb)
+                c = _avoid_tiny(bb + aa / c)
+                delta = d * c
+                h *= delta
+
+            converged = np.abs(delta - 1) < _LENTZ_EPSILON
+            if converged.any():
+                result[remaining[converged]] = h[converged]
+
+                keep = ~converged
+                remaining = remaining[keep]
+                c, d, h = c[keep], d[keep], h[keep]
+                parameters = [p[keep] for p in parameters]
+
+    if strict and remaining.size:
+        raise ArithmeticError(f'{remaining.size} elements did not converge within {max_iterations} iterations')
+
+    result[remaining] = h
+    return result
+
+
+def _beta_steps(m: int, parameters: list[FloatArray]) -> list[tuple[FloatArray, FloatArray]]:
+    """Return the even and odd terms of the incomplete beta continued fraction for iteration ``m``."""
+    a, b, x = parameters
+    m2 = 2 * m
+    one = np.ones_like(x)
+
+    return [
+        (m * (b - m) * x / ((a - 1 + m2) * (a + m2)), one),
+        (-(a + m) * (a + b + m) * x / ((a + m2) * (a + 1 + m2)), one)
+    ]
+
+
+def _gamma_steps(m: int, parameters: list[FloatArray]) -> list[tuple[FloatArray, FloatArray]]:
+    """Return the term of the upper incomplete gamma continued fraction for iteration ``m``."""
+    a, x = parameters
+    return [(-m * (m - a), x + 1 - a + 2 * m)]
+
+
+def _broadcast(*arrays: npt.ArrayLike) -> tuple[tuple[int, ...], list[FloatArray]]:
+    """Broadcast the arrays together, and return their shape and flattened copies."""
+    broadcast = np.broadcast_arrays(*(as_float_array(array) for array in arrays))
+    return broadcast[0].shape, [array.ravel().copy() for array in broadcast]
+
+
+def _incomplete_beta_below_peak(
+    a: FloatArray,
+    b: FloatArray,
+    x: FloatArray,
+    y: FloatArray,
+    log_front: FloatArray
+) -> FloatArray:
+    """Return the incomplete beta function for every element, where ``x`` is no higher than about the mean.
+
+    See :func:`probcalc.utility._incomplete_beta_below_peak`.
+    """
+    start = a / (a + b) - _BETA_QUADRATURE_START * np.sqrt(a * b / (a + b + 1)) / (a + b)
+    central = (start > 0) & (x > start)
+
+    point = np.where(central, start, x)
+    total = _lentz(1.0, 1 - (a + b) * point / (a + 1), _beta_steps, [a, b, point], _BETA_MAX_ITERATIONS, strict=True)
+    total /= a
+
+    if central.any():
+        a, b, x, y = a[central], b[central], x[central], y[central]
+        width = x - start[central]
+
+        density_sum = np.zeros_like(width)
+        for node, weight in _gauss_legendre(_BETA_QUADRATURE_ORDER):
+            offset = 0.5 * width * (node - 1)
+            density_sum += weight * np.exp((a - 1) * np.log1p(offset / x) + (b - 1) * np.log1p(-offset / y))
+
+        total[central] *= np.exp(a * np.log1p(-width / x) + b * np.log1p(width / y))
+        total[central] += 0.5 * width * density_sum / (x * y)
+
+    result: FloatArray = np.exp(log_front) * total
+    return result
+
+
+def regularized_incomplete_beta(
+    a: npt.ArrayLike,
+    b: npt.ArrayLike,
+    x: npt.ArrayLike,
+    y: npt.ArrayLike | None = None
+) -> FloatArray:
+    """Return the regularized incomplete beta function for every element of the broadcast arguments.
+
+    See :func:`probcalc.utility.regularized_incomplete_beta`.
+
+    :raises ValueError: If any element of ``a`` or ``b`` is not positive
+    :raises ArithmeticError: If the continued fraction doesn't converge for any element
+    """
+    if y is None:
+        y = 1 - as_float_array(x)
+
+    shape, (a_flat, b_flat, x_flat, y_flat) = _broadcast(a, b, x, y)
+
+    if (a_flat <= 0).any() or (b_flat <= 0).any():
+        raise ValueError('Shape parameters of the incomplete beta function must be positive')
+
+    result = np.where(y_flat <= 0, 1.0, 0.0)
+    inner = (x_flat > 0) & (y_flat > 0)
+
+    a_in, b_in, x_in, y_in = a_flat[inner], b_flat[inner], x_flat[inner], y_flat[inner]
+    log_x = np.where(x_in <= 0.5, np.log(x_in), np.log1p(-y_in))
+    log_y = np.where(y_in <= 0.5, np.log(y_in), np.log1p(-x_in))
+    log_front = lgamma(a_in + b_in) - lgamma(a_in) - lgamma(b_in) + a_in * log_x + b_in * log_y
+    direct = x_in < (a_in + 1) / (a_in + b_in + 2)
+    flipped = ~direct
+
+    values = np.empty_like(x_in)
+    values[direct] = _incomplete_beta_below_peak(
+        a_in[direct], b_in[direct], x_in[direct], y_in[direct], log_front[direct]
+    )
+    values[flipped] = 1 - _incomplete_beta_below_peak(
+        b_in[flipped], a_in[flipped], y_in[flipped], x_in[flipped], log_front[flipped]
+    )
+
+    result[inner] = values
+    return result.reshape(shape)
+
+
+def _lower_gamma_series(a: FloatArray, x: FloatArray) -> FloatArray:
+    """Evaluate the series for :math:`P(a, x)` for every element, dropping elements as they converge."""
+    result = np.empty_like(x)
+    remaining = np.arange(x.size)
+
+    term = 1 / a
+    total = term.copy()
+    ap = a.copy()
+    x_left = x
+
+    max_iterations = 200 + int(10 * math.sqrt(a.max())) if a.size else 0
+    for _ in range(max_iterations):
+        if remaining.size == 0:
+            break
+
+        ap += 1
+        term *= x_left / ap
+        total += term
+
+        converged = np.abs(term) < np.abs(total) * _LENTZ_EPSILON
+        if converged.any():
+            result[remaining[converged]] = total[converged]
+
+            keep = ~converged
+            remaining = remaining[keep]
+            term, total, ap, x_left = term[keep], total[keep], ap[keep], x_left[keep]
+
+    result[remaining] = total
+    return result * np.exp(-x + a * np.log(x) - lgamma(a))
+
+
+def _upper_gamma_continued_fraction(a: FloatArray, x: FloatArray) -> FloatArray:
+    """Evaluate the continued fraction for :math:`Q(a, x)` for every element."""
+    max_iterations = 200 + int(10 * math.sqrt(a.max())) if a.size else 0
+    fraction = _lentz(1 / _LENTZ_TINY, x + 1 - a, _gamma_steps, [a, x], max_iterations)
+    return fraction * np.exp(-x + a * np.log(x) - lgamma(a))
+
+
+def _regularized_gamma(a: npt.ArrayLike, x: npt.ArrayLike, *, upper: bool) -> FloatArray:
+    """Return :math:`P(a, x)` or :math:`Q(a, x)` for every element of the broadcast arguments.
+
+    Every element is evaluated with whichever of the series or continued fraction converges
+    faster, and then subtracted from 1 if needed.
+    """
+    shape, (a_flat, x_flat) = _broadcast(a, x)
+
+    if (a_flat <= 0).any():
+        raise ValueError('Shape parameter of the incomplete gamma function must be positive')
+
+    result = np.full_like(x_flat, 1.0 if upper else 0.0)
+
+    series = (x_flat > 0) & (x_flat < a_flat + 1)
+    fraction = x_flat >= a_flat + 1
+
+    lower_values = _lower_gamma_series(a_flat[series], x_flat[series])
+    upper_values = _upper_gamma_continued_fraction(a_flat[fraction], x_flat[fraction])
+
+    if upper:
+        result[series] = 1 - lower_values
+        result[fraction] = upper_values
+    else:
+        result[series] = lower_values
+        result[fraction] = 1 - upper_values
+
+    return result.reshape(shape)
+
+
+def regularized_lower_gamma(a: npt.ArrayLike, x: npt.ArrayLike) -> FloatArray:
+    """Return the regularized lower incomplete gamma function for every element of the broadcast arguments.
+
+    See :func:`probcalc.utility.regularized_lower_gamma`.
+
+    :raises ValueError: If any element of ``a`` is not positive
+    """
+    return _regularized_gamma(a, x, upper=False)
+
+
+def regularized_upper_gamma(a: npt.ArrayLike, x: npt.ArrayLike) -> FloatArray:
+    """Return the regularized upper incomplete gamma function for every element of the broadcast arguments.
+
+    See :func:`probcalc.utility.regularized_upper_gamma`.
+
+    :raises ValueError: If any element of ``a`` is not positive
+    """
+    return _regularized_gamma(a, x, upper=True)
+
+
+def apply_elementwise(function: Callable[..., float], values: npt.ArrayLike, *, strict: bool) -> FloatArray:
+    """Call a scalar method like :meth:`probcalc.distribution_classes.Distribution.pmf` on every element of an array.
+
+    This is the slow fallback for distributions that don't have a vectorized implementation.
+    """
+    array = as_float_array(values)
+    return np.array(
+        [function(value, strict=strict) for value in array.ravel().tolist()],
+        dtype=np.float64
+    ).reshape(array.shape)
+
+
+def xlogy(x: npt.ArrayLike, y: float) -> FloatArray:
+    """Return ``x * log(y)``, but with 0 wherever ``x`` is 0, even if ``y`` is also 0."""
+    x_array = as_float_array(x)
+
+    with np.errstate(divide='ignore', invalid='ignore'):
+        return np.where(x_array == 0, 0.0, x_array * np.log(y))
+
+
+def standard_normal_cdf(z: npt.ArrayLike) -> FloatArray:
+    r"""Return the CDF of the standard normal distribution for every element of ``z``.
+
+    This uses :math:`\Phi(z) = \frac{1}{2} Q(\frac{1}{2}, \frac{z^2}{2})` for negative ``z``
+    and :math:`\Phi(z) = \frac{1}{2} + \frac{1}{2} P(\frac{1}{2}, \frac{z^2}{2})` otherwise,
+    since NumPy doesn't have a vectorized error function.
+    """
+    z_array = as_float_array(z)
+    half_z_squared = 0.5 * z_array * z_array
+    negative = z_array < 0
+
+    result = np.empty_like(z_array)
+    result[negative] = 0.5 * regularized_upper_gamma(0.5, half_z_squared[negative])
+    result[~negative] = 0.5 + 0.5 * regularized_lower_gamma(0.5, half_z_squared[~negative])
+    return result
+
+
+def standard_normal_ppf(p: npt.ArrayLike) -> FloatArray:
+    r"""Return the inverse of the standard normal CDF for every element of ``p``.
+
+    This is the array version of :func:`probcalc.utility.standard_normal_ppf`, with the same
+    rational approximation and Halley step. Elements outside of :math:`[0, 1]` give NaN.
+
+    :Example:
+
+    >>> [round(float(z), 10) for z in standard_normal_ppf([1e-10, 0.5, 0.975])]
+    [-6.3613409024, 0.0, 1.9599639845]
+    """
+    p_array = as_float_array(p)
+
+    # Work with the lower tail, since 1 - p is exact in the upper half and the refinement is more accurate
+    upper = p_array > 0.5
+    lower_p = np.where(upper, 1 - p_array, p_array)
+
+    with np.errstate(divide='ignore', invalid='ignore', over='ignore'):
+        q = np.sqrt(-2 * np.log(lower_p))
+        tail = np.polyval(_ACKLAM_TAIL_NUMERATOR, q) / np.polyval(_ACKLAM_TAIL_DENOMINATOR, q)
+
+        centred = lower_p - 0.5
+        r = centred * centred
+        central = centred * np.polyval(_ACKLAM_CENTRAL_NUMERATOR, r) / np.polyval(_ACKLAM_CENTRAL_DENOMINATOR, r)
+
+        x = np.where(lower_p < _ACKLAM_LOW, tail, central)
+
+        # Skip the Halley step where exp() would overflow, or where x is already infinite
+        refine = np.isfinite(x) & (x * x < 1400)
+        error = standard_normal_cdf(np.where(refine, x, 0.0)) - lower_p
+        u = error * _ROOT_TWO_PI * np.exp(0.5 * np.where(refine, x * x, 0.0))
+        x = np.where(refine, x - u / (1 + 0.5 * x * u), x)
+
+    x = np.where(lower_p == 0, -np.inf, x)
+    result: FloatArray = np.where((p_array < 0) | (p_array > 1) | np.isnan(p_array), np.nan, np.where(upper, -x, x))
+    return result
@@ -0,0 +1,130 @@
+# probcalc - Calculate probabilities for distributions
+# Copyright (C) 2022 D. Dyson (DoctorDalek1963)
+
+# This program is licensed under GNU GPLv3, available here:
+# <https://www.gnu.org/licenses/gpl-3.0.html>
+
+"""A simple test module to test :meth:`probcalc.distribution_classes.ProbabilityCalculator.acalculate`."""
+
+import asyncio
+import concurrent.futures
+from typing import Any, Callable, List
+
+import pytest
+
+from probcalc import P, B, Geo, N, NonsenseError, Po, tables
+
+
+class CountingExecutor(concurrent.futures.ThreadPoolExecutor):
+    """A thread pool that counts how many calculations are submitted to it."""
+
+    def __init__(self) -> None:
+        """Create a pool with one thread."""
+        super().__init__(1)
+        self.submitted = 0
+
+    def submit(self, fn: Callable[..., Any], /, *args: Any, **kwargs: Any) -> 'concurrent.futures.Future[Any]':
+        """Count the submission and then run it."""
+        self.submitted += 1
+        return super().submit(fn, *args, **kwargs)
+
+
+class StuckExecutor(concurrent.futures.Executor):
+    """An executor that never runs anything, so that calculations never finish."""
+
+    def __init__(self) -> None:
+        """Create an executor with no futures yet."""
+        self.futures: List['concurrent.futures.Future[Any]'] = []
+
+    def submit(self, fn: Callable[..., Any], /, *args: Any, **kwargs: Any) -> 'concurrent.futures.Future[Any]':
+        """Return a future that never finishes."""
+        future: 'concurrent.futures.Future[Any]' = concurrent.futures.Future()
+        self.futures.append(future)
+        return future
+
+
+def test_results() -> None:
+    """Test that the async API gives exactly the same results as P()."""
+    tables.clear_cache()
+    X = B(10 ** 6, 0.4)
+    events = [X <= 400500, 399000 < X < 401000, N(0, 1) < 1, Po(10 ** 5) > 100200, Geo(0.3) == 4, B(20, 0.5)]
+    expected = [P(event) for event in events]
+    tables.clear_cache()
+
+    async def main() -> None:
+        assert [await P.acalculate(event) for event in events] == expected
+        assert await P.abatch(events) == expected
+        assert await P.abatch(events, executor=CountingExecutor()) == expected
+
+        with concurrent.futures.ProcessPoolExecutor(1) as executor:
+            assert await P.abatch(events, executor=executor) == expected
+
+        with pytest.raises(NonsenseError):
+            await P.acalculate(B(20, 0.5) <= 25)
+
+        with pytest.raises(NonsenseError):
+            await P.abatch([X < 3, 5])  # type: ignore[list-item]
+
+    asyncio.run(main())
+
+
+def test_inline_and_merging() -> None:
+    """Test that cheap events skip the executor and identical events share one calculation."""
+    tables.clear_cache()
+
+    async def main() -> None:
+        stuck = StuckExecutor()
+        await P.acalculate(N(0, 1) > 2, executor=stuck)
+        await P.acalculate(Geo(0.1) < 30, executor=stuck)
+        await P.acalculate(B(100, 0.3) < 30, executor=stuck)
+        assert stuck.futures == []
+
+        X = B(10 ** 6, 0.4)
+        counting = CountingExecutor()
+        first, second, third = await asyncio.gather(
+            P.acalculate(X <= 400500, executor=counting),
+            P.acalculate(X <= 400500, executor=counting),
+            P.acalculate(Po(10 ** 6) > 1000500, executor=counting)
+        )
+        assert first == second
+        assert counting.submitted == 2
+
+        # Now that the table has been built, the distribution is cheap
+        await P.acalculate(X < 399000, executor=stuck)
+        assert stuck.futures == []
+
+    asyncio.run(main())
+
+
+def test_timeouts_and_cancellation() -> None:
+    """Test that a calculation is only cancelled when nobody is waiting for it."""
+    tables.clear_cache()
+
+    async def main() -> None:
+        X = B(10 ** 6, 0.4)
+        stuck = StuckExecutor()
+
+        with pytest.raises(asyncio.TimeoutError):
+            await P.acalculate(X <= 400500, timeout=0.01, executor=stuck)
+
+        # The cancellation gets passed on to the executor by a callback
+        await asyncio.sleep(0.01)
+        assert stuck.futures[0].cancelled()
+
+        first = asyncio.ensure_future(P.acalculate(X <= 400600, executor=stuck))
+        second = asyncio.ensure_future(P.acalculate(X <= 400600, executor=stuck))
+        await asyncio.sleep(0.01)
+        assert len(stuck.futures) == 2
+
+        first.cancel()
+        await asyncio.sleep(0.01)
+        assert not stuck.futures[1].cancelled()
+
+        second.cancel()
+        await asyncio.sleep(0.01)
+        assert stuck.futures[1].cancelled()
+
+        with pytest.raises(asyncio.TimeoutError):
+            await P.abatch([X <= 400700, N(0, 1) < 1], timeout=0.01, executor=stuck)
+
+    asyncio.run(main())
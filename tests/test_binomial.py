@@ -9,10 +9,12 @@
 All test values calculated with a Casio fx-991EX Classwiz.
 """
 
+import math
+
 import pytest
 from pytest import approx
 
-from probcalc import P, B, NonsenseError
+from probcalc import P, B, NonsenseError, utility
 
 
 def test_pmf() -> None:
@@ -208,3 +210,161 @@ def test_calculate() -> None:
     assert P(Z >= 50) == P(Z == 50)
     with pytest.raises(NonsenseError):
         P(Z > 50)
+
+
+def test_sf() -> None:
+    """Test the binomial distribution survival function."""
+    X = B(20, 0.25)
+    W = B(1000, 0.9)
+
+    assert X.sf(4) == approx(1 - 0.4148415008)
+    assert X.sf(10) == approx(1 - 0.9960578583)
+    assert X.sf(20) == 0
+
+    assert W.sf(900) == approx(1 - 0.5154177186)
+    assert W.sf(999) == approx(W.pmf(1000))
+    assert W.sf(1000) == 0
+
+    for num in [-1, 21, 12.5]:
+        with pytest.raises(NonsenseError):
+            X.sf(num, strict=True)  # type: ignore[arg-type]
+
+
+def test_large_cdf() -> None:
+    """Test the incomplete beta CDF against summing the PMF for large numbers of trials."""
+    for n, p in [(100, 0.3), (1000, 0.9), (5000, 0.01)]:
+        X = B(n, p)
+
+        for k in range(0, n, n // 20):
+            assert X.cdf(k) == approx(X._cdf_by_summation(k), rel=1e-9, abs=1e-300)
+            assert X.cdf(k) + X.sf(k) == approx(1)
+
+    Y = B(10 ** 7, 0.3)
+    assert Y.cdf(3_000_000) == approx(0.5001560012, rel=1e-7)
+    assert Y.sf(3_010_000) == approx(2.621072788e-12, rel=1e-5)
+
+    # The cost is bounded for huge numbers of trials, even right by the mean
+    Z = B(10 ** 9, 0.3)
+    assert Z.cdf(300_000_000) == approx(0.5000156001, rel=1e-6)
+    assert Z.cdf(299_956_525) == approx(0.001349621849, rel=1e-6)
+
+    # A tiny probability isn't lost by computing 1 - (1 - p)
+    for n, p in [(10 ** 6, 1e-15), (10 ** 5, 1e-9)]:
+        assert B(n, p)._closed_form_cdf(0) == approx(math.exp(n * math.log1p(-p)), rel=1e-14)
+
+
+def test_beta_convergence(monkeypatch: pytest.MonkeyPatch) -> None:
+    """Test that the incomplete beta CDF raises an error instead of returning an unconverged value."""
+    monkeypatch.setattr(utility, '_BETA_MAX_ITERATIONS', 2)
+
+    with pytest.raises(ArithmeticError):
+        B(1000, 0.3)._closed_form_cdf(200)
+
+
+def test_arrays(monkeypatch: pytest.MonkeyPatch) -> None:
+    """Test the vectorized PMF, CDF, and survival function of the binomial distribution."""
+    np = pytest.importorskip('numpy')
+    from probcalc import vectorized
+
+    X = B(20, 0.25)
+    Y = B(2000, 0.6)
+    values = np.arange(21)
+
+    assert X.pmf_array(values) == approx([X.pmf(x) for x in range(21)])
+    assert X.cdf_array(values) == approx([X.cdf(x) for x in range(21)])
+    assert X.sf_array(values) == approx([X.sf(x) for x in range(21)])
+
+    values = np.arange(1100, 1296, 7).reshape(2, -1)
+    assert Y.cdf_array(values).shape == (2, 14)
+    assert Y.cdf_array(values).ravel() == approx([Y.cdf(x) for x in values.ravel().tolist()], rel=1e-9)
+    assert Y.sf_array(values).ravel() == approx([Y.sf(x) for x in values.ravel().tolist()], rel=1e-9)
+
+    Z = B(10 ** 9, 0.3)
+    values = np.arange(299_900_000, 300_100_000, 10_000)
+    assert Z.cdf_array(values) == approx([Z.cdf(x) for x in values.tolist()], rel=1e-12)
+    assert Z.sf_array(values) == approx([Z.sf(x) for x in values.tolist()], rel=1e-12)
+
+    beta = vectorized.regularized_incomplete_beta([10 ** 6, 10 ** 5], 1, [1 - 1e-15, 1 - 1e-9], [1e-15, 1e-9])
+    assert beta == approx([math.exp(10 ** 6 * math.log1p(-1e-15)), math.exp(10 ** 5 * math.log1p(-1e-9))], rel=1e-14)
+
+    monkeypatch.setattr(vectorized, '_BETA_MAX_ITERATIONS', 2)
+    with pytest.raises(ArithmeticError):
+        vectorized.regularized_incomplete_beta(800, 201, [0.7, 0.9])
+
+    with pytest.raises(NonsenseError):
+        X.pmf_array([1, 2, 21])
+
+    with pytest.raises(NonsenseError):
+        X.cdf_array([1, 2.5])
+
+    assert list(X.pmf_array([-1, 2, 21, 2.5], strict=False)) == approx([0, X.pmf(2), 0, 0])
+    assert list(X.cdf_array([-1, 20, 21], strict=False)) == [0, 1, 0]
+
+
+def test_quantiles() -> None:
+    """Test the PPF and inverse survival function of the binomial distribution."""
+    X = B(20, 0.25)
+    Y = B(10 ** 9, 0.3)
+
+    assert X.ppf(0) == 0
+    assert X.ppf(0.5) == 5
+    assert X.ppf(0.95) == 8
+    assert X.ppf(1) == 20
+    assert X.isf(0.05) == 8
+    assert X.isf(0) == 20
+    assert X.isf(1) == 0
+
+    for q in [1e-12, 0.003, 0.2, 0.4148415025, 0.6171726544, 0.99, 1 - 1e-9]:
+        k = X.ppf(q)
+        assert X.cdf(k) >= q and (k == 0 or X.cdf(k - 1) < q)  # type: ignore[arg-type]
+
+        k = X.isf(q)
+        assert X.sf(k) <= q and (k == 0 or X.sf(k - 1) > q)  # type: ignore[arg-type]
+
+    # These are far outside the cached table, so they need the Cornish-Fisher search
+    for q in [1e-300, 1e-50, 0.5, 0.999]:
+        k = Y.ppf(q)
+        assert Y.cdf(k) >= q and Y.cdf(k - 1) < q  # type: ignore[arg-type]
+
+        k = Y.isf(q)
+        assert Y.sf(k) <= q and Y.sf(k - 1) > q  # type: ignore[arg-type]
+
+    with pytest.raises(NonsenseError):
+        X.ppf(-0.5)
+
+    assert X.ppf(2, strict=False) != X.ppf(2, strict=False)
+
+    np = pytest.importorskip('numpy')
+
+    probabilities = np.concatenate([np.linspace(0, 1, 101), [1e-20, 1e-300]])
+    assert list(X.ppf_array(probabilities)) == [X.ppf(q) for q in probabilities]
+    assert list(X.isf_array(probabilities)) == [X.isf(q) for q in probabilities]
+    assert list(Y.ppf_array([1e-300, 0.5])) == [Y.ppf(1e-300), Y.ppf(0.5)]
+
+    with pytest.raises(NonsenseError):
+        X.ppf_array([0.5, 1.5])
+
+    assert list(np.isnan(X.isf_array([0.5, 1.5, -1], strict=False))) == [False, True, True]
+
+
+def test_logs() -> None:
+    """Test the log-space functions and survival function of the binomial distribution."""
+    X = B(20, 0.25)
+    Y = B(1000, 0.3)
+
+    for k in range(21):
+        assert X.logpmf(k) == approx(math.log(X.pmf(k)))
+        assert X.sf(k) == approx(1 - X.cdf(k), abs=1e-12)
+
+    assert X.logcdf(5) == approx(math.log(X.cdf(5)))
+    assert X.logsf(5) == approx(math.log(X.sf(5)))
+
+    # These underflow to 0 as plain probabilities, but not in log space
+    assert Y.logcdf(1) == approx(-350.6121559, rel=1e-9)
+    assert Y.logsf(900) == approx(-800.3272104, rel=1e-9)
+    assert math.isfinite(Y.logcdf(0))
+
+    assert P(X > 15) == approx(3.865316103e-7)
+    assert B(10, 0).pmf(0) == 1
+    assert B(10, 1).pmf(10) == 1
+    assert B(10, 1).logpmf(3) == float('-inf')
@@ -0,0 +1,127 @@
+# probcalc - Calculate probabilities for distributions
+# Copyright (C) 2022 D. Dyson (DoctorDalek1963)
+
+# This program is licensed under GNU GPLv3, available here:
+# <https://www.gnu.org/licenses/gpl-3.0.html>
+
+"""A simple test module to test the command line tool in :mod:`probcalc.cli`."""
+
+import io
+import json
+import os
+import subprocess
+import sys
+from pathlib import Path
+
+import pytest
+
+from probcalc import P, B, Geo, N, NonsenseError, Po, cli, query
+
+QUERIES = '''\
+# A comment, and then a blank line
+
+B(100,0.5): 10 < X <= 20
+Po(5): X > 10
+N(0, 1): -1.96 <= Z <= 1.96
+Geo(0.2): X == 3
+B(20, 0.5)
+B(20, 0.5): X <= 25
+Po(5): 3 <= X
+B(100, 0.5): X > 60
+'''
+
+
+def test_parse_query() -> None:
+    """Test that queries are parsed into the same events as the comparisons in Python."""
+    X = B(100, 0.5)
+    assert cli.parse_query('B(100, 0.5): 10 < X <= 20') == (10 < X <= 20)
+    assert cli.parse_query(' B( 100 ,0.5 ):X>60 ') == (X > 60)
+    assert cli.parse_query('Po(5): 3 <= Y') == (Po(5) >= 3)
+    assert cli.parse_query('N(0, 1): -1.5e0 < Z') == (N(0, 1) > -1.5)
+    assert cli.parse_query('Geo(0.2): X != 3') == (Geo(0.2) != 3)
+    assert cli.parse_query('B(20, 0.5)') == cli.parse_query('B(20, 0.5): ') == P._as_event(B(20, 0.5))
+
+    # The tool parses events with probcalc.query, so they always agree
+    assert cli.parse_query('N(0, 1): Z < 1') == query.prepare('N(0, 1) < 1').event()
+    assert P(cli.parse_query('N(0, 1): Z >= 1')) == P(N(0, 1) >= 1) == 0.1586552539
+
+    with pytest.raises(ValueError, match="Unknown distribution 'Foo'"):
+        cli.parse_query('Foo(1): X < 2')
+
+    # Parsing one query never affects the next
+    cli.parse_query('B(100, 0.5): X > 60')
+    assert cli.parse_query('B(100, 0.5): X <= 40') == (X <= 40)
+
+    assert cli.parse_distribution('B(100, 0.5)') is cli.parse_distribution('B(100, 0.5)') is X
+
+    with pytest.raises(ValueError):
+        cli.parse_query('Foo(1): X < 3')
+
+    with pytest.raises(ValueError):
+        cli.parse_query('B(100): X < 3')
+
+    with pytest.raises(ValueError):
+        cli.parse_query('B(100, 0.5): X < Y')
+
+    with pytest.raises(ValueError):
+        cli.parse_query('B(100, 0.5): X')
+
+    with pytest.raises(NonsenseError):
+        cli.parse_query('B(100, 1.5): X < 3')
+
+    with pytest.raises(NonsenseError):
+        cli.parse_query('B(100, 0.5): X < 1.5')
+
+    with pytest.raises(NonsenseError):
+        cli.parse_query('B(100, 0.5): X == 1.5')
+
+    with pytest.raises(NonsenseError):
+        cli.parse_query('B(100, 0.5): 20 < X < 10')
+
+
+def test_main(capsys: pytest.CaptureFixture[str], monkeypatch: pytest.MonkeyPatch) -> None:
+    """Test the results in both output formats, with different window sizes."""
+    expected = [
+        P(10 < B(100, 0.5) <= 20),
+        P(Po(5) > 10),
+        P(-1.96 <= N(0, 1) <= 1.96),
+        P(Geo(0.2) == 3),
+        1.0,
+        None,
+        P(Po(5) >= 3),
+        P(B(100, 0.5) > 60)
+    ]
+
+    for window in ['1', '3', '1000']:
+        monkeypatch.setattr(sys, 'stdin', io.StringIO(QUERIES))
+        assert cli.main(['--window', window]) == 1
+
+        lines = capsys.readouterr().out.splitlines()
+        assert lines[0] == 'query,probability,error'
+        assert lines[1] == '"B(100,0.5): 10 < X <= 20",5.579544375e-10,'
+        assert lines[6] == '"B(20, 0.5): X <= 25",,Cannot have more successes (25) than trials (20)'
+        assert len(lines) == 9
+
+        monkeypatch.setattr(sys, 'stdin', io.StringIO(QUERIES))
+        assert cli.main(['--format', 'jsonl', '-w', window]) == 1
+
+        records = [json.loads(line) for line in capsys.readouterr().out.splitlines()]
+        assert [record.get('probability') for record in records] == expected
+        assert 'error' in records[5]
+
+    monkeypatch.setattr(sys, 'stdin', io.StringIO('B(20, 0.5): X > 6\n'))
+    assert cli.main(['-f', 'jsonl', '-s', '3']) == 0
+    assert json.loads(capsys.readouterr().out) == {'query': 'B(20, 0.5): X > 6', 'probability': 0.942}
+
+
+def test_module(tmp_path: Path) -> None:
+    """Test running the tool with ``python -m probcalc`` on a file."""
+    queries = tmp_path / 'queries.txt'
+    queries.write_text('B(20, 0.5): 4 < X <= 12\nPo(5): X > 10\n')
+
+    output = subprocess.run(
+        [sys.executable, '-m', 'probcalc', '-f', 'jsonl', str(queries)],
+        env={**os.environ, 'PYTHONPATH': os.pathsep.join(sys.path)}, capture_output=True, text=True, check=True
+    )
+
+    assert [json.loads(line)['probability'] for line in output.stdout.splitlines()] == [0.8625030518, 0.0136952686]
@@ -0,0 +1,92 @@
+# probcalc - Calculate probabilities for distributions
+# Copyright (C) 2022 D. Dyson (DoctorDalek1963)
+
+# This program is licensed under GNU GPLv3, available here:
+# <https://www.gnu.org/licenses/gpl-3.0.html>
+
+"""A simple test module to test the exact combinatorics in :mod:`probcalc.combinatorics`."""
+
+import math
+from fractions import Fraction
+
+import pytest
+from pytest import approx
+
+from probcalc import B, combinatorics, utility
+
+
+def test_factorials() -> None:
+    """Test the factorials and their logs and reciprocals, inside and outside the memoized tables."""
+    for n in [0, 1, 2, 10, 170, 177, 178, 500, combinatorics.MEMO_LIMIT - 1, combinatorics.MEMO_LIMIT, 3000]:
+        assert combinatorics.factorial(n) == math.factorial(n)
+        assert combinatorics.log_factorial(n) == approx(math.lgamma(n + 1), rel=1e-14, abs=1e-14)
+        assert combinatorics.factorial_fraction(n) == 1 / math.factorial(n)
+
+    assert combinatorics.factorial_fraction(177) > 0
+    assert combinatorics.factorial_fraction(10 ** 9) == 0
+
+    # The old names in utility still work
+    assert utility.factorial(20) == math.factorial(20)
+    assert utility.factorial_fraction(20) == 1 / math.factorial(20)
+
+    for function in [combinatorics.factorial, combinatorics.log_factorial, combinatorics.factorial_fraction]:
+        with pytest.raises(ValueError):
+            function(-1)
+
+        with pytest.raises(TypeError):
+            function(3.0)  # type: ignore[arg-type]
+
+
+def test_choose() -> None:
+    """Test choose and its log, and multinomial coefficients."""
+    assert utility.choose(10, 3) == combinatorics.choose(10, 3) == 120
+    assert combinatorics.choose(10 ** 5, 5 * 10 ** 4) == math.comb(10 ** 5, 5 * 10 ** 4)
+    assert combinatorics.choose(7, 0) == combinatorics.choose(7, 7) == 1
+
+    assert combinatorics.log_choose(50, 20) == approx(math.log(math.comb(50, 20)), rel=1e-15)
+    assert combinatorics.log_choose(10 ** 6, 300) == approx(math.log(math.comb(10 ** 6, 300)), rel=1e-12)
+
+    assert combinatorics.multinomial(2, 3, 4) == math.factorial(9) // (2 * 6 * 24)
+    assert combinatorics.multinomial() == 1
+
+    with pytest.raises(ValueError):
+        combinatorics.choose(3, 4)
+
+    with pytest.raises(ValueError):
+        combinatorics.log_choose(3, 4)
+
+    with pytest.raises(ValueError):
+        combinatorics.choose(3, -1)
+
+    with pytest.raises(ValueError):
+        combinatorics.multinomial(3, -1)
+
+
+def test_exact() -> None:
+    """Test the exact rational helpers against each other and against the binomial distribution."""
+    assert combinatorics.factorial_ratio(10, 7) == 720
+    assert combinatorics.factorial_ratio(7, 10) == Fraction(1, 720)
+    assert combinatorics.factorial_ratio(5, 5) == 1
+
+    assert combinatorics.binomial_probability(4, 2, '1/2') == Fraction(3, 8)
+    exact = Fraction(120 * 9 ** 7, 10 ** 10)
+    assert combinatorics.binomial_probability(10, 3, Fraction(1, 10)) == exact
+    assert combinatorics.binomial_probability(10, 3, '0.1') == exact
+
+    # A float is taken at its exact binary value, which isn't quite 0.1
+    assert combinatorics.binomial_probability(10, 3, 0.1) != exact
+
+    X = B(30, 0.3)
+    for k in range(31):
+        assert float(combinatorics.binomial_probability(30, k, 0.3)) == approx(X.pmf(k), rel=1e-12)
+
+    assert sum(combinatorics.binomial_probability(30, k, '0.3') for k in range(31)) == 1
+
+    with pytest.raises(ValueError):
+        combinatorics.binomial_probability(4, 2, 1.5)
+
+    with pytest.raises(ValueError):
+        combinatorics.binomial_probability(4, 5, 0.5)
+
+    with pytest.raises(ValueError):
+        combinatorics.factorial_ratio(-1, 3)
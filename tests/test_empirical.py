@@ -0,0 +1,150 @@
+# probcalc - Calculate probabilities for distributions
+# Copyright (C) 2022 D. Dyson (DoctorDalek1963)
+
+# This program is licensed under GNU GPLv3, available here:
+# <https://www.gnu.org/licenses/gpl-3.0.html>
+
+"""A simple test module to test empirical distributions in :mod:`probcalc.empirical`."""
+
+import pickle
+
+import numpy as np
+import pytest
+
+from probcalc import P, NonsenseError
+from probcalc.empirical import EmpiricalBuilder, EmpiricalDistribution
+
+
+def test_integer_samples() -> None:
+    """Test that probabilities of integer samples agree with counting the samples directly."""
+    rng = np.random.default_rng(1963)
+    samples = rng.poisson(20, 10000)
+    E = EmpiricalDistribution(samples)
+
+    assert E.total == 10000
+    assert repr(E) == f'Empirical(10000 samples, {len(np.unique(samples))} values)'
+    assert E.counts.sum() == 10000
+
+    for k in range(0, 45, 3):
+        assert E.pmf(k) == np.count_nonzero(samples == k) / 10000
+        assert E.cdf(k) == np.count_nonzero(samples <= k) / 10000
+        assert E.sf(k) == np.count_nonzero(samples > k) / 10000
+
+    assert P(E == 20) == round(E.pmf(20), 10)
+    assert P(15 < E <= 25) == round(np.count_nonzero((samples > 15) & (samples <= 25)) / 10000, 10)
+    assert E.cdf(-1) == 0
+    assert E.cdf(1000) == 1
+
+    with pytest.raises(NonsenseError):
+        E.pmf(2.5)
+
+    with pytest.raises(NonsenseError):
+        EmpiricalDistribution([])
+
+    with pytest.raises(NonsenseError):
+        EmpiricalDistribution([1.0, float('nan')])
+
+
+def test_float_samples() -> None:
+    """Test that float samples can be compared with floats, and that ``<`` and ``<=`` are different."""
+    E = EmpiricalDistribution([0.5, 1.5, 1.5, 2.25])
+
+    assert P(E < 1.5) == 0.25
+    assert P(E <= 1.5) == 0.75
+    assert P(E == 1.5) == 0.5
+    assert P(E > 2) == 0.25
+    assert E.pmf(1) == 0
+
+
+def test_quantiles() -> None:
+    """Test that the quantiles agree exactly with the CDF and survival function."""
+    E = EmpiricalDistribution([3, 1, 4, 1, 5, 9, 2, 6, 5, 3, 5])
+    q = np.linspace(0, 1, 101)
+
+    for probability in q:
+        x = E.ppf(probability)
+        assert E.cdf(x) >= probability
+        assert x == E.values[0] or E.cdf(x - 1) < probability
+
+        y = E.isf(probability)
+        assert E.sf(y) <= probability
+        assert y == E.values[0] or E.sf(y - 1) > probability
+
+    assert E.ppf(0) == E.isf(1) == 1
+    assert E.ppf(1) == E.isf(0) == 9
+    assert E.ppf(3 / 11) == 2
+
+    assert E.ppf_array(q).tolist() == [E.ppf(p) for p in q]
+    assert E.isf_array(q).tolist() == [E.isf(p) for p in q]
+
+
+def test_arrays() -> None:
+    """Test that the vectorized queries agree with the scalar ones."""
+    E = EmpiricalDistribution(np.arange(100) % 7, counts=np.arange(100))
+    x = list(range(-2, 10))
+
+    assert E.pmf_array(x).tolist() == [E.pmf(k) for k in x]
+    assert E.cdf_array(x).tolist() == [E.cdf(k) for k in x]
+    assert E.sf_array(x).tolist() == [E.sf(k) for k in x]
+    assert E.pmf_array([0.5, 1], strict=False).tolist() == [0, E.pmf(1)]
+
+    with pytest.raises(NonsenseError):
+        E.cdf_array([1, 1.5])
+
+    samples = E.rvs(10000, seed=42)
+    assert set(np.unique(samples)) <= set(E.values)
+
+    e1 = P._as_event(E > 3)
+    e2 = P._as_event(E == 2)
+    assert P.batch([e1, e2]) == [P(e1), P(e2)]
+
+
+def test_builder() -> None:
+    """Test that building from chunks gives the same distribution as all the samples at once."""
+    rng = np.random.default_rng(1963)
+    chunks = [rng.integers(-50, 50, 1000) for _ in range(10)]
+
+    E = EmpiricalDistribution.from_chunks(chunks)
+    F = EmpiricalDistribution(np.concatenate(chunks))
+
+    assert E.values.tolist() == F.values.tolist()
+    assert E.counts.tolist() == F.counts.tolist()
+
+    G = pickle.loads(pickle.dumps(E))
+    assert G.values.tolist() == E.values.tolist()
+    assert G.counts.tolist() == E.counts.tolist()
+    assert hash(G) != hash(E)
+
+
+def test_histogram() -> None:
+    """Test that a builder with ``max_values`` keeps the number of bins bounded and the CDF exact at bin edges."""
+    rng = np.random.default_rng(1963)
+    chunks = [rng.normal(0, 100, 10000) for _ in range(5)]
+    builder = EmpiricalBuilder(max_values=64)
+
+    for chunk in chunks:
+        builder.add(chunk)
+        assert len(builder.build().values) <= 64
+
+    E = builder.build()
+    samples = np.concatenate(chunks)
+    width = E.bin_width
+
+    assert width > 0
+    assert np.log2(width) == int(np.log2(width))
+    assert E.total == 50000
+
+    for edge in E.values:
+        assert E.cdf(edge) == np.count_nonzero(samples < edge + width) / 50000
+
+    # Integers are binned with integer widths
+    builder = EmpiricalBuilder(max_values=10)
+    builder.add(np.arange(1000))
+    E = builder.build()
+
+    assert E.bin_width == 128
+    assert E.values.tolist() == list(range(0, 1000, 128))
+    assert P(E < 128) == 0.128
+
+    with pytest.raises(ValueError):
+        EmpiricalBuilder(max_values=0)
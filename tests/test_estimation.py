@@ -0,0 +1,100 @@
+# probcalc - Calculate probabilities for distributions
+# Copyright (C) 2022 D. Dyson (DoctorDalek1963)
+
+# This program is licensed under GNU GPLv3, available here:
+# <https://www.gnu.org/licenses/gpl-3.0.html>
+
+"""A simple test module to test the streaming estimators in :mod:`probcalc.estimation`."""
+
+import pickle
+
+import numpy as np
+import pytest
+from pytest import approx
+
+from probcalc import B, Geo, N, NonsenseError, Po
+from probcalc.estimation import MomentEstimator, ProportionEstimator
+
+
+def test_moments() -> None:
+    """Test that the running mean and variance agree with NumPy, however the data is split up."""
+    rng = np.random.default_rng(1963)
+    # The naive formula would lose every significant figure of the variance to cancellation here
+    data = rng.normal(1e9, 3, 10000)
+
+    one_at_a_time = MomentEstimator()
+    one_at_a_time.update(iter(data.tolist()))
+
+    chunked = MomentEstimator()
+    for chunk in np.array_split(data, 7):
+        chunked.update(chunk)
+
+    for estimator in [one_at_a_time, chunked]:
+        assert estimator.count == 10000
+        assert estimator.mean == approx(data.mean(), rel=1e-15)
+        assert estimator.variance == approx(data.var(), rel=1e-8)
+        assert estimator.sample_variance == approx(data.var(ddof=1), rel=1e-8)
+
+    assert chunked.normal() is N(chunked.mean, float(np.sqrt(chunked.sample_variance)))
+
+    with pytest.raises(NonsenseError):
+        MomentEstimator().mean
+
+    with pytest.raises(NonsenseError):
+        MomentEstimator().add(float('nan'))
+
+
+def test_merge() -> None:
+    """Test that merging the estimators of parallel workers gives the same as one estimator."""
+    rng = np.random.default_rng(1963)
+    chunks = [rng.poisson(7, size) for size in [0, 1, 100, 5000]]
+
+    workers = []
+    for chunk in chunks:
+        worker = MomentEstimator()
+        worker.update(chunk)
+        workers.append(pickle.loads(pickle.dumps(worker)))
+
+    merged = MomentEstimator.merged(workers)
+    data = np.concatenate(chunks)
+
+    assert merged.count == len(data)
+    assert merged.mean == approx(data.mean(), rel=1e-14)
+    assert merged.variance == approx(data.var(), rel=1e-12)
+    assert merged.poisson() is Po(merged.mean)
+    assert merged.binomial(20) is B(20, merged.mean / 20)
+
+
+def test_proportions() -> None:
+    """Test that counting successes gives binomial and geometric distributions."""
+    rng = np.random.default_rng(1963)
+    outcomes = rng.random(1000) < 0.3
+
+    first = ProportionEstimator()
+    first.update(outcomes[:500])
+    second = ProportionEstimator()
+    second.update(outcomes[500:].tolist())
+
+    merged = ProportionEstimator.merged([first, second])
+
+    assert merged.trials == 1000
+    assert merged.successes == np.count_nonzero(outcomes)
+    assert merged.binomial(10) is B(10, merged.successes / 1000)
+    assert merged.geometric() is Geo(merged.successes / 1000)
+
+    merged.add(3, 5)
+    assert merged.trials == 1005
+
+    with pytest.raises(NonsenseError):
+        merged.add(6, 5)
+
+    with pytest.raises(NonsenseError):
+        merged.update(np.array([0, 1, 2]))
+
+    with pytest.raises(NonsenseError):
+        ProportionEstimator().probability
+
+    # The numbers of trials up to each first success estimate the same probability
+    estimator = MomentEstimator()
+    estimator.update(rng.geometric(0.25, 10000))
+    assert estimator.geometric().parameters[0] == approx(0.25, rel=0.05)
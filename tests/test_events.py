@@ -0,0 +1,161 @@
+# probcalc - Calculate probabilities for distributions
+# Copyright (C) 2022 D. Dyson (DoctorDalek1963)
+
+# This program is licensed under GNU GPLv3, available here:
+# <https://www.gnu.org/licenses/gpl-3.0.html>
+
+"""A simple test module to test :class:`probcalc.distribution_classes.Event`."""
+
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+from pytest import approx
+
+from probcalc import P, B, Geo, N, NonsenseError, Po
+from probcalc.distribution_classes import Event, _Bounds
+
+
+def test_immutable() -> None:
+    """Test that events are immutable and that comparisons don't change the distribution."""
+    X = B(20, 0.5)
+
+    event = 4 < X <= 12
+    assert isinstance(event, Event)
+    assert event.distribution is X
+    assert event.bounds.lower == (4, False)
+    assert event.bounds.upper == (12, True)
+
+    with pytest.raises(AttributeError):
+        event.negated = True  # type: ignore[misc]
+
+    with pytest.raises(AttributeError):
+        event.bounds.lower = (5, False)  # type: ignore[misc]
+
+    assert not hasattr(X, 'bounds')
+
+    # Everything uses __slots__, so nothing can sneak new state onto distributions or events
+    for obj in [X, Po(3.2), N(0, 1), Geo(0.3), event, event.bounds]:
+        assert not hasattr(obj, '__dict__')
+
+    with pytest.raises(AttributeError):
+        X.bounds = None  # type: ignore[attr-defined]
+
+    assert event.bounds.is_default is False
+    assert (X <= 12).with_upper((None, False)).bounds.is_default is True
+
+    assert P(event) == 0.8625030518
+    assert P(event) == 0.8625030518
+    assert P(X > 6) == 0.9423408508
+    assert P(X) == 1
+
+
+def test_repr() -> None:
+    """Test the repr of events."""
+    X = B(20, 0.5)
+    Z = N(0, 1)
+
+    event = X == 3
+    assert repr(event) == '<Event B(20, 0.5) == 3>'
+    P(event)
+
+    event = X != 3
+    assert repr(event) == '<Event B(20, 0.5) != 3>'
+    P(event)
+
+    assert repr(2 <= X < 7) == '<Event 2 <= B(20, 0.5) < 7>'
+    assert repr(Z > 1.5) == '<Event 1.5 < N(0, 1²)>'
+
+
+def test_not_events() -> None:
+    """Test that chained comparisons which short circuit can't be calculated."""
+    X = B(20, 0.5)
+
+    with pytest.raises(NonsenseError):
+        P(X == 3 > 10)  # type: ignore[arg-type]
+
+    with pytest.raises(NonsenseError):
+        P(10 < X == 3)  # type: ignore[arg-type]
+
+    # Errors shouldn't leave anything behind
+    assert P(X == 3) == 0.001087188721
+
+
+def test_batch() -> None:
+    """Test that batches of events give the same results as calculating them one by one."""
+    X = B(20, 0.25)
+    Y = Po(12.3)
+    W = Geo(0.3)
+    Z = N(-3.9, 1.6)
+
+    buckets = [a < X <= a + 4 for a in range(0, 20, 4)]
+    assert [event.bounds.lower[0] for event in buckets] == list(range(0, 20, 4))
+    assert P.batch(buckets) == [P(event) for event in buckets]
+
+    events = [X == 3, Y != 7, 2 <= Y < 6, W <= 4, X, 1 < X, X < 10, W > 2, X == 3]
+    expected = [
+        X.pmf(3), 1 - Y.pmf(7), Y.cdf(5) - Y.cdf(1), W.cdf(4), 1, X.sf(1), X.cdf(9), W.sf(2), X.pmf(3)
+    ]
+    assert P.batch(events) == approx(expected, rel=1e-9)
+
+    # Separate comparisons on the same distribution are separate events
+    assert P.batch([X <= 5, X > 5]) == approx([X.cdf(5), X.sf(5)], rel=1e-9)
+
+    continuous = [Z < 5, 2 <= Z < 6, -5 < Z <= -3]
+    assert P.batch(continuous) == approx([P(event) for event in continuous], rel=1e-8)
+
+    assert P.batch([]) == []
+
+    with pytest.raises(NonsenseError):
+        P.batch([X < 5, X > 20])
+
+    with pytest.raises(NonsenseError):
+        P.batch([X < 5, 3])  # type: ignore[list-item]
+
+    with pytest.raises(NonsenseError):
+        X.calculate_many([Y < 5])
+
+
+def test_separate_events() -> None:
+    """Test that events made by separate comparisons never build on each other."""
+    X = B(20, 0.5)
+
+    e1 = X > 3
+    e2 = X < 10
+    assert e1 == Event(X, _Bounds((3, False), (None, False)))
+    assert e2 == Event(X, _Bounds((None, False), (10, False)))
+    assert P(e2) == round(X.cdf(9), 10)
+
+    events = [X <= 5, X > 5]
+    assert repr(events) == '[<Event B(20, 0.5) <= 5>, <Event 5 < B(20, 0.5)>]'
+
+    events = [X <= 3]
+    event = X > 10
+    assert repr(event) == '<Event 10 < B(20, 0.5)>'
+    assert P(event) == round(X.sf(10), 10)
+
+    # Converting events to bools doesn't do anything
+    assert [event for event in [X > 15] if event] == [X > 15]
+    assert P(X <= 18) == 0.9999799728
+
+    event = X > 15
+    if event:
+        assert P(X <= 18) == 0.9999799728
+
+    # Chained comparisons build on their first half, even in loops and when other chains are evaluated in between
+    assert (3 < X < 10).bounds == _Bounds((3, False), (10, False))
+    assert [(a < X <= a + 4).bounds.lower for a in range(3)] == [(0, False), (1, False), (2, False)]
+    assert P(2 <= X < round(P(1 < X < 19) * 6)) == P(2 <= X < 6) == 0.02067470551
+
+
+def test_threads() -> None:
+    """Test that one distribution can be queried from several threads at once."""
+    X = B(100, 0.5)
+
+    def query(k: int) -> float:
+        return P(k < X <= k + 10)
+
+    expected = [query(k) for k in range(80)]
+
+    with ThreadPoolExecutor(max_workers=8) as executor:
+        for _ in range(5):
+            assert list(executor.map(query, range(80))) == expected
@@ -9,6 +9,8 @@
 All test values calculated with a Casio fx-991EX Classwiz.
 """
 
+import math
+
 import pytest
 from pytest import approx
 
@@ -167,3 +169,63 @@ def test_calculate() -> None:
 
     with pytest.raises(NonsenseError):
         P(X != 3 > 10)
+
+
+def test_arrays() -> None:
+    """Test the vectorized PMF, CDF, and survival function of the geometric distribution."""
+    np = pytest.importorskip('numpy')
+
+    X = Geo(0.2)
+    values = np.arange(1, 50)
+
+    assert X.pmf_array(values) == approx([X.pmf(x) for x in range(1, 50)])
+    assert X.cdf_array(values) == approx([X.cdf(x) for x in range(1, 50)])
+    assert X.sf_array(values) == approx([1 - X.cdf(x) for x in range(1, 50)])
+
+    with pytest.raises(NonsenseError):
+        X.pmf_array([0, 1])
+
+    assert list(X.cdf_array([0, -1, 1.5, 1], strict=False)) == approx([0, 0, 0, 0.2])
+
+
+def test_quantiles() -> None:
+    """Test the PPF and inverse survival function of the geometric distribution."""
+    X = Geo(0.2)
+
+    assert X.ppf(0) == 1
+    assert X.ppf(0.19) == 1
+    assert X.ppf(0.21) == 2
+    assert X.ppf(0.95) == 14
+    assert X.ppf(1) == float('inf')
+    assert X.isf(1) == 1
+    assert X.isf(0.05) == 14
+    assert X.isf(0) == float('inf')
+
+    for q in [0.001, 0.36, 0.5, 0.9, 0.999999]:
+        k = X.ppf(q)
+        assert X.cdf(k) >= q and (k == 1 or X.cdf(k - 1) < q)  # type: ignore[arg-type]
+
+    with pytest.raises(NonsenseError):
+        X.ppf(1.5)
+
+    assert X.isf(-0.5, strict=False) != X.isf(-0.5, strict=False)
+
+    np = pytest.importorskip('numpy')
+
+    # NumPy's powers can differ from Python's in the last bit, so avoid probabilities exactly on the CDF
+    probabilities = np.concatenate([[0, 1], np.linspace(0.005, 0.995, 100)])
+    assert list(X.ppf_array(probabilities)) == [X.ppf(q) for q in probabilities]
+    assert list(X.isf_array(probabilities)) == [X.isf(q) for q in probabilities]
+
+
+def test_logs() -> None:
+    """Test the log-space functions and survival function of the geometric distribution."""
+    X = Geo(0.3)
+
+    for k in range(1, 20):
+        assert X.logpmf(k) == approx(math.log(X.pmf(k)))
+        assert X.logcdf(k) == approx(math.log(X.cdf(k)))
+        assert X.sf(k) == approx(1 - X.cdf(k))
+
+    assert X.logsf(1000) == approx(1000 * math.log(0.7))
+    assert X.logcdf(200) == approx(-9.860761315e-32)
@@ -0,0 +1,88 @@
+# probcalc - Calculate probabilities for distributions
+# Copyright (C) 2022 D. Dyson (DoctorDalek1963)
+
+# This program is licensed under GNU GPLv3, available here:
+# <https://www.gnu.org/licenses/gpl-3.0.html>
+
+"""A simple test module to test critical regions in :mod:`probcalc.hypothesis`."""
+
+import pytest
+from pytest import approx
+
+from probcalc import B, Geo, N, NonsenseError, Po
+from probcalc.distributions import sum_iid
+from probcalc.hypothesis import CriticalRegion, critical_region, critical_regions
+
+
+def _brute_force(distribution, alpha, tail):  # type: ignore[no-untyped-def]
+    """Find a critical region by trying every value in turn, like it would be done by hand."""
+    tail_alpha = alpha / 2 if tail == 'two' else alpha
+    first = int(distribution.ppf(0))
+    last = int(distribution.isf(1e-15))
+    lower = upper = None
+
+    if tail != 'upper':
+        lower = max((c for c in range(first, last + 1) if distribution.cdf(c) <= tail_alpha), default=None)
+
+    if tail != 'lower':
+        upper = min((c for c in range(first + 1, last + 1) if distribution.sf(c - 1) <= tail_alpha), default=None)
+
+    return lower, upper
+
+
+@pytest.mark.parametrize('distribution', [B(20, 0.5), B(100, 0.03), Po(4.5), Po(300), Geo(0.2), sum_iid(Geo(0.5), 5)])
+def test_discrete(distribution) -> None:  # type: ignore[no-untyped-def]
+    """Test that the critical regions of discrete distributions agree with trying every value."""
+    for alpha in [0.001, 0.01, 0.05, 0.1]:
+        for tail in ['lower', 'upper', 'two']:
+            region = critical_region(distribution, alpha, tail)  # type: ignore[arg-type]
+            assert (region.lower, region.upper) == _brute_force(distribution, alpha, tail)
+            assert region.significance <= alpha
+
+            expected = 0.0
+            if region.lower is not None:
+                expected += distribution.cdf(region.lower)
+            if region.upper is not None:
+                expected += distribution.sf(region.upper - 1)
+
+            assert region.significance == approx(expected)
+
+
+def test_known_regions() -> None:
+    """Test some critical regions from textbooks, including when the CDF is exactly the significance level."""
+    assert critical_region(B(20, 0.5), 0.05) == CriticalRegion(5, None, B(20, 0.5).cdf(5))
+    assert critical_region(B(20, 0.5), 0.05, 'two')[:2] == (5, 15)
+    assert critical_region(B(2, 0.5), 0.25).lower == 0
+    assert critical_region(B(2, 0.5), 0.25, 'upper').upper == 2
+
+    # Some regions are empty
+    assert critical_region(B(5, 0.5), 0.01, 'two') == CriticalRegion(None, None, 0.0)
+
+    region = critical_region(N(10, 2), 0.05, 'two')
+    assert region.lower == approx(10 - 1.959963985 * 2)
+    assert region.upper == approx(10 + 1.959963985 * 2)
+    assert region.significance == approx(0.05)
+
+
+def test_batch() -> None:
+    """Test that a batch of tests gives the same regions as one at a time."""
+    tests = [
+        (distribution, alpha, tail)
+        for distribution in [B(30, 0.4), Po(12), Geo(0.1)]
+        for alpha in [0.01, 0.05, 0.1]
+        for tail in ['lower', 'upper', 'two']
+    ]
+
+    assert critical_regions(tests) == [critical_region(*test) for test in tests]  # type: ignore[arg-type]
+    assert critical_regions([]) == []
+
+    # The vectorized quantiles of continuous distributions can differ in the last bit
+    regions = critical_regions([(N(0, 1), 0.05, 'lower'), (N(0, 1), 0.05, 'two')])
+    assert regions[0].lower == approx(-1.644853627)
+    assert regions[1][:2] == approx((-1.959963985, 1.959963985))
+
+    with pytest.raises(NonsenseError):
+        critical_region(B(10, 0.5), 1)
+
+    with pytest.raises(ValueError):
+        critical_regions([(B(10, 0.5), 0.05, 'both')])  # type: ignore[list-item]
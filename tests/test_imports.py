@@ -0,0 +1,64 @@
+# probcalc - Calculate probabilities for distributions
+# Copyright (C) 2022 D. Dyson (DoctorDalek1963)
+
+# This program is licensed under GNU GPLv3, available here:
+# <https://www.gnu.org/licenses/gpl-3.0.html>
+
+"""A simple test module to test that ``import probcalc`` leaves out what it doesn't need, and the lazy submodules."""
+
+from __future__ import annotations
+
+import os
+import subprocess
+import sys
+
+import probcalc
+
+HEAVY_MODULES = [
+    'numpy', 'inspect', 'asyncio', 'concurrent.futures',
+    'probcalc.aio', 'probcalc.cli', 'probcalc.convolution', 'probcalc.empirical', 'probcalc.estimation',
+    'probcalc.hypothesis', 'probcalc.instrumentation', 'probcalc.parallel', 'probcalc.query', 'probcalc.sampling',
+    'probcalc.tables', 'probcalc.vectorized'
+]
+"""The optional backends and lazy submodules, which a bare import of the aliases should never import."""
+
+
+def _heavy_modules_imported(code: str) -> list[str]:
+    """Run some code in a fresh interpreter that can import probcalc, and return which heavy modules it imported."""
+    output = subprocess.run(
+        [sys.executable, '-c', f'import sys; {code}; print(*(m for m in {HEAVY_MODULES!r} if m in sys.modules))'],
+        env={**os.environ, 'PYTHONPATH': os.pathsep.join(sys.path)}, capture_output=True, text=True, check=True
+    )
+    return output.stdout.split()
+
+
+def test_nothing_heavy_is_imported() -> None:
+    """Test that importing the aliases doesn't import any optional backends or lazy submodules."""
+    assert _heavy_modules_imported('from probcalc import P, B') == []
+    assert _heavy_modules_imported('from probcalc import *') == []
+    assert _heavy_modules_imported('from probcalc import P, N; P(N(0, 1) < 1)') == []
+
+    # The tables are only imported once there's a table to build
+    assert _heavy_modules_imported('from probcalc import P, B; P(B(20, 0.5) < 5)') == ['probcalc.tables']
+
+
+def test_lazy_submodules() -> None:
+    """Test that the lazy submodules can be used as attributes of the package."""
+    assert probcalc.parallel.BatchEvaluator.__name__ == 'BatchEvaluator'
+    assert probcalc.instrumentation.is_enabled() is False
+
+    lazy = [
+        'aio', 'cli', 'convolution', 'empirical', 'estimation', 'hypothesis', 'instrumentation', 'parallel', 'query',
+        'sampling', 'tables', 'vectorized'
+    ]
+
+    for name in lazy:
+        assert name in dir(probcalc)
+        assert getattr(probcalc, name) is sys.modules[f'probcalc.{name}']
+
+    try:
+        probcalc.nonsense  # type: ignore[attr-defined]
+    except AttributeError as e:
+        assert 'nonsense' in str(e)
+    else:
+        assert False, 'probcalc.nonsense should not exist'
@@ -0,0 +1,122 @@
+# probcalc - Calculate probabilities for distributions
+# Copyright (C) 2022 D. Dyson (DoctorDalek1963)
+
+# This program is licensed under GNU GPLv3, available here:
+# <https://www.gnu.org/licenses/gpl-3.0.html>
+
+"""A simple test module to test the counters in :mod:`probcalc.instrumentation`."""
+
+from typing import Iterator
+
+import pytest
+
+from probcalc import P, B, N, Po, instrumentation, summation, tables
+from probcalc.distributions import BinomialDistribution
+
+
+@pytest.fixture
+def instrumented() -> Iterator[None]:
+    """Enable instrumentation for one test, with empty counters and caches."""
+    tables.clear_cache()
+    instrumentation.reset()
+    instrumentation.enable()
+    yield
+    instrumentation.disable()
+    instrumentation.reset()
+
+
+def test_counters(instrumented: None) -> None:
+    """Test that calls, event shapes, cache lookups, and PMF terms are counted."""
+    X = B(20, 0.5)
+    Y = Po(3.2)
+    Z = N(0, 1)
+
+    P(4 < X <= 12)
+    P(X == 3)
+    P(Y > 2)
+    P(Y > 4)
+    P(-1 < Z < 1)
+    P.batch([X < 3, Z > 0])
+
+    stats = instrumentation.snapshot()
+    calls = stats.calls
+
+    assert calls['BinomialDistribution', 'P', 'range'].calls == 1
+    assert calls['BinomialDistribution', 'P', 'equal'].calls == 1
+    assert calls['BinomialDistribution', 'calculate', 'range'].calls == 1
+    assert calls['PoissonDistribution', 'P', 'lower'].calls == 2
+    assert calls['NormalDistribution', 'cdf', ''].calls == 2
+    assert calls['', 'P.batch', ''].calls == 1
+    assert calls['BinomialDistribution', 'calculate_many', ''].calls == 1
+    assert calls['BinomialDistribution', 'P', 'range'].seconds > 0
+
+    # One miss for each table, and then every other lookup is a hit
+    assert stats.cache_misses == {'BinomialDistribution': 1, 'PoissonDistribution': 1}
+    assert stats.cache_hits['PoissonDistribution'] >= 1
+    assert stats.pmf_terms['BinomialDistribution'] == 21
+
+    instrumentation.reset()
+    assert instrumentation.snapshot().calls == {}
+
+
+def test_pmf_sums(instrumented: None) -> None:
+    """Test that PMF terms are counted when they're summed directly, without a table."""
+    X = B(10 ** 12, 0.3)
+
+    # The table is too big to build, so the CDF uses the closed form, and this far out, the log CDF sums the tail
+    assert X.logcdf(290_000_000_000) < -1e8
+
+    stats = instrumentation.snapshot()
+    assert stats.cache_misses == {'BinomialDistribution': 1}
+    assert stats.pmf_terms['BinomialDistribution'] > 0
+
+    instrumentation.reset()
+    B(20, 0.5)._cdf_by_summation(12)
+    assert instrumentation.snapshot().pmf_terms == {'BinomialDistribution': 13}
+
+
+def test_disabled() -> None:
+    """Test that disabling instrumentation puts back the original methods."""
+    original = BinomialDistribution.cdf
+    instrumentation.enable()
+    assert instrumentation.is_enabled()
+    assert BinomialDistribution.cdf is not original
+
+    instrumentation.disable()
+    assert not instrumentation.is_enabled()
+    assert BinomialDistribution.cdf is original
+    assert tables._observer is None
+    assert summation._observer is None
+
+    P(B(20, 0.5) > 3)
+    assert instrumentation.snapshot().calls == {}
+
+
+def test_callbacks(instrumented: None) -> None:
+    """Test that callbacks see every call, with its distribution."""
+    seen: list[instrumentation.Call] = []
+    instrumentation.add_callback(seen.append)
+
+    X = B(20, 0.5)
+    X.pmf(3)
+    instrumentation.remove_callback(seen.append)
+    X.pmf(4)
+
+    assert len(seen) == 1
+    assert seen[0].distribution is X
+    assert seen[0].method == 'pmf'
+
+    with pytest.raises(ValueError):
+        instrumentation.remove_callback(seen.append)
+
+
+def test_prometheus(instrumented: None) -> None:
+    """Test the Prometheus text format."""
+    P(B(20, 0.5) > 3)
+    text = instrumentation.prometheus_text()
+
+    assert '# TYPE probcalc_calls_total counter' in text
+    assert 'probcalc_calls_total{distribution="BinomialDistribution",method="P",shape="lower"} 1\n' in text
+    assert 'probcalc_calls_total{distribution="BinomialDistribution",method="cdf"} 1\n' in text
+    assert 'probcalc_table_cache_misses_total{distribution="BinomialDistribution"} 1\n' in text
+    assert text.endswith('\n')
@@ -0,0 +1,57 @@
+# probcalc - Calculate probabilities for distributions
+# Copyright (C) 2022 D. Dyson (DoctorDalek1963)
+
+# This program is licensed under GNU GPLv3, available here:
+# <https://www.gnu.org/licenses/gpl-3.0.html>
+
+"""A simple test module to test that distributions with the same parameters share one instance."""
+
+import copy
+import pickle
+
+import pytest
+
+from probcalc import P, B, Po, N, Geo, NonsenseError
+
+
+def test_identity() -> None:
+    """Test that identical parameters give the identical distribution."""
+    assert B(20, 0.25) is B(20, 0.25)
+    assert B(20, 0.25) is B(number_of_trials=20, probability=0.25)
+    assert B(20, 0.25) is B(20, probability=0.25)
+    assert Po(3.2) is Po(3.2)
+    assert N(0, 1) is N(0, 1)
+    assert Geo(0.3) is Geo(0.3)
+
+    assert B(20, 0.25) is not B(20, 0.26)
+    assert B(10, 1) is not B(10, 1.0)
+    assert repr(B(10, 1.0)) == 'B(10, 1.0)'
+
+    # Same parameters, but different distributions
+    assert Po(0.5).parameters == Geo(0.5).parameters
+    assert hash(Po(0.5)) != hash(Geo(0.5))
+
+    assert copy.copy(B(20, 0.25)) is B(20, 0.25)
+    assert copy.deepcopy(N(2, 3)) is N(2, 3)
+    assert pickle.loads(pickle.dumps(Po(3.2))) is Po(3.2)
+
+    with pytest.raises(NonsenseError):
+        B(20, 1.25)
+
+    with pytest.raises(NonsenseError):
+        B(-1, 0.5)
+
+
+def test_parameters() -> None:
+    """Test the parameters and hashes of distributions."""
+    assert B(20, 0.25).parameters == (20, 0.25)
+    assert B(number_of_trials=20, probability=0.25).parameters == (20, 0.25)
+    assert N(1, 2).parameters == (1, 2)
+
+    assert hash(B(20, 0.25)) == hash(B(20, 0.25))
+    assert len({Po(3.2), Po(3.2), Po(3.3)}) == 2
+
+    # Interning doesn't stop comparisons from making events
+    X = B(20, 0.25)
+    assert P(B(20, 0.25) <= 5) == P(X <= 5)
+    assert P(3 < B(20, 0.25) < 8) == P(3 < X < 8)
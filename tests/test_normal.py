@@ -9,10 +9,13 @@
 All test values calculated with a Casio fx-991EX Classwiz.
 """
 
+import math
+
 import pytest
 from pytest import approx
 
 from probcalc import P, N, NonsenseError
+from probcalc.distribution_classes import Event, _Bounds
 
 
 def test_pmf() -> None:
@@ -215,3 +218,61 @@ def test_calculate() -> None:
     assert P(-2 < X < 4) == P(-2 <= X < 4) == P(-2 < X <= 4) == P(-2 <= X <= 4)
     assert P(-6.3 < Y < -0.2) == P(-6.3 <= Y < -0.2) == P(-6.3 < Y <= -0.2) == P(-6.3 <= Y <= -0.2)
     assert P(-1 < Z < 1) == P(-1 <= Z < 1) == P(-1 < Z <= 1) == P(-1 <= Z <= 1)
+
+    # Events made from bounds directly give the same probabilities as the comparisons
+    assert P((Z <= 5).with_upper((1, False))) == P(Z < 1) == P(Z <= 1) == round(Z.cdf(1), 10)
+    assert P(Event(Z, _Bounds((1, True)))) == P(Z > 1) == P(Z >= 1) == round(Z.sf(1), 10)
+    assert P.batch([Event(Z, _Bounds((-1, True), (1, False)))]) == approx([Z.cdf(1) - Z.cdf(-1)])
+
+
+def test_arrays() -> None:
+    """Test the vectorized PMF, CDF, and survival function of the normal distribution."""
+    np = pytest.importorskip('numpy')
+
+    X = N(-3.9, 1.6)
+    values = np.linspace(-12, 4, 101)
+
+    assert X.pmf_array(values) == approx([X.pmf(x) for x in values.tolist()])
+    assert X.cdf_array(values) == approx([X.cdf(x) for x in values.tolist()])
+    assert X.sf_array(values) == approx([1 - X.cdf(x) for x in values.tolist()])
+
+    assert X.sf_array([40])[0] == approx(4.897618788e-166)
+
+
+def test_quantiles() -> None:
+    """Test the PPF and inverse survival function of the normal distribution."""
+    X = N(1, 2)
+
+    assert X.ppf(0.975) == approx(4.919927969)
+    assert X.isf(0.025) == approx(4.919927969)
+    assert X.ppf(0.5) == approx(1)
+    assert X.ppf(0) == float('-inf')
+    assert X.ppf(1) == float('inf')
+    assert N(0, 1).isf(1e-300) == approx(37.0470963)
+
+    for value in [-5.5, -1, 0, 0.3, 2, 7.25]:
+        assert X.ppf(X.cdf(value)) == approx(value)
+
+    with pytest.raises(NonsenseError):
+        X.isf(-0.1)
+
+    np = pytest.importorskip('numpy')
+
+    probabilities = np.linspace(0, 1, 101)
+    assert X.ppf_array(probabilities) == approx([X.ppf(q) for q in probabilities], rel=1e-12)
+    assert X.isf_array(probabilities) == approx([X.isf(q) for q in probabilities], rel=1e-12)
+
+
+def test_logs() -> None:
+    """Test the log-space functions and survival function of the normal distribution."""
+    X = N(0, 1)
+    Y = N(10, 4)
+
+    for x in [-3, -1.5, 0, 0.4, 2.7]:
+        assert X.logcdf(x) == approx(math.log(X.cdf(x)))
+        assert X.sf(x) == approx(1 - X.cdf(x))
+        assert Y.logsf(x) == approx(math.log(Y.sf(x)))
+
+    assert X.logcdf(-40) == approx(-804.608442)
+    assert X.logsf(40) == approx(-804.608442)
+    assert X.sf(10) == approx(7.619853024e-24)
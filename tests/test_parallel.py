@@ -0,0 +1,78 @@
+# probcalc - Calculate probabilities for distributions
+# Copyright (C) 2022 D. Dyson (DoctorDalek1963)
+
+# This program is licensed under GNU GPLv3, available here:
+# <https://www.gnu.org/licenses/gpl-3.0.html>
+
+"""A simple test module to test :mod:`probcalc.parallel`."""
+
+from typing import List, Union
+
+import pytest
+
+from probcalc import P, B, Geo, N, NonsenseError, Po, parallel
+from probcalc.distribution_classes import Distribution, Event
+
+
+def make_events() -> List[Union[Event, Distribution]]:
+    """Make a mix of events of every shape, for several distributions."""
+    X = B(50, 0.3)
+    Y = Po(4.5)
+    Z = N(10, 2)
+    G = Geo(0.2)
+
+    events: List[Union[Event, Distribution]] = []
+    for a in range(0, 40, 3):
+        # Y > a // 2 and Y <= a // 3 would be one chained comparison if they were next to each other
+        events.extend([a < X <= a + 7, X == a, X != a, Y > a // 2, G >= a // 4 + 1, Y <= a // 3])
+        events.append(a / 4 < Z < a / 2 + 1)
+
+    events.append(X)
+    return events
+
+
+@pytest.mark.parametrize('processes', [False, True])
+def test_matches_serial(processes: bool) -> None:
+    """Test that parallel results are exactly the same as calling P() on each event."""
+    events = make_events()
+    expected = [P(event) for event in events]
+
+    with parallel.BatchEvaluator(2, processes=processes, chunk_size=7) as evaluator:
+        assert list(evaluator.map(events)) == expected
+        assert list(evaluator.map(iter(events))) == expected
+
+        unordered = list(evaluator.map_unordered(events))
+        assert sorted(index for index, _ in unordered) == list(range(len(events)))
+        assert [probability for _, probability in sorted(unordered)] == expected
+
+    assert parallel.evaluate(events, 2, processes=processes) == expected
+
+
+def test_sig_figs() -> None:
+    """Test that results are rounded like the calculator rounds them."""
+    X = B(50, 0.3)
+    events = [X < a for a in range(1, 40)]
+
+    P.set_sig_figs(4)
+    try:
+        expected = [P(event) for event in events]
+        assert parallel.evaluate(events, 2, processes=False) == expected
+    finally:
+        P.set_sig_figs(10)
+
+
+def test_errors() -> None:
+    """Test that invalid events and invalid arguments raise errors."""
+    X = B(20, 0.5)
+
+    with pytest.raises(NonsenseError):
+        parallel.evaluate([X < 3, 5], 2, processes=False)  # type: ignore[list-item]
+
+    with pytest.raises(NonsenseError):
+        parallel.evaluate([X < 3, X <= 25], 2, processes=True)
+
+    with pytest.raises(ValueError):
+        parallel.BatchEvaluator(0)
+
+    with pytest.raises(ValueError):
+        parallel.BatchEvaluator(2, chunk_size=0)
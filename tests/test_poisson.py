@@ -9,6 +9,8 @@
 All test values calculated with a Casio fx-991EX Classwiz.
 """
 
+import math
+
 import pytest
 from pytest import approx
 
@@ -176,3 +178,112 @@ def test_calculate() -> None:
 
     with pytest.raises(NonsenseError):
         P(X != 3 > 10)
+
+
+def test_sf() -> None:
+    """Test the Poisson distribution survival function."""
+    X = Po(2)
+    Y = Po(12.3)
+
+    for k in range(30):
+        assert X.sf(k) == approx(1 - X.cdf(k))
+        assert Y.sf(k) == approx(1 - Y.cdf(k))
+
+    assert Po(0).sf(0) == 0
+    assert Po(1).sf(100) == approx(sum(Po(1).pmf(x) for x in range(101, 120)))
+
+    for num in [-1, 12.5]:
+        with pytest.raises(NonsenseError):
+            X.sf(num, strict=True)  # type: ignore[arg-type]
+
+
+def test_large_cdf() -> None:
+    """Test the incomplete gamma CDF against summing the PMF for large rates."""
+    for rate in [0.1, 5, 300, 5000]:
+        X = Po(rate)
+        total = 0.0
+
+        for k in range(int(3 * rate) + 20):
+            total += X.pmf(k)
+            if total > 1e-300:
+                assert X.cdf(k) == approx(total, rel=1e-9)
+                assert X.cdf(k) + X.sf(k) == approx(1)
+
+    Y = Po(250_000)
+    assert Y.cdf(250_500) == approx(0.8415864750, rel=1e-8)
+    assert Y.sf(250_500) == approx(0.1584135250, rel=1e-8)
+
+
+def test_arrays() -> None:
+    """Test the vectorized PMF, CDF, and survival function of the Poisson distribution."""
+    np = pytest.importorskip('numpy')
+
+    X = Po(12.3)
+    Y = Po(0)
+    values = np.arange(60)
+
+    assert X.pmf_array(values) == approx([X.pmf(x) for x in range(60)])
+    assert X.cdf_array(values) == approx([X.cdf(x) for x in range(60)])
+    assert X.sf_array(values) == approx([X.sf(x) for x in range(60)])
+
+    assert list(Y.pmf_array([0, 1, 2])) == [1, 0, 0]
+    assert list(Y.cdf_array([0, 1, 2])) == [1, 1, 1]
+
+    with pytest.raises(NonsenseError):
+        X.pmf_array([1, -2])
+
+    assert list(X.cdf_array([-1, 2.5, 3], strict=False)) == approx([0, 0, X.cdf(3)])
+
+
+def test_quantiles() -> None:
+    """Test the PPF and inverse survival function of the Poisson distribution."""
+    X = Po(12.3)
+    Y = Po(1e8)
+
+    assert X.ppf(0) == 0
+    assert X.ppf(0.5) == 12
+    assert X.ppf(0.95) == 18
+    assert X.ppf(1) == float('inf')
+    assert X.isf(0.05) == 18
+    assert X.isf(0) == float('inf')
+    assert X.isf(1) == 0
+    assert Po(0).ppf(0.5) == 0
+
+    for q in [1e-12, 0.003, 0.2, 0.5, 0.99, 1 - 1e-9]:
+        k = X.ppf(q)
+        assert X.cdf(k) >= q and (k == 0 or X.cdf(k - 1) < q)  # type: ignore[arg-type]
+
+        k = X.isf(q)
+        assert X.sf(k) <= q and (k == 0 or X.sf(k - 1) > q)  # type: ignore[arg-type]
+
+    for q in [1e-300, 1e-50, 0.5, 0.999]:
+        k = Y.ppf(q)
+        assert Y.cdf(k) >= q and Y.cdf(k - 1) < q  # type: ignore[arg-type]
+
+        k = Y.isf(q)
+        assert Y.sf(k) <= q and Y.sf(k - 1) > q  # type: ignore[arg-type]
+
+    with pytest.raises(NonsenseError):
+        X.isf(1.01)
+
+    np = pytest.importorskip('numpy')
+
+    probabilities = np.concatenate([np.linspace(0, 1, 101), [1e-20, 1e-300]])
+    assert list(X.ppf_array(probabilities)) == [X.ppf(q) for q in probabilities]
+    assert list(X.isf_array(probabilities)) == [X.isf(q) for q in probabilities]
+
+
+def test_logs() -> None:
+    """Test the log-space functions and survival function of the Poisson distribution."""
+    X = Po(3.2)
+    Y = Po(100)
+
+    for k in range(20):
+        assert X.logpmf(k) == approx(math.log(X.pmf(k)))
+        assert X.sf(k) == approx(1 - X.cdf(k), abs=1e-12)
+
+    assert Y.logcdf(5) == approx(-81.71088951, rel=1e-9)
+    assert Y.logsf(400) == approx(-259.5356608, rel=1e-9)
+
+    assert Po(0).pmf(0) == 1
+    assert Po(0).logpmf(2) == float('-inf')
@@ -0,0 +1,77 @@
+# probcalc - Calculate probabilities for distributions
+# Copyright (C) 2022 D. Dyson (DoctorDalek1963)
+
+# This program is licensed under GNU GPLv3, available here:
+# <https://www.gnu.org/licenses/gpl-3.0.html>
+
+"""A simple test module to test prepared queries in :mod:`probcalc.query`."""
+
+import pytest
+
+from probcalc import P, B, Geo, N, NonsenseError, Po, query
+
+
+def test_prepare() -> None:
+    """Test that queries are parsed once, into the right parameters, and cached."""
+    bucket = query.prepare('P(a < B(n, p) <= b)')
+    assert bucket is query.prepare('P(a < B(n, p) <= b)')
+    assert bucket.parameters == ('a', 'n', 'p', 'b')
+    assert query.prepare('B(n,p) > a').parameters == ('n', 'p', 'a')
+    assert query.prepare('-1.96 <= N(0, 1) <= z').parameters == ('z',)
+    assert query.prepare('Po(5)').parameters == ()
+
+    for source in ['B(n, p) < ', 'B(n, p) < -a', 'P(a < B(n, p) <= b', 'foo(1) < 3', 'B(n, p) < 3 $',
+                   'P(B(n, p)) x', '3 < 4', 'B() < 3', 'P(B(n, p) == a < 3)', '']:
+        with pytest.raises(query.QuerySyntaxError):
+            query.prepare(source)
+
+    for source in ['P(3 < B(n, p) > 4)', 'P(a == B(n, p) <= b)', 'b > B(n, p) < 3']:
+        with pytest.raises(NonsenseError):
+            query.prepare(source)
+
+
+def test_run() -> None:
+    """Test that running a prepared query gives the same events and probabilities as writing them in Python."""
+    bucket = query.prepare('P(a < B(n, p) <= b)')
+    assert bucket.event(a=4, n=20, p=0.5, b=12) == (4 < B(20, 0.5) <= 12)
+    assert bucket(a=4, n=20, p=0.5, b=12) == P(4 < B(20, 0.5) <= 12)
+
+    assert query.prepare('B(n, p) > a').event(a=6, n=20, p=0.5) == (B(20, 0.5) > 6)
+    assert query.prepare('x >= Po(rate)')(x=3, rate=5) == P(Po(5) <= 3)
+    assert query.prepare('-1.96 <= N(0, 1) < z')(z=1.96) == P(-1.96 <= N(0, 1) < 1.96)
+    assert query.prepare('P(Geo(p) != k)')(p=0.2, k=3) == P(Geo(0.2) != 3)
+    assert query.prepare('N(m, s) == x').event(m=0, s=1, x=1.5) == (N(0, 1) == 1.5)
+    assert query.prepare('P(N(m, s) < b)')(m=0, s=1, b=1) == P(N(0, 1) < 1) == 0.8413447461
+    assert query.prepare('P(N(m, s) > b)')(m=0, s=1, b=1) == P(N(0, 1) > 1) == 0.1586552539
+    assert query.prepare('P(N(m, s) >= b)')(m=0, s=1, b=1) == P(N(0, 1) >= 1) == 0.1586552539
+    assert query.prepare('Po(5)')() == 1.0
+
+    # Running one query never affects the next
+    X = B(20, 0.5)
+    query.prepare('B(n, p) > a')(a=6, n=20, p=0.5)
+    assert (X <= 12) == query.prepare('B(20, 0.5) <= 12').event()
+
+    P.set_sig_figs(3)
+    assert bucket(a=4, n=20, p=0.5, b=12) == 0.863
+    P.set_sig_figs(10)
+
+    bindings = [{'a': a, 'n': 20, 'p': 0.5, 'b': a + 5} for a in range(0, 20, 5)]
+    assert bucket.many(bindings) == P.batch([a < X <= a + 5 for a in range(0, 20, 5)])
+
+    with pytest.raises(TypeError):
+        bucket(a=4, n=20, p=0.5)
+
+    with pytest.raises(TypeError):
+        bucket(a=4, n=20, p=0.5, b=12, c=1)
+
+    with pytest.raises(NonsenseError):
+        bucket(a=4, n=20, p=0.5, b=1.5)
+
+    with pytest.raises(NonsenseError):
+        bucket(a=14, n=20, p=0.5, b=12)
+
+    with pytest.raises(NonsenseError):
+        bucket(a=4, n=20, p=1.5, b=12)
+
+    with pytest.raises(NonsenseError):
+        bucket(a=4, n=20, p=0.5, b=25)
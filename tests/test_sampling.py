@@ -0,0 +1,81 @@
+# probcalc - Calculate probabilities for distributions
+# Copyright (C) 2022 D. Dyson (DoctorDalek1963)
+
+# This program is licensed under GNU GPLv3, available here:
+# <https://www.gnu.org/licenses/gpl-3.0.html>
+
+"""A simple test module to test random variate generation with ``rvs()`` and :mod:`probcalc.sampling`."""
+
+import pytest
+from pytest import approx
+
+from probcalc import B, Geo, N, NonsenseError, Po
+
+np = pytest.importorskip('numpy')
+
+from probcalc import sampling  # noqa: E402
+
+
+def test_moments() -> None:
+    """Test that the variates of each distribution have roughly the right mean and variance."""
+    for distribution, mean, variance in [
+        (B(20, 0.25), 5, 3.75),
+        (B(10 ** 6, 0.3), 300000, 210000),
+        (Po(3.5), 3.5, 3.5),
+        (Po(1e4), 1e4, 1e4),
+        (N(-3.9, 1.6), -3.9, 2.56),
+        (Geo(0.2), 5, 20),
+        (Geo(1e-4), 1e4, (1 - 1e-4) / 1e-8)
+    ]:
+        samples = distribution.rvs(200000, seed=42)
+
+        assert samples.shape == (200000,)
+        assert samples.mean() == approx(mean, rel=0.02, abs=0.02)
+        assert samples.var() == approx(variance, rel=0.05)
+
+
+def test_types() -> None:
+    """Test the shape and dtype of the variates, and that they're in the support of each distribution."""
+    assert B(20, 0.25).rvs((3, 4), seed=1).shape == (3, 4)
+    assert B(20, 0.25).rvs(10, seed=1).dtype == np.int64
+    assert Po(12.3).rvs(10, seed=1).dtype == np.int64
+    assert Geo(0.3).rvs(10, seed=1).dtype == np.int64
+    assert N(0, 1).rvs(10, seed=1).dtype == np.float64
+
+    assert set(B(5, 0.5).rvs(1000, seed=1).tolist()) <= set(range(6))
+    assert Geo(0.9).rvs(1000, seed=1).min() >= 1
+    assert list(Geo(1).rvs(3, seed=1)) == [1, 1, 1]
+    assert list(B(10, 1).rvs(3, seed=1)) == [10, 10, 10]
+    assert list(Po(0).rvs(3, seed=1)) == [0, 0, 0]
+
+    with pytest.raises(NonsenseError):
+        Geo(0).rvs(3)
+
+
+def test_geometric_distribution() -> None:
+    """Test that the frequencies of geometric variates match the PMF."""
+    X = Geo(0.3)
+    samples = X.rvs(100000, seed=7)
+
+    for trial in range(1, 8):
+        assert np.mean(samples == trial) == approx(X.pmf(trial), abs=0.005)
+
+
+def test_seeds() -> None:
+    """Test that seeds are reproducible and that spawned generators are independent."""
+    X = Po(12.3)
+
+    assert list(X.rvs(100, seed=1234)) == list(X.rvs(100, seed=1234))
+    assert list(X.rvs(100, seed=1234)) != list(X.rvs(100, seed=1235))
+
+    rng = np.random.default_rng(99)
+    first = X.rvs(50, seed=rng)
+    second = X.rvs(50, seed=rng)
+    assert list(first) != list(second)
+
+    workers = sampling.spawn(1234, 4)
+    streams = [list(N(0, 1).rvs(100, seed=worker)) for worker in workers]
+    assert len({tuple(stream) for stream in streams}) == 4
+
+    again = [list(N(0, 1).rvs(100, seed=worker)) for worker in sampling.spawn(1234, 4)]
+    assert streams == again
@@ -26,7 +26,7 @@ def test_sig_figs() -> None:
     assert str(P(Y < 5)) == '0.006157526342'
     assert str(P(2 <= Y < 6)) == '0.01677578152'
 
-    assert str(P(Z > 10)) == '0.0'
+    assert str(P(Z > 10)) == '1.852512097e-18'
     assert str(P(Z < 5)) == '0.9999999867'
     assert str(P(2 <= Z < 6)) == '0.0001132337412'
 
@@ -40,7 +40,7 @@ def test_sig_figs() -> None:
     assert str(P(Y < 5)) == '0.00615753'
     assert str(P(2 <= Y < 6)) == '0.0167758'
 
-    assert str(P(Z > 10)) == '0.0'
+    assert str(P(Z > 10)) == '1.85251e-18'
     assert str(P(Z < 5)) == '1.0'
     assert str(P(2 <= Z < 6)) == '0.000113234'
 
@@ -54,6 +54,6 @@ def test_sig_figs() -> None:
     assert str(P(Y < 5)) == '0.006158'
     assert str(P(2 <= Y < 6)) == '0.01678'
 
-    assert str(P(Z > 10)) == '0.0'
+    assert str(P(Z > 10)) == '1.853e-18'
     assert str(P(Z < 5)) == '1.0'
     assert str(P(2 <= Z < 6)) == '0.0001132'
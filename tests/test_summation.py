@@ -0,0 +1,77 @@
+# probcalc - Calculate probabilities for distributions
+# Copyright (C) 2022 D. Dyson (DoctorDalek1963)
+
+# This program is licensed under GNU GPLv3, available here:
+# <https://www.gnu.org/licenses/gpl-3.0.html>
+
+"""A simple test module to test the summation engine in :mod:`probcalc.summation`."""
+
+import pytest
+from pytest import approx
+
+from probcalc import B, Geo, Po, summation
+
+
+def test_neumaier_sum() -> None:
+    """Test that compensated summation keeps the low-order bits that naive summation loses."""
+    total = summation.NeumaierSum()
+    for value in [1.0, 1e100, 1.0, -1e100]:
+        total.add(value)
+
+    assert total.value == 2.0
+
+    total = summation.NeumaierSum(1.0)
+    for _ in range(10 ** 5):
+        total.add(1e-16)
+
+    assert total.value == 1.00000000001
+
+
+def test_sum_pmf() -> None:
+    """Test that summing outwards from the mode agrees with the closed forms."""
+    X = B(1000, 0.3)
+    Y = Po(250)
+    Z = Geo(0.3)
+
+    for k in range(200, 400, 13):
+        assert X._sum_pmf(0, k) == approx(X.cdf(k), rel=1e-12)
+        assert X._sum_pmf(k + 1, None) == approx(X.sf(k), rel=1e-12)
+        assert X._cdf_by_summation(k) == approx(X.cdf(k), rel=1e-12)
+
+    for k in range(150, 400, 13):
+        assert Y._sum_pmf(0, k) == approx(Y.cdf(k), rel=1e-12)
+        assert Y._sum_pmf(k + 1, None) == approx(Y.sf(k), rel=1e-12)
+
+    assert Y._sum_pmf(240, 260) == approx(sum(Y.pmf(k) for k in range(240, 261)), rel=1e-14)
+    assert Y._sum_pmf(260, 240) == 0
+
+    for k in range(1, 30):
+        assert Z._sum_pmf(k + 1, None) == approx(Z.sf(k), rel=1e-12)
+
+    # Distributions without a recurrence add up every value
+    W = Geo(0.2) + Geo(0.3)
+    assert W._sum_pmf(2, 10) == approx(W.cdf(10), rel=1e-14)
+
+    with pytest.raises(ValueError):
+        W._sum_pmf(2, None)
+
+
+def test_stopping() -> None:
+    """Test that the sum stops once the rest of each tail is negligible."""
+    X = Po(1000)
+    mode, ratio = X._pmf_recurrence()  # type: ignore[misc]
+    calls = []
+
+    def counted(k: int) -> float:
+        calls.append(k)
+        return ratio(k)
+
+    assert summation.sum_pmf(X.pmf, 0, None, mode=mode, ratio=counted) == approx(1, rel=1e-12)
+    assert min(calls) > 600
+    assert max(calls) < 1400
+
+    default_calls = len(calls)
+    calls.clear()
+
+    assert summation.sum_pmf(X.pmf, 0, None, mode=mode, ratio=counted, tolerance=1e-6) == approx(1, rel=1e-5)
+    assert len(calls) < default_calls * 0.75
@@ -0,0 +1,119 @@
+# probcalc - Calculate probabilities for distributions
+# Copyright (C) 2022 D. Dyson (DoctorDalek1963)
+
+# This program is licensed under GNU GPLv3, available here:
+# <https://www.gnu.org/licenses/gpl-3.0.html>
+
+"""A simple test module to test sums of independent distributions, and :mod:`probcalc.convolution`."""
+
+import math
+import pickle
+
+import numpy as np
+import pytest
+from pytest import approx
+
+from probcalc import P, B, Geo, N, NonsenseError, Po, convolution
+from probcalc.distributions import SumDistribution, sum_iid
+
+
+def test_closed_forms() -> None:
+    """Test that sums with closed forms give distributions of the same kind."""
+    assert Po(3) + Po(5) is Po(8)
+    assert B(10, 0.5) + B(20, 0.5) is B(30, 0.5)
+    assert N(1, 3) + N(2, 4) is N(3, 5.0)
+
+    assert sum([Po(1), Po(2), Po(3)]) is Po(6)
+    assert sum_iid(Po(3), 10) is Po(30)
+    assert sum_iid(B(5, 0.3), 4) is B(20, 0.3)
+    assert sum_iid(N(1, 1), 4) is N(4, 2.0)
+    assert sum_iid(Geo(0.2), 1) is Geo(0.2)
+
+    # The closed forms are found inside bigger sums too
+    assert Po(1) + Geo(0.5) + Po(2) is Geo(0.5) + Po(3)
+    assert (Po(1) + Geo(0.5)).terms == ((Geo(0.5), 1), (Po(1), 1))
+
+
+def test_convolution() -> None:
+    """Test that sums without closed forms agree with direct sums of the PMFs."""
+    X = Geo(0.2) + Geo(0.3)
+
+    assert isinstance(X, SumDistribution)
+    assert repr(X) == 'Geo(0.2) + Geo(0.3)'
+    assert X is Geo(0.3) + Geo(0.2)
+    assert X is sum([Geo(0.2), Geo(0.3)])
+    assert X + 0 is X
+    assert sum([X]) is X
+    assert pickle.loads(pickle.dumps(X)) is X
+
+    for k in range(2, 40):
+        expected = sum(Geo(0.2).pmf(i) * Geo(0.3).pmf(k - i) for i in range(1, k))
+        assert X.pmf(k) == approx(expected, rel=1e-9)
+
+    assert P(X <= 5) == P(2 <= X <= 5) == round(sum(X.pmf(k) for k in range(2, 6)), 10)
+    assert X.ppf(0) == X.isf(1) == 2
+    assert X.ppf(1) == X.isf(0) == math.inf
+
+    Y = B(10, 0.3) + B(5, 0.6)
+
+    assert Y.cdf(15) == approx(1)
+    assert Y.sf(7) == approx(sum(Y.pmf(k) for k in range(8, 16)))
+    assert Y.ppf(1) == 15
+
+
+def test_iid_sums() -> None:
+    """Test that repeated squaring agrees with the negative binomial distribution, which is a sum of geometrics."""
+    n = 100
+    p = 0.5
+    X = sum_iid(Geo(p), n)
+
+    assert repr(X) == 'sum_iid(Geo(0.5), 100)'
+    assert X is sum_iid(Geo(p), 60) + sum_iid(Geo(p), 40)
+
+    for k in range(150, 300, 10):
+        expected = math.exp(math.lgamma(k) - math.lgamma(n) - math.lgamma(k - n + 1) + k * math.log(p))
+        assert X.pmf(k) == approx(expected, rel=1e-9)
+
+    assert X.ppf(0.25) == min(k for k in range(n, 300) if sum(X.pmf(i) for i in range(n, k + 1)) >= 0.25)
+
+
+def test_fft() -> None:
+    """Test that long windows convolved with an FFT agree with direct convolution."""
+    X = B(10000, 0.3) + B(20000, 0.7)
+
+    a = B(10000, 0.3).pmf_array(np.arange(10001))
+    b = B(20000, 0.7).pmf_array(np.arange(20001))
+    expected = np.convolve(a, b)
+
+    k = np.arange(16500, 17500)
+    assert X.pmf_array(k) == approx(expected[k], rel=1e-6)
+    assert X.cdf_array(k) == approx(np.cumsum(expected)[k], rel=1e-6)
+    assert X.cdf_array([0, 30000]).tolist() == [0, 1]
+
+    e1 = P._as_event(X > 17100)
+    e2 = P._as_event(16900 < X <= 17100)
+    assert P.batch([e1, e2]) == [P(e1), P(e2)]
+
+    # Without NumPy, windows are convolved directly in pure Python
+    assert convolution._direct([0.5, 0.5], [0.25, 0.75]) == list(np.convolve([0.5, 0.5], [0.25, 0.75]))
+
+
+def test_nonsense() -> None:
+    """Test that nonsense sums and values raise errors."""
+    with pytest.raises(TypeError):
+        N(0, 1) + Po(3)
+
+    with pytest.raises(TypeError):
+        Po(3) + 1.5
+
+    with pytest.raises(NonsenseError):
+        sum_iid(Po(3), 0)
+
+    with pytest.raises(NonsenseError):
+        Geo(0) + Geo(0.5)
+
+    with pytest.raises(NonsenseError):
+        P(B(10, 0.5) + B(5, 0.3) == 16)
+
+    with pytest.raises(NonsenseError):
+        P(Geo(0.5) + Geo(0.3) == 1)
@@ -0,0 +1,127 @@
+# probcalc - Calculate probabilities for distributions
+# Copyright (C) 2022 D. Dyson (DoctorDalek1963)
+
+# This program is licensed under GNU GPLv3, available here:
+# <https://www.gnu.org/licenses/gpl-3.0.html>
+
+"""A simple test module to test the cached PMF tables in :mod:`probcalc.tables`."""
+
+from pathlib import Path
+
+import pytest
+from pytest import approx
+
+from probcalc import B, N, Po, tables
+from probcalc.utility import regularized_lower_gamma, regularized_upper_gamma
+
+
+def test_lookups() -> None:
+    """Test that table lookups agree with the closed form CDFs."""
+    tables.clear_cache()
+
+    X = B(5000, 0.2)
+    Y = Po(4000)
+
+    for k in range(900, 1100, 7):
+        assert X.cdf(k) == approx(X._closed_form_cdf(k), rel=1e-9)
+        assert X.sf(k) == approx(X._closed_form_sf(k), rel=1e-9)
+
+    for k in range(3800, 4200, 11):
+        assert Y.cdf(k) == approx(regularized_upper_gamma(k + 1, 4000), rel=1e-9)
+        assert Y.sf(k) == approx(regularized_lower_gamma(k + 1, 4000), rel=1e-9)
+
+    table = X._pmf_table()
+    assert table is not None
+    assert 1000 in table
+    assert 0 not in table
+    assert table.pmf(1000) == approx(X.pmf(1000))
+
+    info = tables.cache_info()
+    assert info.entries == 2
+    assert info.misses == 2
+    assert info.hits > 50
+
+
+def test_eviction() -> None:
+    """Test that the least recently used tables get evicted to stay inside the memory budget."""
+    tables.clear_cache()
+
+    try:
+        tables.set_memory_budget(200_000)
+
+        for n in range(1000, 1100):
+            B(n, 0.5).cdf(n // 2)
+
+        info = tables.cache_info()
+        assert info.nbytes <= 200_000
+        assert 0 < info.entries < 100
+
+        # The most recent table should still be cached
+        B(1099, 0.5).cdf(500)
+        assert tables.cache_info().hits == 1
+
+        # A table bigger than a quarter of the budget just doesn't get cached
+        assert B(10 ** 7, 0.5)._pmf_table() is None
+        assert B(10 ** 7, 0.5).cdf(5 * 10 ** 6) == approx(0.5, rel=1e-3)
+
+        with pytest.raises(ValueError):
+            tables.set_memory_budget(-1)
+
+    finally:
+        tables.set_memory_budget(tables.DEFAULT_BUDGET)
+        tables.clear_cache()
+
+
+def test_saved_tables(tmp_path: Path) -> None:
+    """Test that tables saved to files and mapped back in give exactly the same results."""
+    tables.clear_cache()
+
+    X = B(10 ** 5, 0.3)
+    Y = Po(5000)
+    values = [29000, 29990, 30000, 30100, 31000, 0, 10 ** 5 - 1]
+    expected = [(X.cdf(k), X.sf(k), X.pmf(k)) for k in values] + [(X.ppf(0.2), X.isf(0.2), Y.cdf(5050))]
+
+    tables.save_table(X, tmp_path / 'x.table')
+    tables.save_table(Y, tmp_path / 'y.table')
+    tables.clear_cache()
+
+    try:
+        assert tables.load_table(tmp_path / 'x.table', X) == ('BinomialDistribution', 10 ** 5, 0.3)
+        assert tables.load_table(tmp_path / 'y.table') == ('PoissonDistribution', 5000)
+
+        assert tables.is_cached(X._table_key())
+        assert [(X.cdf(k), X.sf(k), X.pmf(k)) for k in values] + [(X.ppf(0.2), X.isf(0.2), Y.cdf(5050))] == expected
+
+        # Mapped tables aren't built, counted in the memory budget, or cleared with the cache
+        info = tables.cache_info()
+        assert info.misses == 0
+        assert info.nbytes == 0
+
+        tables.clear_cache()
+        assert tables.is_cached(Y._table_key())
+
+        tables.unload_tables()
+        assert not tables.is_cached(Y._table_key())
+
+        with pytest.raises(ValueError):
+            tables.load_table(tmp_path / 'y.table', X)
+
+        with pytest.raises(ValueError):
+            tables.save_table(N(0, 1), tmp_path / 'z.table')
+
+        data = (tmp_path / 'x.table').read_bytes()
+        broken = {
+            'magic.table': b'NOTATABL' + data[8:],
+            'hash.table': data.replace(b'"BinomialDistribution", 100000', b'"BinomialDistribution", 100001'),
+            'size.table': data[:-8]
+        }
+
+        for name, contents in broken.items():
+            (tmp_path / name).write_bytes(contents)
+
+            with pytest.raises(ValueError):
+                tables.load_table(tmp_path / name)
+
+    finally:
+        tables.unload_tables()
+        tables.clear_cache()